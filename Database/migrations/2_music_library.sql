@@ -0,0 +1,14 @@
+-- Índice persistente das pastas de músicas (ver models/MusicLibrary.py).
+-- Idempotente: o modelo reaplica este script em bancos criados antes dele.
+CREATE TABLE IF NOT EXISTS music_library (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	root TEXT NOT NULL,
+	folder TEXT NOT NULL,
+	mtime_ns INTEGER NOT NULL,
+	csv_path TEXT,
+	mp3_path TEXT,
+	valid INTEGER NOT NULL DEFAULT 0,
+	error TEXT,
+	scanned_at TEXT NOT NULL,
+	UNIQUE (root, folder)
+);
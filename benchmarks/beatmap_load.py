@@ -0,0 +1,62 @@
+"""Tempo de carregamento do beatmap: CSV completo contra o arquivo compilado.
+
+Gera um CSV sintético em um diretório temporário, mede o parsing do CSV (o
+caminho antigo de ``_load_beatmap``), a primeira carga (compila e grava o cache)
+e as cargas seguintes (apenas mapeiam o arquivo compilado).
+
+Uso::
+
+    python -m benchmarks.beatmap_load
+    python -m benchmarks.beatmap_load --sizes 1000 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from engine.beatmap import NOTE_TYPES, load_beatmap, parse_csv
+
+
+def _write_chart(path: Path, size: int) -> None:
+    rng = random.Random(size)
+    with open(path, "w") as file:
+        file.write("time,note\n")
+        for _ in range(size):
+            file.write(f"{rng.uniform(0.0, size / 8):.4f},{rng.choice(NOTE_TYPES)}\n")
+
+
+def _best_of(repeat: int, action) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'notas':>8} | {'CSV (ms)':>10} | {'compilar (ms)':>14} | {'mapeado (ms)':>13}")
+    print("-" * 56)
+    with tempfile.TemporaryDirectory() as folder:
+        for size in args.sizes:
+            csv_path = Path(folder) / f"map_{size}.csv"
+            _write_chart(csv_path, size)
+            csv_ms = _best_of(args.repeat, lambda: parse_csv(csv_path)) * 1e3
+            began = time.perf_counter()
+            load_beatmap(csv_path, cache_dir=folder)
+            compile_ms = (time.perf_counter() - began) * 1e3
+            mapped_ms = _best_of(args.repeat, lambda: load_beatmap(csv_path, cache_dir=folder)) * 1e3
+            print(f"{size:>8} | {csv_ms:>10.2f} | {compile_ms:>14.2f} | {mapped_ms:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
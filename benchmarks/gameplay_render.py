@@ -0,0 +1,77 @@
+"""Custo fixo de renderização por frame da ``GameplayScene``.
+
+Mede, sem janela (drivers ``dummy`` do SDL), o custo de redesenhar as partes
+estáticas da cena (fundo, lane, brilho da hit area e legenda, como acontecia a
+cada frame antes da ``StaticLayer``), o ``blit`` da camada já composta e o frame
+completo com algumas notas na tela.
+
+Uso::
+
+    python -m benchmarks.gameplay_render
+    python -m benchmarks.gameplay_render --size 1920 1080 --frames 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from engine.beatmap import CACHE_DIR_ENV  # noqa: E402
+
+
+def _per_frame_us(frames: int, action) -> float:
+    began = time.perf_counter()
+    for _ in range(frames):
+        action()
+    return (time.perf_counter() - began) / frames * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, nargs=2, default=[800, 600], metavar=("LARGURA", "ALTURA"))
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(tuple(args.size))
+
+    from scenes.gameplay import GameplayScene
+
+    with tempfile.TemporaryDirectory() as folder:
+        # O chart temporário não deixa compilado no cache/ do projeto
+        os.environ.setdefault(CACHE_DIR_ENV, str(Path(folder) / "beatmaps"))
+        csv_path = Path(folder) / "map.csv"
+        csv_path.write_text("time,note\n" + "".join(f"{i * 0.25:.2f},{'gamf'[i % 4]}\n" for i in range(64)))
+        song = SimpleNamespace(title="bench", csv_path=str(csv_path), mp3_path=str(Path(folder) / "audio.mp3"))
+        scene = GameplayScene(SimpleNamespace(screen=screen, dirty_rects=False), song)
+
+    # Coloca notas na lane sem depender do relógio real
+    for index in range(len(scene.scheduler)):
+        if scene.scheduler.spawn_time(index) > 1.5:
+            break
+        scene.spawn_note(index)
+
+    scratch = pygame.Surface(screen.get_size())
+    static_us = _per_frame_us(args.frames, lambda: scene._build_static_layer(scratch))
+    blit_us = _per_frame_us(args.frames, lambda: scene.static_layer.blit(screen, scene._static_layer_key()))
+    frame_us = _per_frame_us(args.frames, lambda: scene._render_frame(screen))
+
+    print(f"Resolução {args.size[0]}x{args.size[1]}, {len(scene.live_notes)} notas na tela")
+    print(f"  partes estáticas redesenhadas (antes): {static_us:9.1f} µs/frame")
+    print(f"  camada estática em cache (blit):       {blit_us:9.1f} µs/frame")
+    print(f"  frame completo com cache:              {frame_us:9.1f} µs/frame")
+    print(f"  reconstruções da camada:               {scene.static_layer.rebuilds}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""Simulador headless e determinístico da ``GameplayScene``.
+
+Roda uma partida inteira sem janela nem áudio (drivers ``dummy`` do SDL), tão
+rápido quanto a CPU permite: o ``GameApp`` avança com tempos de frame virtuais,
+a timeline da música lê um relógio virtual e as teclas vêm de um roteiro gerado
+a partir do próprio chart. Para cada chart sintético o resultado traz o tempo
+real gasto por frame em cada fase (eventos, update e render) como JSON.
+
+Como tudo depende apenas do relógio virtual, duas execuções do mesmo chart
+produzem a mesma sequência de ticks e a mesma pontuação; só os tempos medidos
+variam. ``--budget-ms`` faz o processo terminar com erro quando o p95 do frame
+passa do limite, para uso em CI.
+
+Com ``--replay``, as teclas vêm de replays gravados por partidas reais
+(``engine.replay``): a partida é reproduzida pelo mesmo código de julgamento e o
+placar é comparado ao do replay e, com ``--database``, ao salvo em ``plays``.
+
+Uso::
+
+    python -m benchmarks.headless
+    python -m benchmarks.headless --sizes 1000 10000 100000 --output headless.json
+    python -m benchmarks.headless --sizes 10000 --frame-rate 144 --budget-ms 4
+    python -m benchmarks.headless --replay replays/*/*.replay --database Database/app.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Iterable, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# O JSON sai no stdout; o banner do pygame não pode se misturar a ele
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from engine.beatmap import CACHE_DIR_ENV, NOTE_TYPES  # noqa: E402
+from engine.replay import REPLAY_SUFFIX, Replay, ReplayInput  # noqa: E402
+
+MUSICS_DIR = Path(__file__).resolve().parents[1] / "musics"
+
+PHASES = ("events", "update", "render")
+
+# Teclas que o jogador aperta para cada tipo de nota (ver GameplayScene.handle_event)
+NOTE_KEYS = {
+    "g": (pygame.K_z,),
+    "a": (pygame.K_a,),
+    "m": (pygame.K_SPACE,),
+    "f": (pygame.K_a, pygame.K_SPACE),
+}
+
+
+class VirtualClock:
+    """Relógio monotônico controlado pelo simulador (substitui ``time.perf_counter``)."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.time = start
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float) -> None:
+        self.time += seconds
+
+
+class ScriptedInput:
+    """Roteiro de eventos de teclado datados no relógio da música.
+
+    ``due(song_time)`` devolve os eventos vencidos já como ``pygame.event.Event``;
+    o estado das teclas é atualizado para todo o lote antes do despacho, como o
+    SDL faz ao bombear a fila, e fica disponível por indexação (``script[key]``)
+    para substituir ``pygame.key.get_pressed``.
+    """
+
+    def __init__(self, events: Iterable[tuple[float, int, int]]) -> None:
+        self._events = sorted(events, key=lambda item: item[0])
+        self._cursor = 0
+        self.pressed: set[int] = set()
+
+    @classmethod
+    def from_chart(
+        cls,
+        hit_times,
+        note_types,
+        *,
+        hold: float = 0.03,
+        jitter_ms: float = 0.0,
+        seed: int = 0,
+    ) -> "ScriptedInput":
+        """Aperta as teclas de cada nota no seu ``hit_time`` (± ``jitter_ms``)."""
+        rng = random.Random(seed)
+        events = []
+        for hit_time, note_type in zip(hit_times, note_types):
+            press = hit_time + rng.uniform(-jitter_ms, jitter_ms) / 1000.0
+            for key in NOTE_KEYS[note_type]:
+                events.append((press, pygame.KEYDOWN, key))
+                events.append((press + hold, pygame.KEYUP, key))
+        return cls(events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+    def due(self, song_time: float) -> list[pygame.event.Event]:
+        batch = []
+        while self._cursor < len(self._events) and self._events[self._cursor][0] <= song_time:
+            _, event_type, key = self._events[self._cursor]
+            self._cursor += 1
+            if event_type == pygame.KEYDOWN:
+                self.pressed.add(key)
+            else:
+                self.pressed.discard(key)
+            batch.append(pygame.event.Event(event_type, key=key))
+        return batch
+
+
+def write_synthetic_chart(path: Path, notes: int, *, density: float, seed: int = 0) -> None:
+    """CSV com ``notes`` notas a ``density`` notas/s, começando em 1s."""
+    rng = random.Random(seed)
+    interval = 1.0 / density
+    with open(path, "w") as file:
+        file.write("time,note\n")
+        for index in range(notes):
+            file.write(f"{1.0 + index * interval:.4f},{rng.choice(NOTE_TYPES)}\n")
+
+
+def summarize(samples: array) -> dict[str, float]:
+    """Média, percentis e máximo de ``samples`` (segundos), em ms."""
+    if not samples:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0}
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000.0
+
+    total = sum(ordered)
+    return {
+        "mean_ms": total / len(ordered) * 1000.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000.0,
+        "total_ms": total * 1000.0,
+    }
+
+
+def find_chart(chart_id: bytes, folders: Iterable[Path]) -> Optional[Path]:
+    """Procura, nas pastas informadas, o CSV cujo SHA-1 é ``chart_id``."""
+    for folder in folders:
+        for csv_path in sorted(Path(folder).rglob("*.csv")):
+            if hashlib.sha1(csv_path.read_bytes()).digest() == chart_id:
+                return csv_path
+    return None
+
+
+def run_chart(
+    app,
+    csv_path: Path,
+    make_input: Callable[[object], object],
+    *,
+    frame_rate: float,
+    note_store: str,
+    max_song_time: Optional[float] = None,
+    replay_dir: Optional[Path] = None,
+) -> dict:
+    """Joga o chart inteiro no ``app`` e devolve tempos por fase e pontuação.
+
+    ``make_input(scene)`` devolve a fonte de teclas (``ScriptedInput`` ou
+    ``engine.replay.ReplayInput``). Com ``replay_dir``, o replay gravado pela
+    cena durante a execução é salvo nessa pasta. Se ``app.profiler`` estiver
+    ligado, os trechos registrados pela cena entram no resultado em ``spans``.
+    """
+    from scenes.gameplay import GameplayScene
+
+    clock = VirtualClock()
+    song = SimpleNamespace(title=csv_path.stem, csv_path=str(csv_path), mp3_path=str(csv_path.with_suffix(".mp3")))
+
+    began = time.perf_counter()
+    # Sem áudio: a timeline segue só o relógio virtual
+    scene = GameplayScene(app, song, note_store, clock=clock, audio_position=lambda: -1)
+    load_seconds = time.perf_counter() - began
+
+    script = make_input(scene)
+    scene.key_state = lambda: script
+    scene.replay_dir = None
+    app.change_scene(scene)
+    app.accumulator = 0.0
+    ticks_before = app.simulation_ticks
+    profiler = app.profiler
+    profiler.reset()
+
+    frame_dt = 1.0 / frame_rate
+    timings = {phase: array("d") for phase in PHASES}
+    frame_times = array("d")
+    perf = time.perf_counter
+
+    while scene.state == "playing" and app.active_scene is scene:
+        if max_song_time is not None and scene.sim_song_time >= max_song_time:
+            break
+        clock.advance(frame_dt)
+
+        start = perf()
+        for event in script.due(scene.timeline.now()):
+            app.active_scene.handle_event(event)
+        after_events = perf()
+        app.step(frame_dt)
+        after_update = perf()
+        app.active_scene.render(app.screen)
+        app._present()
+        after_render = perf()
+
+        timings["events"].append(after_events - start)
+        timings["update"].append(after_update - after_events)
+        timings["render"].append(after_render - after_update)
+        frame_times.append(after_render - start)
+        profiler.end_frame()
+
+    score = {"perfect": scene.hits, "good": scene.goods, "bad": scene.bad_hits, "miss": scene.misses}
+    result = {
+        "notes": len(scene.scheduler),
+        "chart": None if scene.chart_id is None else scene.chart_id.hex(),
+        "frames": len(frame_times),
+        "ticks": app.simulation_ticks - ticks_before,
+        "song_seconds": round(scene.sim_song_time, 6),
+        "load_ms": load_seconds * 1000.0,
+        "wall_seconds": sum(frame_times),
+        "phases": {phase: summarize(samples) for phase, samples in timings.items()},
+        "frame": summarize(frame_times),
+        "score": score,
+    }
+    if profiler.enabled:
+        result["spans"] = profiler.stats()
+    if replay_dir is not None and scene.replay_recorder is not None:
+        replay = scene.replay_recorder.replay
+        replay.score = dict(score)
+        path = replay.save(Path(replay_dir) / f"{csv_path.stem}{REPLAY_SUFFIX}")
+        result["replay"] = {"path": str(path), "events": len(replay), "bytes": path.stat().st_size}
+    return result
+
+
+def verify_replay(app, replay_file: Path, csv_path: Path, *, models=None, **options) -> dict:
+    """Reproduz o replay e compara o placar com o gravado (e com ``plays``, se houver)."""
+    replay = Replay.load(replay_file)
+    result = run_chart(app, csv_path, lambda scene: ReplayInput(replay), **options)
+    result["replay_file"] = str(replay_file)
+    result["expected"] = replay.score
+    checks = [result["chart"] == replay.chart_hex, result["score"] == replay.score]
+
+    if models is not None and replay.play_id:
+        row = models.play.read(replay.play_id)
+        stored = None
+        if row is not None:
+            stored = {
+                "perfect": row["perfect_hits"],
+                "good": row["good_hits"],
+                "bad": row["bad_hits"],
+                "miss": row["errors"],
+            }
+        result["stored"] = stored
+        checks.append(stored == result["score"])
+        checks.append(row is not None and row["score"] == result["score"]["perfect"] * 100 + result["score"]["good"] * 50)
+
+    result["verified"] = all(checks)
+    return result
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--density", type=float, default=20.0, help="notas por segundo do chart sintético")
+    parser.add_argument("--frame-rate", type=float, default=60.0, help="frames virtuais por segundo")
+    parser.add_argument("--size", type=int, nargs=2, default=[800, 600], metavar=("LARGURA", "ALTURA"))
+    parser.add_argument("--note-store", choices=("objects", "arrays"), default="objects")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="desvio máximo das teclas em relação ao hit_time")
+    parser.add_argument("--max-song-time", type=float, default=None, help="encerra cada partida após N segundos de música")
+    parser.add_argument("--output", type=Path, default=None, help="grava o JSON neste arquivo (padrão: stdout)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="falha se o p95 do frame passar deste valor")
+    parser.add_argument("--save-replays", type=Path, default=None, help="grava nesta pasta o replay de cada chart sintético")
+    parser.add_argument("--replay", type=Path, nargs="+", default=None, help="reproduz e verifica replays em vez dos charts sintéticos")
+    parser.add_argument("--chart", type=Path, default=None, help="CSV dos replays (padrão: busca em musics/ pelo SHA-1)")
+    parser.add_argument("--database", type=Path, default=None, help="banco para conferir o placar salvo em plays")
+    parser.add_argument("--spans", action="store_true", help="inclui os trechos medidos pela cena (BaseScene.span)")
+    parser.add_argument("--verbose", action="store_true", help="mantém o log informativo da cena (em stderr)")
+    args = parser.parse_args(argv)
+
+    from game_controller import GameApp
+    from models import Models
+    from utils.frame_profiler import FrameProfiler
+    from utils.log import OFF, shared_log
+
+    # O JSON sai no stdout; o log da cena vai para o stderr (os charts sintéticos
+    # não têm MP3, então o erro de música é esperado e fica de fora sem --verbose)
+    log = shared_log()
+    log.stream = sys.stderr
+    if not args.verbose:
+        log.set_level(OFF)
+
+    app = GameApp(models=Models(":memory:"))
+    app.screen = pygame.display.set_mode(tuple(args.size))
+    if args.spans:
+        # Janela sem limite prático: as estatísticas cobrem a partida inteira
+        app.profiler = FrameProfiler(enabled=True, window=10**7)
+    options = {"frame_rate": args.frame_rate, "note_store": args.note_store}
+
+    runs = []
+    with tempfile.TemporaryDirectory() as folder:
+        # Charts sintéticos não deixam compilados no cache/ do projeto
+        os.environ.setdefault(CACHE_DIR_ENV, str(Path(folder) / "beatmaps"))
+        if args.replay is not None:
+            models = Models(args.database) if args.database is not None else None
+            for replay_file in args.replay:
+                chart_id = Replay.load(replay_file).chart_id
+                csv_path = args.chart or find_chart(chart_id, [MUSICS_DIR])
+                if csv_path is None:
+                    runs.append({"replay_file": str(replay_file), "chart": chart_id.hex(), "verified": False})
+                    print(f"{replay_file}: chart não encontrado", file=sys.stderr)
+                    continue
+                runs.append(verify_replay(app, replay_file, csv_path, models=models, **options))
+                status = "ok" if runs[-1]["verified"] else "DIVERGENTE"
+                print(f"{replay_file}: {status} {runs[-1]['score']}", file=sys.stderr)
+            if models is not None:
+                models.close()
+        else:
+            for size in args.sizes:
+                csv_path = Path(folder) / f"synthetic_{size}.csv"
+                write_synthetic_chart(csv_path, size, density=args.density, seed=size)
+
+                def make_input(scene, jitter_ms=args.jitter_ms):
+                    return ScriptedInput.from_chart(
+                        scene.scheduler.hit_times, scene.scheduler.note_types, jitter_ms=jitter_ms, seed=len(scene.scheduler)
+                    )
+
+                runs.append(
+                    run_chart(
+                        app,
+                        csv_path,
+                        make_input,
+                        max_song_time=args.max_song_time,
+                        replay_dir=args.save_replays,
+                        **options,
+                    )
+                )
+                print(f"{size} notas: p95 do frame {runs[-1]['frame']['p95_ms']:.3f} ms", file=sys.stderr)
+
+    app.models.close()
+    pygame.quit()
+
+    report = {
+        "frame_rate": args.frame_rate,
+        "simulation_rate": round(1.0 / app.fixed_dt),
+        "size": list(args.size),
+        "note_store": args.note_store,
+        "runs": runs,
+    }
+    if args.replay is None:
+        report["density"] = args.density
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+
+    if args.replay is not None and not all(run["verified"] for run in runs):
+        return 1
+    if args.budget_ms is not None:
+        over = [run["notes"] for run in runs if "frame" in run and run["frame"]["p95_ms"] > args.budget_ms]
+        if over:
+            print(f"p95 do frame acima de {args.budget_ms} ms nos charts: {over}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
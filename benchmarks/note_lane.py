@@ -0,0 +1,81 @@
+"""Benchmark do update por frame com milhares de notas simultâneas na tela.
+
+Compara a ``NoteLane`` (objetos Python) com a ``ArrayNoteLane`` (colunas NumPy)
+em mapas de estresse: detecção de erro, fade/queda e geração dos itens de
+desenho (posições calculadas a partir do ``hit_time``) de cada frame.
+
+Uso::
+
+    python -m benchmarks.note_lane
+    python -m benchmarks.note_lane --counts 500 5000 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from engine.note_arrays import ArrayNoteLane, NoteLane, numpy_available
+
+
+FRAME_DT = 1 / 60
+NOTE_SPEED = 450.0
+FRAMES = 120
+
+
+class _BenchNote:
+    __slots__ = ("note_type", "hit_time", "x", "y", "alpha", "state", "result",
+                 "fade_elapsed", "fade_total", "vy", "key_mistaken", "active")
+
+    def __init__(self, note_type: str, hit_time: float) -> None:
+        self.note_type = note_type
+        self.hit_time = hit_time
+        self.x = 300.0 + hit_time * NOTE_SPEED
+        self.y = 200
+        self.alpha = 255
+        self.state = None
+        self.result = None
+        self.fade_elapsed = 0.0
+        self.fade_total = 0.4
+        self.vy = 0.0
+        self.key_mistaken = False
+        self.active = False
+
+
+def _bench(lane_factory, simultaneous: int) -> float:
+    lane = lane_factory()
+    spacing = 2.0 / simultaneous  # todas as notas cabem em ~2 s de tela
+    for index in range(simultaneous):
+        lane.push(_BenchNote("gamf"[index % 4], index * spacing))
+
+    song_time = 0.0
+    began = time.perf_counter()
+    for frame in range(FRAMES):
+        song_time += FRAME_DT
+        if frame % 2 == 0 and lane.active() is not None:
+            lane.resolve_active("perfect")
+        lane.pop_missed(song_time - 0.25)
+        lane.advance(FRAME_DT)
+        for _ in lane.draw_items(song_time, note_speed=NOTE_SPEED, hit_x=300.0, lane_y=200.0):
+            pass
+    return (time.perf_counter() - began) / FRAMES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1_000, 5_000, 20_000])
+    args = parser.parse_args()
+
+    if not numpy_available():
+        print("NumPy não instalado: medindo apenas a NoteLane.")
+
+    print(f"{'notas':>8} | {'objetos (ms/frame)':>20} | {'arrays (ms/frame)':>18}")
+    print("-" * 54)
+    for count in args.counts:
+        objects_ms = _bench(NoteLane, count) * 1000
+        arrays = f"{_bench(ArrayNoteLane, count) * 1000:.3f}" if numpy_available() else "-"
+        print(f"{count:>8} | {objects_ms:>20.3f} | {arrays:>18}")
+
+
+if __name__ == "__main__":
+    main()
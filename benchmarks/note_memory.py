@@ -0,0 +1,96 @@
+"""Relatório de memória por nota (``tracemalloc``), antes e depois de ``__slots__``.
+
+Compara a ``Note`` antiga (atributos em ``__dict__``, incluindo os adicionados em
+tempo de execução) com a versão com ``__slots__``, e o custo de um chart inteiro
+instanciado de uma vez contra o chart compacto + ``NotePool``.
+
+Uso::
+
+    python -m benchmarks.note_memory
+    python -m benchmarks.note_memory --chart-size 50000 --live 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from array import array
+
+from engine.note_pool import NotePool
+from engine.note_scheduler import NoteScheduler
+from entities.Notes.agudo.Agudo import Agudo
+from entities.Notes.flam.Flam import Flam
+from entities.Notes.grave.Grave import Grave
+from entities.Notes.mao.Mao import Mao
+
+
+NOTE_CLASSES = {note_cls.NOTE_TYPE: note_cls for note_cls in (Grave, Agudo, Mao, Flam)}
+
+
+class _LegacyNote:
+    """Réplica da ``Note`` anterior: ``__dict__`` por instância."""
+
+    def __init__(self, spawn_time: float, hit_time: float, note_type: str):
+        self.spawn_time = spawn_time
+        self.hit_time = hit_time
+        self.note_type = note_type
+        self.spawned = False
+        self.active = False
+        self.x = 0.0
+        self.y = 0
+        self.state = None
+        self.result = None
+        self.fade_elapsed = 0.0
+        self.fade_total = 0.4
+        self.alpha = 255
+        self.vy = 0.0
+        self.key_mistaken = False
+
+
+def _measure(build) -> tuple[int, object]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size, keep
+
+
+def _chart(size: int) -> list[tuple[float, str]]:
+    return [(index * 0.1, "gamf"[index % 4]) for index in range(size)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chart-size", type=int, default=50_000)
+    parser.add_argument("--live", type=int, default=40, help="pico de notas vivas simultâneas")
+    args = parser.parse_args()
+
+    chart = _chart(args.chart_size)
+    count = len(chart)
+
+    legacy_bytes, _ = _measure(lambda: [_LegacyNote(t, t, kind) for t, kind in chart])
+    slotted_bytes, _ = _measure(lambda: [NOTE_CLASSES[kind](t, t) for t, kind in chart])
+
+    def _compact():
+        scheduler = NoteScheduler(array("d", (t for t, _ in chart)), "".join(kind for _, kind in chart))
+        pool = NotePool(NOTE_CLASSES)
+        live = [pool.acquire(scheduler.note_types[i], 0.0, scheduler.hit_times[i]) for i in range(args.live)]
+        for note in live:
+            pool.release(note)
+        for i in range(args.live, count):
+            pool.release(pool.acquire(scheduler.note_types[i], 0.0, scheduler.hit_times[i]))
+        return scheduler, pool
+
+    compact_bytes, (_, pool) = _measure(_compact)
+
+    print(f"Chart de {count} notas")
+    print(f"  Note antiga (__dict__):   {legacy_bytes / count:8.1f} B/nota  {legacy_bytes / 1024:10.1f} KiB")
+    print(f"  Note com __slots__:       {slotted_bytes / count:8.1f} B/nota  {slotted_bytes / 1024:10.1f} KiB")
+    print(f"  Chart compacto + pool:    {compact_bytes / count:8.1f} B/nota  {compact_bytes / 1024:10.1f} KiB"
+          f"  ({pool.created} instâncias criadas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark do custo por frame do spawn de notas.
+
+Compara a varredura completa da fila (comportamento anterior da
+``GameplayScene``) com o ``NoteScheduler`` baseado em cursor. A densidade do
+beatmap é fixa (notas por segundo), então charts maiores significam músicas
+mais longas: o custo por frame deve permanecer constante com o cursor.
+
+Uso::
+
+    python -m benchmarks.note_scheduler
+    python -m benchmarks.note_scheduler --sizes 100 1000 100000 --skip-legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from array import array
+
+from engine.note_scheduler import NoteScheduler
+
+
+FRAME_DT = 1 / 60
+NOTES_PER_SECOND = 8.0
+
+
+class _BenchNote:
+    __slots__ = ("spawn_time", "spawned")
+
+    def __init__(self, spawn_time: float) -> None:
+        self.spawn_time = spawn_time
+        self.spawned = False
+
+
+def _build_chart(size: int) -> list[_BenchNote]:
+    return [_BenchNote(index / NOTES_PER_SECOND) for index in range(size)]
+
+
+def _measure_window(size: int) -> tuple[float, int]:
+    """Retorna o instante inicial e a quantidade de frames medidos no fim da música."""
+    song_length = size / NOTES_PER_SECOND
+    frames = 240
+    start = max(0.0, song_length - frames * FRAME_DT)
+    return start, frames
+
+
+def _bench_legacy(size: int) -> float:
+    notes = _build_chart(size)
+    start, frames = _measure_window(size)
+    for note in notes:
+        if note.spawn_time < start:
+            note.spawned = True
+
+    elapsed = 0.0
+    music_time = start
+    for _ in range(frames):
+        music_time += FRAME_DT
+        began = time.perf_counter()
+        for note in notes:
+            if not note.spawned and music_time >= note.spawn_time:
+                note.spawned = True
+        all(note.spawned for note in notes)
+        elapsed += time.perf_counter() - began
+    return elapsed / frames
+
+
+def _bench_cursor(size: int) -> float:
+    hit_times = array("d", (index / NOTES_PER_SECOND for index in range(size)))
+    scheduler = NoteScheduler(hit_times, "g" * size)
+    start, frames = _measure_window(size)
+    scheduler.pop_due(start)
+
+    elapsed = 0.0
+    music_time = start
+    spawned = 0
+    for _ in range(frames):
+        music_time += FRAME_DT
+        began = time.perf_counter()
+        for _index in scheduler.pop_due(music_time):
+            spawned += 1
+        scheduler.exhausted
+        elapsed += time.perf_counter() - began
+    return elapsed / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--skip-legacy", action="store_true", help="mede apenas o cursor")
+    args = parser.parse_args()
+
+    print(f"{'notas':>8} | {'varredura (µs/frame)':>22} | {'cursor (µs/frame)':>18}")
+    print("-" * 56)
+    for size in args.sizes:
+        cursor_us = _bench_cursor(size) * 1e6
+        legacy = "-" if args.skip_legacy else f"{_bench_legacy(size) * 1e6:.2f}"
+        print(f"{size:>8} | {legacy:>22} | {cursor_us:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Serviços de gameplay independentes da camada de apresentação."""
+
+from .beatmap import CompiledBeatmap, compile_beatmap, load_beatmap
+from .judge import HitJudge
+from .note_arrays import ArrayNoteLane, create_note_lane, numpy_available
+from .note_lane import NoteLane
+from .note_pool import NotePool
+from .note_scheduler import NoteScheduler
+from .replay import Replay, ReplayError, ReplayInput, ReplayRecorder
+from .sound_bank import NoteSoundBank, current_note_sound_bank, shared_note_sound_bank
+from .timeline import SongTimeline
+
+__all__ = [
+    "ArrayNoteLane",
+    "CompiledBeatmap",
+    "HitJudge",
+    "NoteLane",
+    "NotePool",
+    "NoteScheduler",
+    "NoteSoundBank",
+    "Replay",
+    "ReplayError",
+    "ReplayInput",
+    "ReplayRecorder",
+    "SongTimeline",
+    "compile_beatmap",
+    "create_note_lane",
+    "current_note_sound_bank",
+    "load_beatmap",
+    "numpy_available",
+    "shared_note_sound_bank",
+]
@@ -0,0 +1,234 @@
+"""Compilação dos beatmaps CSV para um cache binário mapeado em memória.
+
+O CSV continua sendo a fonte de verdade. O compilado fica em ``cache/beatmaps/``
+(``<nome>-<hash do caminho>.beatmap``), fora da pasta da música, com os
+``hit_time`` já ordenados em ``float64`` seguidos de um byte (ASCII) com
+o tipo de cada nota. O cabeçalho registra ``mtime_ns``, tamanho e SHA-1 do CSV
+de origem; se não baterem, o arquivo é recompilado.
+
+Layout (little-endian)::
+
+    [cabeçalho, HEADER_SIZE bytes][count * float64 hit_times][count * uint8 tipos]
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from utils.log import shared_log
+
+from .note_arrays import NOTE_TYPES
+
+
+# Fora de musics/: gravar nas pastas das músicas mudaria o mtime que o índice da biblioteca observa
+BEATMAP_CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "beatmaps"
+# Variável de ambiente que troca a pasta do cache (ex.: benchmarks com charts temporários)
+CACHE_DIR_ENV = "ENGRENADA_BEATMAP_CACHE"
+
+MAGIC = b"EHBEATMP"
+FORMAT_VERSION = 1
+CACHE_SUFFIX = ".beatmap"
+DEFAULT_NOTE_TYPE = "g"
+
+# magic, versão, contagem, mtime_ns e tamanho do CSV, SHA-1 do CSV
+_HEADER = struct.Struct("<8sIIqq20s")
+# Múltiplo de 8 para que os float64 fiquem alinhados no mapeamento
+HEADER_SIZE = 64
+
+PathLike = Union[str, os.PathLike]
+
+
+class CompiledBeatmap:
+    """Chart compacto pronto para o ``NoteScheduler``.
+
+    ``hit_times`` é uma sequência de ``float`` ordenada (``memoryview`` sobre o
+    arquivo mapeado, ou ``array('d')`` quando o cache não pôde ser usado) e
+    ``note_types`` uma string com um caractere por nota. O ``memoryview``
+    mantém o mapeamento aberto enquanto houver referências a ele. ``digest`` é o
+    SHA-1 do CSV de origem e identifica o chart (replays, por exemplo).
+    """
+
+    def __init__(self, hit_times, note_types: str, *, source: str = "csv", digest: Optional[bytes] = None) -> None:
+        self.hit_times = hit_times
+        self.note_types = note_types
+        self.source = source
+        self.digest = digest
+
+    def __len__(self) -> int:
+        return len(self.note_types)
+
+
+def default_cache_dir() -> Path:
+    """Pasta do cache: ``ENGRENADA_BEATMAP_CACHE`` ou ``BEATMAP_CACHE_DIR``."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    return Path(override) if override else BEATMAP_CACHE_DIR
+
+
+def cache_path_for(csv_path: PathLike, cache_dir: Optional[PathLike] = None) -> Path:
+    """Caminho do arquivo compilado correspondente a ``csv_path``.
+
+    Vários charts se chamam igual (``chart.csv``), então o nome leva um hash do
+    caminho absoluto do CSV.
+    """
+    csv_path = Path(csv_path)
+    folder = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    key = hashlib.sha1(os.path.abspath(csv_path).encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return folder / f"{csv_path.stem}-{key}{CACHE_SUFFIX}"
+
+
+def parse_csv(csv_path: PathLike) -> tuple[array, str]:
+    """Lê o CSV (``time``, ``note``) e devolve os tempos ordenados e os tipos."""
+    rows: list[tuple[float, str]] = []
+    with open(csv_path, "r", newline="") as file:
+        for row in csv.DictReader(file):
+            hit_time = float(row.get("time", 0))
+            note_type = (row.get("note") or DEFAULT_NOTE_TYPE).lower()
+            if note_type not in NOTE_TYPES:
+                shared_log().warning("beatmap", "invalid_note_type", note=note_type, fallback=DEFAULT_NOTE_TYPE)
+                note_type = DEFAULT_NOTE_TYPE
+            rows.append((hit_time, note_type))
+
+    rows.sort(key=lambda entry: entry[0])
+    hit_times = array("d", (hit_time for hit_time, _ in rows))
+    note_types = "".join(note_type for _, note_type in rows)
+    return hit_times, note_types
+
+
+def compile_beatmap(
+    csv_path: PathLike,
+    cache_path: Optional[PathLike] = None,
+    *,
+    cache_dir: Optional[PathLike] = None,
+) -> Path:
+    """Compila ``csv_path`` e grava o arquivo binário de forma atômica."""
+    csv_path = Path(csv_path)
+    cache_path = Path(cache_path) if cache_path is not None else cache_path_for(csv_path, cache_dir)
+    raw = csv_path.read_bytes()
+    stat = csv_path.stat()
+    hit_times, note_types = parse_csv(csv_path)
+    _write_cache(cache_path, hit_times, note_types, stat, hashlib.sha1(raw).digest())
+    return cache_path
+
+
+def load_beatmap(
+    csv_path: PathLike,
+    *,
+    use_cache: bool = True,
+    cache_dir: Optional[PathLike] = None,
+) -> CompiledBeatmap:
+    """Carrega o chart, preferindo o arquivo compilado quando está atualizado.
+
+    Se o cache estiver ausente ou desatualizado, o CSV é lido, o cache é
+    regenerado e então mapeado. Falhas de escrita (pasta somente leitura, arquivo
+    em uso) não impedem a partida: os dados lidos do CSV são usados em memória.
+    """
+    csv_path = Path(csv_path)
+    if not use_cache:
+        hit_times, note_types = parse_csv(csv_path)
+        return CompiledBeatmap(hit_times, note_types, source="csv", digest=hashlib.sha1(csv_path.read_bytes()).digest())
+
+    cache_path = cache_path_for(csv_path, cache_dir)
+    stat = csv_path.stat()
+    digest: Optional[bytes] = None
+
+    header = _read_header(cache_path)
+    if header is not None:
+        count, mtime_ns, size, cached_digest = header
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            compiled = _map_cache(cache_path, count)
+            if compiled is not None:
+                return compiled
+        elif size == stat.st_size:
+            # mtime mudou (cópia, checkout): o hash decide se o conteúdo mudou
+            digest = hashlib.sha1(csv_path.read_bytes()).digest()
+            if digest == cached_digest and _touch_header(cache_path, count, stat, digest):
+                compiled = _map_cache(cache_path, count)
+                if compiled is not None:
+                    return compiled
+
+    hit_times, note_types = parse_csv(csv_path)
+    if digest is None:
+        digest = hashlib.sha1(csv_path.read_bytes()).digest()
+    try:
+        _write_cache(cache_path, hit_times, note_types, stat, digest)
+    except OSError as exc:
+        shared_log().warning("beatmap", "cache_write_failed", path=cache_path, error=exc)
+        return CompiledBeatmap(hit_times, note_types, source="csv", digest=digest)
+
+    compiled = _map_cache(cache_path, len(hit_times))
+    if compiled is None:
+        return CompiledBeatmap(hit_times, note_types, source="csv", digest=digest)
+    compiled.source = "compiled"
+    return compiled
+
+
+def _write_cache(cache_path: Path, hit_times: array, note_types: str, stat: os.stat_result, digest: bytes) -> None:
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(hit_times), stat.st_mtime_ns, stat.st_size, digest)
+    times = array("d", hit_times)
+    if sys.byteorder != "little":
+        times.byteswap()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(temp_path, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        file.write(times.tobytes())
+        file.write(note_types.encode("ascii"))
+    os.replace(temp_path, cache_path)
+
+
+def _read_header(cache_path: Path) -> Optional[tuple[int, int, int, bytes]]:
+    try:
+        with open(cache_path, "rb") as file:
+            raw = file.read(HEADER_SIZE)
+    except OSError:
+        return None
+    if len(raw) < HEADER_SIZE:
+        return None
+    magic, version, count, mtime_ns, size, digest = _HEADER.unpack_from(raw)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return count, mtime_ns, size, digest
+
+
+def _touch_header(cache_path: Path, count: int, stat: os.stat_result, digest: bytes) -> bool:
+    """Atualiza o ``mtime_ns`` registrado sem recompilar o corpo."""
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, count, stat.st_mtime_ns, stat.st_size, digest)
+    try:
+        with open(cache_path, "r+b") as file:
+            file.write(header)
+    except OSError:
+        return False
+    return True
+
+
+def _map_cache(cache_path: Path, count: int) -> Optional[CompiledBeatmap]:
+    expected = HEADER_SIZE + count * 9
+    try:
+        with open(cache_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size != expected:
+                return None
+            digest = _HEADER.unpack(file.read(_HEADER.size))[5]
+            if count == 0:
+                return CompiledBeatmap(array("d"), "", source="compiled", digest=digest)
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, struct.error):
+        return None
+
+    times_end = HEADER_SIZE + count * 8
+    if sys.byteorder == "little":
+        hit_times: Iterable[float] = memoryview(mapping)[HEADER_SIZE:times_end].cast("d")
+    else:  # pragma: no cover - plataformas big-endian
+        hit_times = array("d")
+        hit_times.frombytes(mapping[HEADER_SIZE:times_end])
+        hit_times.byteswap()
+    note_types = mapping[times_end:expected].decode("ascii")
+    return CompiledBeatmap(hit_times, note_types, source="compiled", digest=digest)
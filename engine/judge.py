@@ -0,0 +1,88 @@
+"""Julgamento de acertos no domínio do tempo, independente da renderização."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class HitJudge:
+    """Classifica entradas pela diferença, em ms, entre a tecla e o ``hit_time`` da nota.
+
+    As janelas são simétricas: ``perfect_ms`` ⊂ ``good_ms`` ⊂ ``bad_ms``. Entradas
+    fora da maior janela não são julgadas. ``late_ms`` (padrão: ``bad_ms``) corta o
+    lado atrasado: uma nota é considerada perdida quando o tempo da música
+    ultrapassa seu ``hit_time`` em mais de ``late_ms``.
+    """
+
+    def __init__(
+        self,
+        perfect_ms: float = 120.0,
+        good_ms: float = 180.0,
+        bad_ms: float = 250.0,
+        late_ms: Optional[float] = None,
+    ) -> None:
+        if not 0 < perfect_ms <= good_ms <= bad_ms:
+            raise ValueError("As janelas devem obedecer 0 < perfect <= good <= bad.")
+        if late_ms is None:
+            late_ms = bad_ms
+        if not 0 < late_ms <= bad_ms:
+            raise ValueError("A janela atrasada deve obedecer 0 < late <= bad.")
+        self.perfect_ms = perfect_ms
+        self.good_ms = good_ms
+        self.bad_ms = bad_ms
+        self.late_ms = late_ms
+
+    @classmethod
+    def from_pixels(
+        cls,
+        note_speed: float,
+        *,
+        perfect_px: float,
+        good_px: float,
+        late_px: float,
+        bad_px: Optional[float] = None,
+    ) -> "HitJudge":
+        """Converte janelas medidas em pixels da pista para ms, na ``note_speed`` (px/s).
+
+        Sem ``bad_px`` a faixa ruim fica vazia (``bad_ms == good_ms``).
+        """
+        def to_ms(pixels: float) -> float:
+            return pixels / note_speed * 1000.0
+
+        good_ms = to_ms(good_px)
+        return cls(
+            perfect_ms=to_ms(perfect_px),
+            good_ms=good_ms,
+            bad_ms=good_ms if bad_px is None else to_ms(bad_px),
+            late_ms=to_ms(late_px),
+        )
+
+    @staticmethod
+    def offset_ms(input_time: float, hit_time: float) -> float:
+        """Diferença entre entrada e nota em ms (negativa = adiantada)."""
+        return (input_time - hit_time) * 1000.0
+
+    def judge(self, input_time: float, hit_time: float) -> Optional[str]:
+        """Retorna ``'perfect'``, ``'good'``, ``'bad'`` ou ``None`` fora das janelas.
+
+        Os tempos são em segundos no relógio da música.
+        """
+        offset = self.offset_ms(input_time, hit_time)
+        if offset > self.late_ms:
+            return None
+        distance = abs(offset)
+        if distance <= self.perfect_ms:
+            return "perfect"
+        if distance <= self.good_ms:
+            return "good"
+        if distance <= self.bad_ms:
+            return "bad"
+        return None
+
+    def is_missed(self, song_time: float, hit_time: float) -> bool:
+        """Indica se a nota já passou de todas as janelas de acerto."""
+        return self.offset_ms(song_time, hit_time) > self.late_ms
+
+    def miss_deadline(self, song_time: float) -> float:
+        """Notas com ``hit_time`` anterior a este instante já foram perdidas."""
+        return song_time - self.late_ms / 1000.0
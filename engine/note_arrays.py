@@ -0,0 +1,196 @@
+"""Armazenamento das notas vivas em colunas NumPy (struct-of-arrays).
+
+O NumPy é uma dependência opcional: sem ele, ``create_note_lane`` devolve a
+``NoteLane`` baseada em objetos.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+from utils.log import shared_log
+
+from .note_lane import NoteLane
+
+
+NOTE_TYPES = ("g", "a", "m", "f")
+_TYPE_CODES = {note_type: code for code, note_type in enumerate(NOTE_TYPES)}
+_TYPE_NAMES = np.array(NOTE_TYPES, dtype=object) if np is not None else None
+
+STATE_PENDING = 0
+STATE_FADING = 1
+STATE_FALLING = 2
+STATE_DEAD = 3
+
+
+def numpy_available() -> bool:
+    """Indica se o NumPy está instalado."""
+    return np is not None
+
+
+class ArrayNoteLane:
+    """Versão vetorizada da ``NoteLane``, com a mesma interface.
+
+    Cada nota ocupa um índice nas colunas (``hit_time``, ``type``, ``alpha``,
+    ``state``, ``elapsed``, ``vy``, ``mistaken``), atribuído na ordem de spawn.
+    Como as notas são julgadas e animadas nessa mesma ordem, as vivas formam um
+    intervalo contíguo: ``[anim_head, pending_head)`` em animação e
+    ``[pending_head, count)`` pendentes. Posições, fade, queda e detecção de
+    erro viram poucas operações sobre fatias desse intervalo. A instância da nota
+    só é lida no ``push`` e devolvida imediatamente a ``release``.
+    """
+
+    _COLUMNS = ("hit_time", "type", "alpha", "state", "elapsed", "vy", "mistaken")
+
+    def __init__(
+        self,
+        *,
+        fade_total: float = 0.4,
+        fall_speed: float = 420.0,
+        release: Optional[Callable[[object], None]] = None,
+        capacity: int = 1024,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("ArrayNoteLane requer o NumPy instalado.")
+        self.fade_total = fade_total
+        self.fall_speed = fall_speed
+        self._release = release
+        self._count = 0
+        self._anim_head = 0
+        self._pending_head = 0
+        self._allocate(max(16, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        self.hit_time = np.zeros(capacity, dtype=np.float64)
+        self.type = np.zeros(capacity, dtype=np.uint8)
+        self.alpha = np.zeros(capacity, dtype=np.float64)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.elapsed = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.mistaken = np.zeros(capacity, dtype=np.bool_)
+
+    def __len__(self) -> int:
+        return self._count - self._anim_head
+
+    def __bool__(self) -> bool:
+        return self._count > self._anim_head
+
+    def push(self, note) -> None:
+        """Copia os dados da nota recém-spawnada para as colunas."""
+        if self._count == len(self.hit_time):
+            self._make_room()
+        index = self._count
+        self.hit_time[index] = note.hit_time
+        self.type[index] = _TYPE_CODES.get(note.note_type, 0)
+        self.alpha[index] = 255.0
+        self.state[index] = STATE_PENDING
+        self.elapsed[index] = 0.0
+        self.vy[index] = 0.0
+        self.mistaken[index] = False
+        self._count += 1
+        if self._release is not None:
+            self._release(note)
+
+    def active(self) -> Optional[tuple[str, float]]:
+        if self._pending_head >= self._count:
+            return None
+        index = self._pending_head
+        return NOTE_TYPES[self.type[index]], float(self.hit_time[index])
+
+    def resolve_active(self, result: str) -> None:
+        index = self._pending_head
+        self.state[index] = STATE_FADING
+        self.elapsed[index] = 0.0
+        self._pending_head += 1
+
+    def mistake_active(self) -> None:
+        if self._pending_head < self._count:
+            self.mistaken[self._pending_head] = True
+
+    def pop_missed(self, deadline: float) -> list[str]:
+        start, end = self._pending_head, self._count
+        if start >= end:
+            return []
+        # As pendentes estão ordenadas por hit_time: as vencidas formam um prefixo.
+        stop = start + int(np.searchsorted(self.hit_time[start:end], deadline, side="left"))
+        if stop == start:
+            return []
+        missed = slice(start, stop)
+        mistaken = self.mistaken[missed]
+        self.state[missed] = np.where(mistaken, STATE_DEAD, STATE_FALLING)
+        self.elapsed[missed] = 0.0
+        self.vy[missed] = np.where(mistaken, 0.0, self.fall_speed)
+        self._pending_head = stop
+        return [NOTE_TYPES[code] for code in self.type[missed][~mistaken]]
+
+    def advance(self, dt: float) -> None:
+        animating = slice(self._anim_head, self._pending_head)
+        if self._anim_head < self._pending_head:
+            elapsed = self.elapsed[animating]
+            elapsed += dt
+            self.alpha[animating] = 255.0 * (1.0 - np.minimum(1.0, elapsed / self.fade_total))
+            state = self.state[animating]
+            state[elapsed >= self.fade_total] = STATE_DEAD
+
+            # Avança o início do intervalo vivo sobre as notas já descartadas.
+            alive = np.flatnonzero(state != STATE_DEAD)
+            self._anim_head += int(alive[0]) if alive.size else len(state)
+
+    def draw_items(
+        self,
+        song_time: float,
+        *,
+        note_speed: float,
+        hit_x: float,
+        lane_y: float,
+        rewind: float = 0.0,
+    ) -> Iterator[tuple[str, float, float, float]]:
+        live = slice(self._anim_head, self._count)
+        visible = self.state[live] != STATE_DEAD
+        types = _TYPE_NAMES[self.type[live][visible]].tolist()
+        xs = (hit_x + (self.hit_time[live][visible] - song_time) * note_speed).tolist()
+        elapsed = np.maximum(0.0, self.elapsed[live][visible] - rewind)
+        ys = (lane_y + self.vy[live][visible] * elapsed).tolist()
+        alphas = self.alpha[live][visible].tolist()
+        return zip(types, xs, ys, alphas)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._anim_head = 0
+        self._pending_head = 0
+
+    def _make_room(self) -> None:
+        """Compacta o intervalo vivo para o início ou dobra a capacidade."""
+        head = self._anim_head
+        live = self._count - head
+        capacity = len(self.hit_time)
+        if head >= capacity // 2:
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[:live] = column[head:self._count]
+        else:
+            old = {name: getattr(self, name) for name in self._COLUMNS}
+            self._allocate(capacity * 2)
+            for name, column in old.items():
+                getattr(self, name)[:live] = column[head:self._count]
+        self._count = live
+        self._pending_head -= head
+        self._anim_head = 0
+
+
+def create_note_lane(backend: str = "objects", **kwargs):
+    """Cria a estrutura de notas vivas.
+
+    ``backend`` aceita ``"objects"`` (``NoteLane``) ou ``"arrays"``
+    (``ArrayNoteLane``); sem NumPy instalado, ``"arrays"`` recai em objetos.
+    """
+    if backend == "arrays":
+        if np is not None:
+            return ArrayNoteLane(**kwargs)
+        shared_log().warning("notes", "numpy_missing", fallback="objects")
+    return NoteLane(**kwargs)
@@ -0,0 +1,146 @@
+"""Estrutura das notas vivas na lane, ordenada por ``hit_time``."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Iterator, Optional
+
+
+class NoteLane:
+    """Separa as notas vivas em duas filas FIFO.
+
+    ``pending`` guarda as notas ainda julgáveis na ordem de ``hit_time`` (a
+    primeira é sempre a nota ativa); ``animating`` guarda as notas em fade ou
+    queda, na ordem em que a animação começou. Como todas as animações têm a
+    mesma duração, a mais antiga termina primeiro e sai pela frente da fila.
+    Obter a nota ativa, avançar para a próxima e descartar animações concluídas
+    são operações O(1).
+
+    A interface (``push``, ``active``, ``resolve_active``, ``pop_missed``,
+    ``advance`` e ``draw_items``) é compartilhada com ``ArrayNoteLane``. Notas
+    que saem da lane são entregues a ``release`` (tipicamente ``NotePool.release``).
+    """
+
+    def __init__(
+        self,
+        *,
+        fade_total: float = 0.4,
+        fall_speed: float = 420.0,
+        release: Optional[Callable[[object], None]] = None,
+    ) -> None:
+        self.fade_total = fade_total
+        self.fall_speed = fall_speed
+        self._release = release
+        self.pending: deque = deque()
+        self.animating: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self.pending) + len(self.animating)
+
+    def __bool__(self) -> bool:
+        return bool(self.pending) or bool(self.animating)
+
+    def __iter__(self) -> Iterator:
+        """Percorre as notas em animação e depois as pendentes (ordem de desenho)."""
+        yield from self.animating
+        yield from self.pending
+
+    def push(self, note) -> None:
+        """Adiciona uma nota recém-spawnada ao fim da fila de pendentes."""
+        note.active = not self.pending
+        note.fade_total = self.fade_total
+        self.pending.append(note)
+
+    def active(self) -> Optional[tuple[str, float]]:
+        """Tipo e ``hit_time`` da nota ativa (a próxima a ser julgada), ou ``None``."""
+        if not self.pending:
+            return None
+        note = self.pending[0]
+        return note.note_type, note.hit_time
+
+    def resolve_active(self, result: str) -> None:
+        """Registra o acerto da nota ativa, inicia o fade e promove a seguinte."""
+        note = self._pop_active()
+        note.result = result
+        note.state = 'fading'
+        note.fade_elapsed = 0.0
+        self.animating.append(note)
+
+    def mistake_active(self) -> None:
+        """Marca que a nota ativa já recebeu uma tecla errada."""
+        if self.pending:
+            self.pending[0].key_mistaken = True
+
+    def pop_missed(self, deadline: float) -> list[str]:
+        """Remove as notas cujo ``hit_time`` ficou antes de ``deadline``.
+
+        Notas que já tiveram a tecla confundida saem sem animação (o erro já foi
+        contabilizado); as demais começam a cair e seus tipos são devolvidos.
+        """
+        missed: list[str] = []
+        pending = self.pending
+        while pending and pending[0].hit_time < deadline:
+            note = self._pop_active()
+            if note.key_mistaken:
+                self._discard(note)
+                continue
+            note.result = 'miss'
+            note.state = 'falling'
+            note.fade_elapsed = 0.0
+            note.vy = self.fall_speed
+            self.animating.append(note)
+            missed.append(note.note_type)
+        return missed
+
+    def advance(self, dt: float) -> None:
+        """Avança fades/quedas e descarta animações concluídas.
+
+        A posição das notas não é acumulada: ``draw_items`` a calcula a partir do
+        ``hit_time`` e do tempo da música.
+        """
+        for note in self.animating:
+            note.fade_elapsed += dt
+            progress = min(1.0, note.fade_elapsed / note.fade_total)
+            note.alpha = 255 * (1 - progress)
+
+        animating = self.animating
+        while animating and animating[0].fade_elapsed >= animating[0].fade_total:
+            self._discard(animating.popleft())
+
+    def draw_items(
+        self,
+        song_time: float,
+        *,
+        note_speed: float,
+        hit_x: float,
+        lane_y: float,
+        rewind: float = 0.0,
+    ) -> Iterator[tuple[str, float, float, float]]:
+        """Gera ``(tipo, x, y, alpha)`` para cada nota viva, na ordem de desenho.
+
+        ``x = hit_x + (hit_time - song_time) * note_speed``: a nota cruza
+        ``hit_x`` exatamente no seu ``hit_time``, sem estado acumulado. Notas em
+        queda descem ``vy`` px/s desde o início da animação; ``rewind`` (segundos)
+        recua essa animação para desenhar entre dois ticks da simulação.
+        """
+        for note in self:
+            x = hit_x + (note.hit_time - song_time) * note_speed
+            y = lane_y + note.vy * max(0.0, note.fade_elapsed - rewind)
+            yield note.note_type, x, y, note.alpha
+
+    def clear(self) -> None:
+        for note in self:
+            self._discard(note)
+        self.pending.clear()
+        self.animating.clear()
+
+    def _discard(self, note) -> None:
+        if self._release is not None:
+            self._release(note)
+
+    def _pop_active(self):
+        note = self.pending.popleft()
+        note.active = False
+        if self.pending:
+            self.pending[0].active = True
+        return note
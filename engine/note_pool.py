@@ -0,0 +1,39 @@
+"""Pool de instâncias de notas reaproveitadas entre spawns."""
+
+from __future__ import annotations
+
+from typing import Callable, Mapping
+
+
+class NotePool:
+    """Entrega instâncias de ``Note`` reaproveitando as que já saíram da tela.
+
+    Só existem tantas notas quanto o pico de notas vivas simultâneas; um chart de
+    50k notas não aloca 50k objetos de uma vez.
+    """
+
+    def __init__(self, factories: Mapping[str, Callable[[float, float], object]]) -> None:
+        self._factories = dict(factories)
+        self._free: dict[str, list] = {note_type: [] for note_type in self._factories}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, note_type: str, spawn_time: float, hit_time: float):
+        """Retorna uma nota do tipo pedido com os campos reinicializados."""
+        free = self._free[note_type]
+        if free:
+            note = free.pop()
+            note.reset(spawn_time, hit_time)
+            self.reused += 1
+            return note
+        self.created += 1
+        return self._factories[note_type](spawn_time, hit_time)
+
+    def release(self, note) -> None:
+        """Devolve uma nota que não está mais em uso."""
+        self._free[note.note_type].append(note)
+
+    @property
+    def available(self) -> int:
+        """Quantidade de instâncias livres no pool."""
+        return sum(len(free) for free in self._free.values())
@@ -0,0 +1,66 @@
+"""Agendamento de spawn das notas com cursor sobre o chart ordenado."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Sequence
+
+
+class NoteScheduler:
+    """Mantém um cursor de leitura sobre o chart ordenado por ``hit_time``.
+
+    O chart fica em forma compacta (``hit_times`` em ``array('d')`` ou
+    ``memoryview`` de ``float64`` e um tipo por nota), sem instanciar objetos
+    ``Note``. Cada chamada de ``pop_due`` devolve o intervalo de índices que
+    venceu desde a chamada anterior, de modo que o custo por frame não depende
+    do tamanho total do beatmap.
+    """
+
+    def __init__(self, hit_times: Sequence[float], note_types: Sequence[str], lead_time: float = 0.0) -> None:
+        if len(hit_times) != len(note_types):
+            raise ValueError("hit_times e note_types devem ter o mesmo tamanho.")
+        # array('d') e memoryview (beatmap compilado mapeado em memória) são usados sem cópia
+        self.hit_times = hit_times if isinstance(hit_times, (array, memoryview)) else array("d", hit_times)
+        self.note_types = note_types
+        self.lead_time = lead_time
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self.hit_times)
+
+    @property
+    def cursor(self) -> int:
+        return self._cursor
+
+    @property
+    def remaining(self) -> int:
+        """Quantidade de notas que ainda não foram liberadas."""
+        return len(self.hit_times) - self._cursor
+
+    @property
+    def exhausted(self) -> bool:
+        """Indica se todas as notas já foram liberadas (O(1))."""
+        return self._cursor >= len(self.hit_times)
+
+    def spawn_time(self, index: int) -> float:
+        """Instante em que a nota ``index`` deve entrar na tela."""
+        return self.hit_times[index] - self.lead_time
+
+    def pop_due(self, song_time: float) -> range:
+        """Libera os índices das notas cujo instante de spawn já foi alcançado."""
+        start = self._cursor
+        stop = bisect_right(self.hit_times, song_time + self.lead_time, lo=start)
+        self._cursor = stop
+        return range(start, stop)
+
+    def seek(self, hit_time: float) -> None:
+        """Reposiciona o cursor na primeira nota com ``hit_time`` maior ou igual ao informado.
+
+        As notas a partir dela voltam à fila e são liberadas de novo por ``pop_due``.
+        """
+        self._cursor = bisect_left(self.hit_times, hit_time)
+
+    def reset(self) -> None:
+        """Reposiciona o cursor no início do chart."""
+        self._cursor = 0
@@ -0,0 +1,240 @@
+"""Gravação e reprodução das entradas de uma partida.
+
+Um replay guarda o chart (SHA-1 do CSV), o resultado obtido e a sequência de
+eventos de teclado vistos por ``GameplayScene.handle_event``, com o instante de
+cada um no relógio da música. Reproduzido no simulador headless, ele passa pelo
+mesmo código de julgamento e deve chegar exatamente ao mesmo placar.
+
+Layout (inteiros em varint LEB128)::
+
+    MAGIC | versão | SHA-1 do chart (20 bytes) | play_id | perfect | good | bad
+    | miss | quantidade | eventos
+
+Cada evento ocupa dois varints: a diferença de tempo, em ms, para o evento
+anterior (zigzag, pois a antecipação tem tempos negativos) e
+``((tecla << HELD_BITS) | seguradas) << 1 | pressionada``. ``seguradas`` é a
+máscara de ``TRACKED_KEYS`` no estado de teclado lido pela cena, necessária
+para reproduzir as combinações (flam). Uma partida típica fica em 3 a 4 bytes
+por evento.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence, Union
+
+import pygame
+
+
+MAGIC = b"EHREPLAY"
+FORMAT_VERSION = 1
+REPLAY_SUFFIX = ".replay"
+REPLAYS_DIR = Path(__file__).resolve().parents[1] / "replays"
+CHART_ID_SIZE = 20
+SCORE_FIELDS = ("perfect", "good", "bad", "miss")
+
+# Teclas da gameplay cujo estado é consultado nas combinações
+TRACKED_KEYS = (pygame.K_z, pygame.K_a, pygame.K_SPACE)
+HELD_BITS = len(TRACKED_KEYS)
+
+PathLike = Union[str, os.PathLike]
+
+
+class ReplayError(ValueError):
+    """Arquivo de replay inválido ou de uma versão desconhecida."""
+
+
+class ReplayEvent(NamedTuple):
+    time_ms: int
+    key: int
+    down: bool
+    held: int
+
+    @property
+    def song_time(self) -> float:
+        return self.time_ms / 1000.0
+
+
+def held_mask(key_state: Sequence[bool]) -> int:
+    """Máscara de ``TRACKED_KEYS`` pressionadas em ``key_state``."""
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if key_state[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("Replay truncado.")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+class Replay:
+    """Entradas de uma partida e o placar que elas produziram."""
+
+    def __init__(
+        self,
+        chart_id: Optional[bytes],
+        events: Optional[list[ReplayEvent]] = None,
+        *,
+        play_id: int = 0,
+        score: Optional[dict[str, int]] = None,
+    ) -> None:
+        self.chart_id = chart_id if chart_id is not None else bytes(CHART_ID_SIZE)
+        if len(self.chart_id) != CHART_ID_SIZE:
+            raise ValueError("chart_id deve ser um SHA-1 (20 bytes).")
+        self.events = events if events is not None else []
+        self.play_id = play_id
+        self.score = dict.fromkeys(SCORE_FIELDS, 0)
+        if score is not None:
+            self.score.update(score)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def chart_hex(self) -> str:
+        return self.chart_id.hex()
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(MAGIC)
+        _write_varint(out, FORMAT_VERSION)
+        out += self.chart_id
+        _write_varint(out, self.play_id)
+        for field in SCORE_FIELDS:
+            _write_varint(out, self.score[field])
+        _write_varint(out, len(self.events))
+        previous = 0
+        for event in self.events:
+            _write_varint(out, _zigzag(event.time_ms - previous))
+            _write_varint(out, ((event.key << HELD_BITS) | event.held) << 1 | int(event.down))
+            previous = event.time_ms
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if not data.startswith(MAGIC):
+            raise ReplayError("Arquivo não é um replay.")
+        version, offset = _read_varint(data, len(MAGIC))
+        if version != FORMAT_VERSION:
+            raise ReplayError(f"Versão de replay não suportada: {version}.")
+        chart_id = data[offset:offset + CHART_ID_SIZE]
+        if len(chart_id) != CHART_ID_SIZE:
+            raise ReplayError("Replay truncado.")
+        offset += CHART_ID_SIZE
+        play_id, offset = _read_varint(data, offset)
+        score = {}
+        for field in SCORE_FIELDS:
+            score[field], offset = _read_varint(data, offset)
+        count, offset = _read_varint(data, offset)
+
+        events = []
+        time_ms = 0
+        for _ in range(count):
+            delta, offset = _read_varint(data, offset)
+            code, offset = _read_varint(data, offset)
+            time_ms += _unzigzag(delta)
+            down = bool(code & 1)
+            code >>= 1
+            events.append(ReplayEvent(time_ms, code >> HELD_BITS, down, code & ((1 << HELD_BITS) - 1)))
+        return cls(chart_id, events, play_id=play_id, score=score)
+
+    def save(self, path: PathLike) -> Path:
+        """Grava o replay de forma atômica."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_bytes(self.to_bytes())
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: PathLike) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def replay_path(replay: Replay, played_at: datetime, directory: PathLike = REPLAYS_DIR) -> Path:
+    """``<directory>/<chart>/<data>-<play_id>.replay``: uma pasta por chart."""
+    stamp = played_at.strftime("%Y%m%d-%H%M%S")
+    return Path(directory) / replay.chart_hex[:16] / f"{stamp}-{replay.play_id}{REPLAY_SUFFIX}"
+
+
+class ReplayRecorder:
+    """Acumula os eventos de teclado da partida em curso.
+
+    ``record`` devolve o instante quantizado em ms; a cena julga com esse valor
+    para que a reprodução use exatamente o mesmo tempo.
+    """
+
+    def __init__(self, chart_id: Optional[bytes]) -> None:
+        self.replay = Replay(chart_id)
+
+    def record(self, key: int, down: bool, key_state: Sequence[bool], song_time: float) -> float:
+        time_ms = round(song_time * 1000)
+        held = held_mask(key_state) if down else 0
+        self.replay.events.append(ReplayEvent(time_ms, key, down, held))
+        return time_ms / 1000.0
+
+
+class ReplayInput:
+    """Entrega os eventos de um replay no relógio da música.
+
+    ``due(song_time)`` gera os eventos vencidos como ``pygame.event.Event`` com o
+    atributo ``song_time`` (instante gravado). Enquanto cada evento é despachado,
+    a indexação (``replay_input[key]``) devolve o estado de teclado gravado com
+    ele, substituindo ``pygame.key.get_pressed`` na cena.
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        self.replay = replay
+        self._cursor = 0
+        self._held = 0
+
+    def __len__(self) -> int:
+        return len(self.replay.events)
+
+    def __getitem__(self, key: int) -> bool:
+        try:
+            bit = TRACKED_KEYS.index(key)
+        except ValueError:
+            return False
+        return bool(self._held & (1 << bit))
+
+    @property
+    def exhausted(self) -> bool:
+        return self._cursor >= len(self.replay.events)
+
+    def due(self, song_time: float) -> Iterator[pygame.event.Event]:
+        events = self.replay.events
+        while self._cursor < len(events) and events[self._cursor].song_time <= song_time:
+            event = events[self._cursor]
+            self._cursor += 1
+            self._held = event.held
+            event_type = pygame.KEYDOWN if event.down else pygame.KEYUP
+            yield pygame.event.Event(event_type, key=event.key, song_time=event.song_time)
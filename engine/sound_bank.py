@@ -0,0 +1,144 @@
+"""Banco de sons das notas, decodificados uma única vez e tocados em canais reservados."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from pathlib import Path
+from typing import Mapping, Optional
+
+import pygame
+
+from utils.log import shared_log
+
+
+class NoteSoundBank:
+    """Mantém os buffers das notas em memória e distribui execuções por canal.
+
+    Cada tipo de nota recebe ``channels_per_sound`` canais reservados do mixer,
+    usados em rodízio: passagens rápidas não roubam o canal de outro tipo de
+    nota nem dos efeitos de interface.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, Path],
+        *,
+        channels_per_sound: int = 2,
+        latency_window: int = 256,
+    ) -> None:
+        self._sources = {note_type: Path(path) for note_type, path in sources.items()}
+        self._channels_per_sound = max(1, channels_per_sound)
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self._next_channel: dict[str, int] = {}
+        self._latencies_ms: deque[float] = deque(maxlen=latency_window)
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def preload(self, decoded: Optional[Mapping[str, pygame.mixer.Sound]] = None) -> bool:
+        """Decodifica todos os WAVs e reserva canais; chamadas repetidas são ignoradas.
+
+        ``decoded`` recebe sons já decodificados (por exemplo pelo ``AssetLoader``);
+        apenas os tipos ausentes são lidos do disco.
+        """
+        if self._loaded:
+            return True
+
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error as exc:
+                shared_log().warning("sound", "mixer_unavailable", error=exc)
+                return False
+
+        decoded = decoded or {}
+        for note_type, path in self._sources.items():
+            if decoded.get(note_type) is not None:
+                self._sounds[note_type] = decoded[note_type]
+                continue
+            if not path.exists():
+                shared_log().warning("sound", "file_not_found", file=path.name)
+                continue
+            try:
+                self._sounds[note_type] = pygame.mixer.Sound(str(path))
+            except pygame.error as exc:
+                shared_log().warning("sound", "decode_failed", file=path.name, error=exc)
+
+        reserved = len(self._sounds) * self._channels_per_sound
+        # Mantém os canais livres anteriores disponíveis para sons de interface.
+        pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + reserved)
+        pygame.mixer.set_reserved(reserved)
+
+        channel_index = 0
+        for note_type in self._sounds:
+            channels = []
+            for _ in range(self._channels_per_sound):
+                channels.append(pygame.mixer.Channel(channel_index))
+                channel_index += 1
+            self._channels[note_type] = channels
+            self._next_channel[note_type] = 0
+
+        self._loaded = True
+        return True
+
+    def play(self, note_type: str, requested_at: Optional[float] = None) -> None:
+        """Toca o som do tipo informado em um dos canais reservados.
+
+        ``requested_at`` é o instante (``time.perf_counter``) em que a entrada
+        foi recebida; quando informado, alimenta a métrica de despacho.
+        """
+        sound = self._sounds.get(note_type)
+        if sound is None:
+            return
+
+        channels = self._channels[note_type]
+        index = self._next_channel[note_type]
+        self._next_channel[note_type] = (index + 1) % len(channels)
+        channels[index].play(sound)
+
+        if requested_at is not None:
+            self._latencies_ms.append((time.perf_counter() - requested_at) * 1000.0)
+
+    def latency_stats(self) -> dict[str, float]:
+        """Tempo de despacho, em ms: do evento de tecla até o retorno de ``Channel.play()``.
+
+        Não inclui o buffer do mixer nem a saída de áudio, então não é a latência
+        audível; serve para ver quanto o jogo atrasa o pedido do som.
+        """
+        samples = self._latencies_ms
+        if not samples:
+            return {"count": 0, "avg_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+        return {
+            "count": len(samples),
+            "avg_ms": sum(samples) / len(samples),
+            "max_ms": max(samples),
+            "last_ms": samples[-1],
+        }
+
+    def report(self) -> str:
+        stats = self.latency_stats()
+        return (
+            f"Som das notas: {stats['count']} disparos, despacho médio {stats['avg_ms']:.3f} ms, "
+            f"máximo {stats['max_ms']:.3f} ms (sem o buffer do mixer)"
+        )
+
+
+_SHARED_BANK: Optional[NoteSoundBank] = None
+
+
+def shared_note_sound_bank(sources: Mapping[str, Path]) -> NoteSoundBank:
+    """Retorna o banco compartilhado do processo, criando-o na primeira chamada."""
+    global _SHARED_BANK
+
+    if _SHARED_BANK is None:
+        _SHARED_BANK = NoteSoundBank(sources)
+    return _SHARED_BANK
+
+
+def current_note_sound_bank() -> Optional[NoteSoundBank]:
+    """Banco compartilhado, se alguma partida já o criou (para relatórios)."""
+    return _SHARED_BANK
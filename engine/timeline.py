@@ -0,0 +1,145 @@
+"""Linha do tempo da música ancorada no relógio de reprodução do mixer."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Callable, Optional
+
+import pygame
+
+from utils.log import shared_log
+
+
+def _mixer_position_ms() -> int:
+    """Posição do ``pygame.mixer.music`` em ms, ou -1 quando não está tocando."""
+    if not pygame.mixer.get_init():
+        return -1
+    return pygame.mixer.music.get_pos()
+
+
+class SongTimeline:
+    """Fornece o tempo da música (em segundos) para a gameplay.
+
+    O tempo é negativo durante a antecipação (``lead_in``) e zero quando o áudio
+    começa. Entre leituras do mixer o relógio é extrapolado por um relógio
+    monotônico; a cada ``update`` a posição reportada pelo mixer é comparada com
+    a estimativa e a diferença (drift) é corrigida gradualmente, ou de uma vez
+    quando excede ``snap_threshold``.
+    """
+
+    def __init__(
+        self,
+        lead_in: float,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+        audio_position: Callable[[], int] = _mixer_position_ms,
+        correction_rate: float = 0.1,
+        snap_threshold: float = 0.1,
+        frame_budget: float = 1 / 60,
+        drift_log_interval: float = 10.0,
+    ) -> None:
+        self.lead_in = lead_in
+        self._clock = clock
+        self._audio_position = audio_position
+        self.correction_rate = correction_rate
+        self.snap_threshold = snap_threshold
+        self.frame_budget = frame_budget
+        self.drift_log_interval = drift_log_interval
+        self._origin: Optional[float] = None
+        self._offset = 0.0
+        self._last_time = float("-inf")
+        self._audio_started = False
+        self._audio_start = 0.0
+        self._next_drift_log = drift_log_interval
+        self.drift_samples = array("d")
+
+    @property
+    def started(self) -> bool:
+        return self._origin is not None
+
+    @property
+    def audio_started(self) -> bool:
+        return self._audio_started
+
+    def start(self) -> None:
+        """Inicia a contagem da antecipação a partir do instante atual."""
+        self._origin = self._clock()
+        self._offset = 0.0
+        self._last_time = float("-inf")
+        self._audio_started = False
+        self._next_drift_log = self.drift_log_interval
+        self.drift_samples = array("d")
+
+    def should_start_audio(self) -> bool:
+        """Indica se a antecipação terminou e o áudio ainda não foi disparado."""
+        return self.started and not self._audio_started and self._estimate() >= 0.0
+
+    def mark_audio_started(self, start: float = 0.0) -> None:
+        """Registra que ``pygame.mixer.music.play(start=start)`` acabou de ser chamado."""
+        self._audio_started = True
+        self._audio_start = start
+
+    def seek(self, song_time: float) -> None:
+        """Move a timeline para ``song_time``; o áudio volta a ser disparado por ``should_start_audio``."""
+        if self._origin is None:
+            self.start()
+        self._origin = self._clock() - self.lead_in - song_time
+        self._offset = 0.0
+        self._last_time = float("-inf")
+        self._audio_started = False
+        self._audio_start = 0.0
+
+    def now(self) -> float:
+        """Tempo atual da música, monotônico entre chamadas."""
+        if self._origin is None:
+            return -self.lead_in
+        current = max(self._estimate(), self._last_time)
+        self._last_time = current
+        return current
+
+    def update(self) -> None:
+        """Mede o drift contra o mixer e aplica a correção (uma vez por frame)."""
+        if self._origin is None or not self._audio_started:
+            return
+
+        position_ms = self._audio_position()
+        if position_ms < 0:
+            return
+
+        # get_pos conta a partir do play(); o início da faixa vem de mark_audio_started
+        drift = self._audio_start + position_ms / 1000.0 - self._estimate()
+        self.drift_samples.append(drift)
+
+        if abs(drift) > self.snap_threshold:
+            self._offset += drift
+        else:
+            self._offset += drift * self.correction_rate
+
+        song_time = self._estimate()
+        if song_time >= self._next_drift_log:
+            self._next_drift_log = song_time + self.drift_log_interval
+            shared_log().info("timeline", "drift", t=song_time, drift_ms=drift * 1000)
+
+    def drift_report(self) -> dict[str, float]:
+        """Resumo do drift medido, em ms, comparado ao orçamento de um frame.
+
+        As primeiras amostras (meio segundo a 60 FPS) absorvem o atraso de
+        partida do mixer e ficam fora do máximo e do p95.
+        """
+        samples = self.drift_samples
+        if not samples:
+            return {"samples": 0, "max_abs_ms": 0.0, "p95_abs_ms": 0.0, "within_frame": True}
+        settled = samples[30:] if len(samples) > 60 else samples
+        magnitudes = sorted(abs(value) for value in settled)
+        max_abs = magnitudes[-1]
+        p95 = magnitudes[max(0, int(len(magnitudes) * 0.95) - 1)]
+        return {
+            "samples": len(samples),
+            "max_abs_ms": max_abs * 1000.0,
+            "p95_abs_ms": p95 * 1000.0,
+            "within_frame": max_abs <= self.frame_budget,
+        }
+
+    def _estimate(self) -> float:
+        return self._clock() - self._origin - self.lead_in + self._offset
@@ -2,16 +2,34 @@ from abc import ABC, abstractmethod
 
 class Note(ABC):
     """Classe abstrata das notas"""
+    __slots__ = (
+        "spawn_time",
+        "hit_time",
+        "note_type",
+        "spawned",
+        "active",
+        "state",
+        "result",
+        "fade_elapsed",
+        "fade_total",
+        "alpha",
+        "vy",
+        "key_mistaken",
+    )
+
     def __init__(self, spawn_time: float, hit_time: float, note_type: str):
+        self.note_type = note_type
+        self.reset(spawn_time, hit_time)
+
+    def reset(self, spawn_time: float, hit_time: float) -> None:
+        """Reinicializa todos os campos, permitindo reaproveitar a instância."""
         self.spawn_time = spawn_time
         self.hit_time = hit_time
-        self.note_type = note_type
         self.spawned = False
         self.active = False
-        self.x = 0.0
-        self.y = 0
+        # Sem x/y: a posição na tela é calculada a partir de hit_time (NoteLane.draw_items)
         self.state = None        # None | 'fading' | 'falling'
-        self.result = None       # 'perfect' | 'good' | 'miss'
+        self.result = None       # 'perfect' | 'good' | 'bad' | 'miss'
         self.fade_elapsed = 0.0
         self.fade_total = 0.4
         self.alpha = 255
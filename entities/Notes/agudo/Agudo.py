@@ -1,23 +1,15 @@
 from ..Note import Note
 import pathlib
-import pygame
 
 class Agudo(Note):
+    __slots__ = ()
+    NOTE_TYPE = "a"
+    SOUND_PATH = pathlib.Path(__file__).parent / "agudo.wav"
+
     def __init__(self, spawn_time: float, hit_time: float):
-        super().__init__(spawn_time, hit_time, "a")
+        super().__init__(spawn_time, hit_time, self.NOTE_TYPE)
 
     @staticmethod
-    def note_sound(self) -> None:
-        """Reproduz agudo.wav desta pasta."""
-        folder = pathlib.Path(__file__).parent
-        wav_path = folder / "agudo.wav"
-        if not wav_path.exists():
-            print("Agudo.note_sound: arquivo agudo.wav não encontrado.")
-            return
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        try:
-            sound = pygame.mixer.Sound(str(wav_path))
-            sound.play()
-        except pygame.error as e:
-            print(f"Agudo.note_sound: erro ao reproduzir agudo.wav: {e}")
\ No newline at end of file
+    def note_sound(scene, requested_at: float | None = None) -> None:
+        """Reproduz agudo.wav pelo banco de sons pré-carregado da cena."""
+        scene.sound_bank.play(Agudo.NOTE_TYPE, requested_at)
\ No newline at end of file
@@ -1,23 +1,15 @@
 from ..Note import Note
 import pathlib
-import pygame
 
 class Flam(Note):
+    __slots__ = ()
+    NOTE_TYPE = "f"
+    SOUND_PATH = pathlib.Path(__file__).parent / "flam.wav"
+
     def __init__(self, spawn_time: float, hit_time: float):
-        super().__init__(spawn_time, hit_time, "f")
+        super().__init__(spawn_time, hit_time, self.NOTE_TYPE)
 
     @staticmethod
-    def note_sound(self) -> None:
-        """Reproduz flam.wav desta pasta."""
-        folder = pathlib.Path(__file__).parent
-        wav_path = folder / "flam.wav"
-        if not wav_path.exists():
-            print("flam.note_sound: arquivo flam.wav não encontrado.")
-            return
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        try:
-            sound = pygame.mixer.Sound(str(wav_path))
-            sound.play()
-        except pygame.error as e:
-            print(f"flam.note_sound: erro ao reproduzir flam.wav: {e}")
\ No newline at end of file
+    def note_sound(scene, requested_at: float | None = None) -> None:
+        """Reproduz flam.wav pelo banco de sons pré-carregado da cena."""
+        scene.sound_bank.play(Flam.NOTE_TYPE, requested_at)
\ No newline at end of file
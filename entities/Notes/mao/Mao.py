@@ -1,23 +1,15 @@
 from ..Note import Note
 import pathlib
-import pygame
 
 class Mao(Note):
+    __slots__ = ()
+    NOTE_TYPE = "m"
+    SOUND_PATH = pathlib.Path(__file__).parent / "mao.wav"
+
     def __init__(self, spawn_time: float, hit_time: float):
-        super().__init__(spawn_time, hit_time, "m")
+        super().__init__(spawn_time, hit_time, self.NOTE_TYPE)
 
     @staticmethod
-    def note_sound(self) -> None:
-        """Reproduz mao.wav desta pasta."""
-        folder = pathlib.Path(__file__).parent
-        wav_path = folder / "mao.wav"
-        if not wav_path.exists():
-            print("mao.note_sound: arquivo mao.wav não encontrado.")
-            return
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        try:
-            sound = pygame.mixer.Sound(str(wav_path))
-            sound.play()
-        except pygame.error as e:
-            print(f"mao.note_sound: erro ao reproduzir mao.wav: {e}")
\ No newline at end of file
+    def note_sound(scene, requested_at: float | None = None) -> None:
+        """Reproduz mao.wav pelo banco de sons pré-carregado da cena."""
+        scene.sound_bank.play(Mao.NOTE_TYPE, requested_at)
\ No newline at end of file
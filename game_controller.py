@@ -1,13 +1,31 @@
 """Controlador principal do jogo com menu inicial em POO."""
 
+import argparse
+from collections import OrderedDict
+from typing import Optional, Sequence, Type, TypeVar
+
 import pygame
 
+from engine.sound_bank import current_note_sound_bank
 from models import Models
 from scenes import BaseScene, MenuScene
+from utils.frame_pacer import FRAME_RATE_TARGETS, FramePacer, target_label
+from utils.fonts import shared_fonts
+from utils.frame_profiler import FrameProfiler
+from utils.log import shared_log
+from utils.profile_capture import ProfileCapture
+from utils.text_cache import shared_text_cache
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+# Alvo de FPS padrão (ver FRAME_RATE_TARGETS; 0 = sem limite)
 FRAME_RATE = 60
+# A simulação avança em passos fixos, independentes da taxa de renderização
+SIMULATION_RATE = 120
+# Teto do tempo de frame acumulado (evita espiral de recuperação após travadas longas)
+MAX_FRAME_TIME = 0.25
+# Cenas suspensas mantidas para reaproveitamento (as menos recentes saem primeiro)
+SCENE_CACHE_SIZE = 4
 
 COLORS = {
     "background": (18, 18, 18),
@@ -18,32 +36,190 @@ COLORS = {
 }
 
 
+# Tecla que liga/desliga a medição por fase e o overlay com as estatísticas
+FRAME_STATS_KEY = pygame.K_F3
+FRAME_PHASES = ("events", "update", "render", "present")
+# Inicia/encerra a captura com cProfile (só com --profile ou ENGRENADA_PROFILE)
+PROFILE_KEY = pygame.K_F9
+# Alterna o alvo de FPS entre FRAME_RATE_TARGETS
+PACING_KEY = pygame.K_F4
+WINDOW_TITLE = "Engrenada Hero"
+
+SceneT = TypeVar("SceneT", bound=BaseScene)
+
+# Eventos após os quais a janela precisa ser reenviada por inteiro
+_FULL_FRAME_EVENTS = {
+    pygame.VIDEORESIZE,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWSIZECHANGED,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+}
+
+
 class GameApp:
-    """Responsável pela inicialização do pygame e troca de cenas."""
+    """Responsável pela inicialização do pygame e troca de cenas.
+
+    Com ``dirty_rects`` ativo, a cena pode informar em ``get_dirty_rects`` as
+    regiões alteradas no frame e apenas elas são enviadas com
+    ``pygame.display.update``; ``None`` mantém o ``flip`` completo.
+
+    ``profiler`` mede eventos, ``update``, ``render`` e ``present`` de cada frame
+    (e os trechos que as cenas registram com ``BaseScene.span``); ``F3`` liga a
+    medição e mostra o overlay com p50/p95/p99/máximo.
 
-    def __init__(self) -> None:
+    Com ``profile_capture``, ``F9`` liga/desliga o ``cProfile`` para gravar só o
+    trecho que interessa (ex.: a parte densa de uma música) em ``profiles/``.
+
+    Cenas que saem de cena ficam suspensas em um cache LRU (``SCENE_CACHE_SIZE``
+    por classe); ``show_scene(Classe)`` retoma a instância suspensa em vez de
+    construir outra, e ``on_enter`` atualiza só o estado que mudou.
+
+    ``pacer`` espaça os frames conforme ``frame_rate`` (``F4`` alterna entre
+    ``FRAME_RATE_TARGETS``). Com ``vsync`` a janela é criada com
+    ``vsync=1``; se o driver recusar, o jogo segue sem VSync, só com o ``pacer``.
+
+    Com ``watch_musics``, a seleção de músicas observa ``musics/`` enquanto está
+    em cena e reindexa a biblioteca quando uma pasta muda.
+    """
+
+    def __init__(
+        self,
+        *,
+        dirty_rects: bool = False,
+        simulation_rate: int = SIMULATION_RATE,
+        models: Optional[Models] = None,
+        frame_stats: bool = False,
+        profile_capture: Optional[ProfileCapture] = None,
+        frame_rate: Optional[int] = FRAME_RATE,
+        vsync: bool = False,
+        watch_musics: bool = False,
+    ) -> None:
         pygame.init()
         self.window_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
         self.is_fullscreen = False
-        self.screen = pygame.display.set_mode(self.window_size)
-        pygame.display.set_caption("Engrenada Hero")
-        self.clock = pygame.time.Clock()
+        self.vsync_requested = vsync
+        self.vsync = False
+        # frame_rate=None: sem limite enquanto o VSync estiver ativo, senão FRAME_RATE
+        self._frame_rate_follows_vsync = frame_rate is None
+        self.pacer: Optional[FramePacer] = None
+        self.screen = self._set_mode(self.window_size)
+        pygame.display.set_caption(WINDOW_TITLE)
+        if frame_rate is None:
+            frame_rate = 0 if self.vsync else FRAME_RATE
+        self.pacer = FramePacer(frame_rate)
         self.running = False
-        self.models = Models()
+        # O simulador headless injeta um banco em memória
+        self.models = models if models is not None else Models()
         self.active_player = None
+        self.watch_musics = watch_musics
+        self.dirty_rects = dirty_rects
+        self.fixed_dt = 1.0 / simulation_rate
+        self.accumulator = 0.0
+        self.simulation_ticks = 0
+        self._full_frame_pending = True
+        # Pixels enviados ao display (último frame e acumulado)
+        self.frame_pixels = 0
+        self.pixels_pushed = 0
+        self.frames_presented = 0
+        self.full_frames = 0
+        # Medição por fase do frame (desligada: os spans não custam nada)
+        self.profiler = FrameProfiler(enabled=frame_stats, phases=FRAME_PHASES)
+        self.show_frame_stats = frame_stats
+        self._frame_stats_rect: Optional[pygame.Rect] = None
+        self.profile_capture = profile_capture
+        self._scene_cache: OrderedDict[type, BaseScene] = OrderedDict()
         self.active_scene: BaseScene = MenuScene(self)
+        self.active_scene.on_enter()
 
     def toggle_fullscreen(self) -> None:
         """Alterna entre modo janela e tela cheia."""
         self.is_fullscreen = not self.is_fullscreen
         if self.is_fullscreen:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = self._set_mode((0, 0), pygame.FULLSCREEN)
         else:
-            self.screen = pygame.display.set_mode(self.window_size)
+            self.screen = self._set_mode(self.window_size)
+        self.request_full_frame()
+
+    def _set_mode(self, size: tuple[int, int], flags: int = 0) -> pygame.Surface:
+        """Cria a janela, com VSync quando pedido e suportado pelo driver.
+
+        O pygame só respeita ``vsync=1`` com ``SCALED`` (ou ``OPENGL``); sem eles a
+        chamada devolve uma superfície comum sem VSync e sem erro. Por isso o
+        pedido sai com ``SCALED``, e ``vsync`` só vale ``True`` se ele der certo.
+        """
+        if self.vsync_requested:
+            try:
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except pygame.error as exc:
+                shared_log().warning("display", "vsync_unavailable", error=exc)
+                self.vsync_requested = False
+            else:
+                self.vsync = True
+                return screen
+        self.vsync = False
+        if self._frame_rate_follows_vsync and self.pacer is not None and self.pacer.target == 0:
+            # Perdeu o VSync (ex.: tela cheia): volta ao limite padrão em vez de girar a CPU
+            self.pacer.target = FRAME_RATE
+        return pygame.display.set_mode(size, flags)
 
     def change_scene(self, scene: BaseScene) -> None:
-        """Atribui uma nova cena ativa ao aplicativo."""
+        """Atribui uma nova cena ativa ao aplicativo, suspendendo a anterior no cache."""
+        previous = self.active_scene
+        if previous is scene:
+            return
+        previous.on_exit()
+        cache = self._scene_cache
+        if cache.get(type(scene)) is scene:
+            del cache[type(scene)]
+        if previous.CACHEABLE:
+            cache[type(previous)] = previous
+            cache.move_to_end(type(previous))
+            while len(cache) > SCENE_CACHE_SIZE:
+                cache.popitem(last=False)
         self.active_scene = scene
+        scene.on_enter()
+        self.request_full_frame()
+
+    def show_scene(self, scene_cls: Type[SceneT]) -> SceneT:
+        """Ativa a cena da classe pedida, retomando a instância suspensa quando houver."""
+        scene = self._scene_cache.get(scene_cls)
+        if scene is None:
+            scene = scene_cls(self)
+        self.change_scene(scene)
+        return scene
+
+    def request_full_frame(self) -> None:
+        """Força o próximo frame a ser redesenhado e enviado por inteiro."""
+        self._full_frame_pending = True
+        self.active_scene.invalidate()
+
+    def toggle_frame_stats(self) -> None:
+        """Liga/desliga a medição por fase e o overlay de estatísticas."""
+        self.show_frame_stats = not self.show_frame_stats
+        self.profiler.enabled = self.show_frame_stats
+        if self.show_frame_stats:
+            self.profiler.reset()
+        else:
+            self._frame_stats_rect = None
+            self.request_full_frame()
+
+    def cycle_frame_rate(self) -> None:
+        """Passa para o próximo alvo de FPS (``PACING_KEY``)."""
+        self._frame_rate_follows_vsync = False  # Escolha manual vale até o fim
+        target = self.pacer.cycle_target(FRAME_RATE_TARGETS)
+        shared_log().info("display", "frame_rate_target", target=target_label(target), vsync=self.vsync)
+
+    def toggle_profile_capture(self) -> None:
+        """Inicia ou encerra a captura do ``cProfile``, rotulada pela cena ativa."""
+        if self.profile_capture is None:
+            return
+        self.profile_capture.toggle(type(self.active_scene).__name__)
+        self._update_caption()
+
+    def _update_caption(self) -> None:
+        capturing = self.profile_capture is not None and self.profile_capture.active
+        pygame.display.set_caption(f"{WINDOW_TITLE} — gravando perfil (F9)" if capturing else WINDOW_TITLE)
 
     def quit(self) -> None:
         """Encerra o loop principal do jogo de forma graciosa."""
@@ -52,26 +228,181 @@ class GameApp:
     def run(self) -> None:
         """Executa o loop principal tratando eventos, atualização e renderização."""
         self.running = True
+        profiler = self.profiler
         try:
             while self.running:
-                dt = self.clock.tick(FRAME_RATE) / 1000.0
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        break
-                    self.active_scene.handle_event(event)
-
-                self.active_scene.update(dt)
-                self.active_scene.render(self.screen)
-                pygame.display.flip()
+                frame_time = self.pacer.tick()
+                with profiler.span("events"):
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            self.running = False
+                            break
+                        if event.type == pygame.KEYDOWN and event.key == FRAME_STATS_KEY:
+                            self.toggle_frame_stats()
+                            continue
+                        if event.type == pygame.KEYDOWN and event.key == PACING_KEY:
+                            self.cycle_frame_rate()
+                            continue
+                        if event.type == pygame.KEYDOWN and event.key == PROFILE_KEY and self.profile_capture is not None:
+                            self.toggle_profile_capture()
+                            continue
+                        if event.type in _FULL_FRAME_EVENTS:
+                            self.request_full_frame()
+                        self.active_scene.handle_event(event)
+
+                with profiler.span("update"):
+                    self.step(frame_time)
+                with profiler.span("render"):
+                    self.active_scene.render(self.screen)
+                    self._draw_frame_stats()
+                with profiler.span("present"):
+                    self._present()
+                profiler.end_frame()
+                if self.profile_capture is not None and self.profile_capture.active:
+                    self.profile_capture.end_frame()
+                    if not self.profile_capture.active:
+                        self._update_caption()
         finally:
+            if self.profile_capture is not None:
+                self.profile_capture.stop()
+            if self.dirty_rects:
+                print(self.render_report())
+            if profiler.frames:
+                print(profiler.report())
+            print(self.pacer.report())
+            print(shared_fonts().report())
+            print(shared_text_cache().report())
+            sound_bank = current_note_sound_bank()
+            if sound_bank is not None and sound_bank.latency_stats()["count"]:
+                print(sound_bank.report())
             self.models.close()
+            # As fontes compartilhadas (e os textos presos a elas) morrem com o pygame
+            shared_text_cache().clear()
+            shared_fonts().clear()
             pygame.quit()
 
+    def step(self, frame_time: float) -> int:
+        """Avança a simulação em ticks fixos cobrindo ``frame_time`` segundos.
+
+        O resto que não completa um tick fica acumulado para o próximo frame e
+        vira o fator de interpolação entregue à cena (``interpolate``). Devolve a
+        quantidade de ticks executados.
+        """
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+        ticks = 0
+        while self.accumulator >= self.fixed_dt:
+            self.active_scene.update(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            ticks += 1
+        self.simulation_ticks += ticks
+        self.active_scene.interpolate(self.accumulator / self.fixed_dt)
+        return ticks
+
+    def _draw_frame_stats(self) -> None:
+        """Desenha o overlay de estatísticas (superfície em cache) no canto superior direito."""
+        if not self.show_frame_stats:
+            return
+        overlay = self.profiler.overlay()
+        rect = overlay.get_rect(topright=(self.screen.get_width() - 8, 8))
+        if self._frame_stats_rect is not None and rect.size != self._frame_stats_rect.size:
+            # Overlay mudou de tamanho (novo trecho): o próximo frame apaga a sobra
+            self.request_full_frame()
+        self.screen.blit(overlay, rect)
+        self._frame_stats_rect = rect
 
-def main() -> None:
+    def _present(self) -> None:
+        """Envia o frame ao display: regiões sujas ou ``flip`` completo."""
+        rects = None
+        if self.dirty_rects and not self._full_frame_pending:
+            rects = self.active_scene.get_dirty_rects()
+            if rects is not None and self._frame_stats_rect is not None:
+                rects = rects + [self._frame_stats_rect]
+
+        if rects is None:
+            pygame.display.flip()
+            pixels = self.screen.get_width() * self.screen.get_height()
+            self.full_frames += 1
+        else:
+            if rects:
+                pygame.display.update(rects)
+            pixels = sum(rect.width * rect.height for rect in rects)
+
+        self._full_frame_pending = False
+        self.frame_pixels = pixels
+        self.pixels_pushed += pixels
+        self.frames_presented += 1
+
+    def render_report(self) -> str:
+        """Resumo dos pixels enviados por frame desde o início do loop."""
+        frames = max(1, self.frames_presented)
+        screen_pixels = max(1, self.screen.get_width() * self.screen.get_height())
+        average = self.pixels_pushed / frames
+        return (
+            f"Render: {self.frames_presented} frames, média de {average:.0f} px/frame "
+            f"({average / screen_pixels:.0%} da tela), {self.full_frames} flips completos"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
     """Inicializa e executa o aplicativo do jogo."""
-    GameApp().run()
+    parser = argparse.ArgumentParser(description="Engrenada Hero")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="envia ao display apenas as regiões alteradas pelas cenas que suportam",
+    )
+    parser.add_argument(
+        "--fps",
+        choices=[str(target) for target in FRAME_RATE_TARGETS if target] + ["uncapped"],
+        default=None,
+        help=f"alvo de FPS (padrão: {FRAME_RATE}, ou sem limite com --vsync); F4 alterna",
+    )
+    parser.add_argument(
+        "--vsync",
+        action="store_true",
+        help="sincroniza a troca de frames com o monitor, quando o driver suporta",
+    )
+    parser.add_argument(
+        "--watch-musics",
+        action="store_true",
+        help="observa a pasta musics/ e atualiza a lista quando uma música muda",
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="mede cada fase do frame desde o início e mostra o overlay (F3 alterna)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="habilita a captura com cProfile: F9 inicia/encerra e grava em profiles/",
+    )
+    parser.add_argument(
+        "--profile-frames",
+        type=int,
+        default=None,
+        metavar="N",
+        help="encerra cada captura automaticamente após N frames (implica --profile)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.profile or args.profile_frames:
+        capture: Optional[ProfileCapture] = ProfileCapture(frames=args.profile_frames)
+    else:
+        capture = ProfileCapture.from_env()
+    if args.fps is not None:
+        frame_rate: Optional[int] = 0 if args.fps == "uncapped" else int(args.fps)
+    else:
+        # Com VSync confirmado, quem limita o ritmo é o monitor; sem ele, FRAME_RATE
+        frame_rate = None if args.vsync else FRAME_RATE
+    GameApp(
+        dirty_rects=args.dirty_rects,
+        frame_stats=args.frame_stats,
+        profile_capture=capture,
+        frame_rate=frame_rate,
+        vsync=args.vsync,
+        watch_musics=args.watch_musics,
+    ).run()
 
 
 if __name__ == "__main__":
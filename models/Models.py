@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict
 
 from .Model import Model
+from .MusicLibrary import MusicLibrary
 from .Play import Play
 from .Player import Player
 
@@ -24,6 +25,7 @@ class Models:
         self._models: Dict[str, Model] = {
             "player": Player(self._connection),
             "play": Play(self._connection),
+            "music_library": MusicLibrary(self._connection),
         }
 
     @property
@@ -44,6 +46,10 @@ class Models:
     def play(self) -> Play:
         return self._models["play"]
 
+    @property
+    def music_library(self) -> MusicLibrary:
+        return self._models["music_library"]
+
     def close(self) -> None:
         self._connection.close()
 
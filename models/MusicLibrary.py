@@ -0,0 +1,250 @@
+"""Modelo de acesso à tabela ``music_library`` e observador da pasta de músicas."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from entities.Music import Music
+from utils.log import shared_log
+
+from .Model import Model
+
+
+PathLike = Union[str, os.PathLike]
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "Database" / "migrations" / "2_music_library.sql"
+
+# Intervalo padrão entre varreduras do observador, em segundos
+DEFAULT_POLL_INTERVAL = 3.0
+
+
+def _now() -> str:
+	return datetime.now().replace(microsecond=0).isoformat(sep=" ")
+
+
+def _folder_mtimes(root: Path) -> Dict[str, int]:
+	"""``{pasta: mtime_ns}`` das subpastas de ``root`` (um ``stat`` por pasta)."""
+	mtimes: Dict[str, int] = {}
+	with os.scandir(root) as entries:
+		for entry in entries:
+			if entry.name.startswith(".") or not entry.is_dir():
+				continue
+			try:
+				mtimes[entry.name] = entry.stat().st_mtime_ns
+			except OSError:
+				continue
+	return mtimes
+
+
+def _inspect_folder(folder: Path) -> tuple[Optional[str], Optional[str], Optional[str]]:
+	"""Valida uma pasta de música: exatamente 1 CSV e 1 MP3.
+
+	Retorna ``(csv_path, mp3_path, erro)``; ``erro`` é ``None`` quando válida.
+	"""
+	csv_files: list[str] = []
+	mp3_files: list[str] = []
+	try:
+		with os.scandir(folder) as entries:
+			for entry in entries:
+				if entry.name.endswith(".csv"):
+					csv_files.append(entry.path)
+				elif entry.name.endswith(".mp3"):
+					mp3_files.append(entry.path)
+	except OSError as exc:
+		return None, None, f"pasta ilegível: {exc}"
+
+	if len(csv_files) == 1 and len(mp3_files) == 1:
+		return csv_files[0], mp3_files[0], None
+	return None, None, f"requer 1 CSV e 1 MP3 (encontrados {len(csv_files)} CSV e {len(mp3_files)} MP3)"
+
+
+class MusicLibrary(Model):
+	"""Índice das pastas de ``musics/`` com o resultado da última validação.
+
+	Cada pasta guarda seu ``mtime_ns``; ``rescan`` só revalida (lista o conteúdo)
+	as pastas cujo mtime mudou e apaga as que sumiram. Com a biblioteca
+	indexada, abrir a seleção custa um ``stat`` por pasta em vez de duas
+	listagens, e as pastas inválidas não são reportadas de novo a cada abertura.
+	"""
+
+	_COLUMNS = (
+		"id",
+		"root",
+		"folder",
+		"mtime_ns",
+		"csv_path",
+		"mp3_path",
+		"valid",
+		"error",
+		"scanned_at",
+	)
+
+	def __init__(self, connection) -> None:
+		super().__init__(connection, table_name="music_library", columns=self._COLUMNS)
+		# Bancos criados antes da migração 2 ganham a tabela aqui
+		self.connection.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+		self.last_scan: Dict[str, Any] = {}
+
+	# ------------------------------------------------------------------
+	# Preparação de payloads
+	# ------------------------------------------------------------------
+	def prepare_create_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+		payload: Dict[str, Any] = {}
+		for field in ("root", "folder"):
+			value = data.get(field)
+			if not isinstance(value, str) or not value:
+				raise ValueError(f"O campo '{field}' deve ser uma string não vazia.")
+			payload[field] = value
+
+		mtime_ns = data.get("mtime_ns")
+		if isinstance(mtime_ns, bool) or not isinstance(mtime_ns, int):
+			raise ValueError("O campo 'mtime_ns' deve ser um inteiro.")
+		payload["mtime_ns"] = mtime_ns
+
+		payload["csv_path"] = data.get("csv_path")
+		payload["mp3_path"] = data.get("mp3_path")
+		payload["valid"] = 1 if data.get("valid") else 0
+		payload["error"] = data.get("error")
+		payload["scanned_at"] = data.get("scanned_at") or _now()
+		return payload
+
+	# ------------------------------------------------------------------
+	# Utilidades
+	# ------------------------------------------------------------------
+	def rescan(self, root: PathLike) -> list[Music]:
+		"""Sincroniza o índice com ``root`` e retorna as músicas válidas, por nome.
+
+		Pastas novas ou com mtime diferente do indexado são validadas de novo;
+		as demais reaproveitam o resultado salvo. Todas as escritas saem em uma
+		única transação. Um resumo fica em ``last_scan``.
+		"""
+		started = time.perf_counter()
+		root_path = Path(root).resolve()
+		root_key = str(root_path)
+		log = shared_log()
+
+		self.cursor.execute(
+			"SELECT folder, mtime_ns FROM music_library WHERE root = ?",
+			(root_key,),
+		)
+		indexed = {row["folder"]: row["mtime_ns"] for row in self.cursor.fetchall()}
+
+		try:
+			mtimes = _folder_mtimes(root_path)
+		except OSError as exc:
+			# Falha transitória (ex.: rede) não apaga o índice: vale o que já estava salvo
+			log.warning("library", "root_unreadable", root=root_key, error=str(exc))
+			mtimes = dict(indexed)
+
+		scanned_at = _now()
+		changed = []
+		for folder, mtime_ns in mtimes.items():
+			if indexed.get(folder) == mtime_ns:
+				continue
+			csv_path, mp3_path, error = _inspect_folder(root_path / folder)
+			if error is not None:
+				log.info("library", "folder_skipped", folder=folder, reason=error)
+			changed.append(
+				(root_key, folder, mtime_ns, csv_path, mp3_path, int(error is None), error, scanned_at)
+			)
+		removed = [(root_key, folder) for folder in indexed if folder not in mtimes]
+
+		if changed or removed:
+			with self.connection:
+				self.connection.executemany(
+					"INSERT INTO music_library "
+					"(root, folder, mtime_ns, csv_path, mp3_path, valid, error, scanned_at) "
+					"VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+					"ON CONFLICT (root, folder) DO UPDATE SET "
+					"mtime_ns = excluded.mtime_ns, csv_path = excluded.csv_path, "
+					"mp3_path = excluded.mp3_path, valid = excluded.valid, "
+					"error = excluded.error, scanned_at = excluded.scanned_at",
+					changed,
+				)
+				self.connection.executemany(
+					"DELETE FROM music_library WHERE root = ? AND folder = ?",
+					removed,
+				)
+
+		self.cursor.execute(
+			"SELECT folder, csv_path, mp3_path FROM music_library "
+			"WHERE root = ? AND valid = 1 ORDER BY folder",
+			(root_key,),
+		)
+		songs = [Music(row["folder"], row["csv_path"], row["mp3_path"]) for row in self.cursor.fetchall()]
+
+		self.last_scan = {
+			"folders": len(mtimes),
+			"rescanned": len(changed),
+			"removed": len(removed),
+			"valid": len(songs),
+			"ms": (time.perf_counter() - started) * 1000.0,
+		}
+		log.info("library", "scan", root=root_key, **self.last_scan)
+		return songs
+
+
+class MusicFolderWatcher:
+	"""Observa ``root`` por polling em uma thread auxiliar.
+
+	A thread só compara ``{pasta: mtime_ns}`` entre varreduras e levanta uma
+	flag; quem consome (a cena, na thread principal) chama ``poll_changed`` e
+	então ``MusicLibrary.rescan``. O SQLite fica restrito à thread que abriu a
+	conexão.
+	"""
+
+	def __init__(self, root: PathLike, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+		self.root = Path(root)
+		self.interval = interval
+		self._changed = threading.Event()
+		self._stop = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	def start(self) -> None:
+		if self.running:
+			return
+		self._stop.clear()
+		self._changed.clear()
+		self._thread = threading.Thread(target=self._run, name="music-watcher", daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join(timeout=self.interval + 1.0)
+			self._thread = None
+
+	def poll_changed(self) -> bool:
+		"""``True`` uma única vez após cada mudança detectada."""
+		if not self._changed.is_set():
+			return False
+		self._changed.clear()
+		return True
+
+	def _snapshot(self) -> Dict[str, int]:
+		try:
+			snapshot = _folder_mtimes(self.root)
+			snapshot[""] = self.root.stat().st_mtime_ns
+		except OSError:
+			return {}
+		return snapshot
+
+	def _run(self) -> None:
+		last = self._snapshot()
+		while not self._stop.wait(self.interval):
+			snapshot = self._snapshot()
+			if snapshot != last:
+				last = snapshot
+				self._changed.set()
+
+
+__all__ = ["MusicLibrary", "MusicFolderWatcher"]
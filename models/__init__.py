@@ -1,8 +1,9 @@
 """Facilita importações dos modelos concretos e do contexto compartilhado."""
 
 from .Model import Model
+from .MusicLibrary import MusicFolderWatcher, MusicLibrary
 from .Play import Play
 from .Player import Player
 from .Models import Models
 
-__all__ = ["Model", "Play", "Player", "Models"]
\ No newline at end of file
+__all__ = ["Model", "MusicFolderWatcher", "MusicLibrary", "Play", "Player", "Models"]
\ No newline at end of file
@@ -2,7 +2,8 @@
 
 from .add_music import AddMusicScene
 from .base import BaseScene
+from .loading import LoadingScene
 from .menu import MenuScene
 from .music_select import MusicSelectScene
 
-__all__ = ["BaseScene", "MenuScene", "MusicSelectScene", "AddMusicScene"]
+__all__ = ["BaseScene", "LoadingScene", "MenuScene", "MusicSelectScene", "AddMusicScene"]
@@ -21,7 +21,9 @@ from utils.constants import (
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
 )
+from utils.fonts import get_font
 from utils.input_field import InputField
+from utils.text_cache import render_text
 
 
 UI_CONFIG = {
@@ -67,12 +69,12 @@ class AddMusicScene(BaseScene):
         super().__init__()
         self.app = app
         font_sizes = UI_CONFIG["font_sizes"]
-        self.title_font = pygame.font.Font(None, font_sizes["title"])
-        self.subtitle_font = pygame.font.Font(None, font_sizes["subtitle"])
-        self.input_font = pygame.font.Font(None, font_sizes["input"])
-        self.label_font = pygame.font.Font(None, font_sizes["label"])
-        self.button_font = pygame.font.Font(None, font_sizes["button"])
-        self.feedback_font = pygame.font.Font(None, font_sizes["feedback"])
+        self.title_font = get_font(font_sizes["title"])
+        self.subtitle_font = get_font(font_sizes["subtitle"])
+        self.input_font = get_font(font_sizes["input"])
+        self.label_font = get_font(font_sizes["label"])
+        self.button_font = get_font(font_sizes["button"])
+        self.feedback_font = get_font(font_sizes["feedback"])
 
         self.theme = ButtonTheme()
 
@@ -115,6 +117,13 @@ class AddMusicScene(BaseScene):
         self._layout_size = (0, 0)
         self._apply_layout(SCREEN_WIDTH, SCREEN_HEIGHT)
 
+    def on_enter(self) -> None:
+        """Ao voltar do cache, descarta hover e a mensagem da visita anterior."""
+        for button in self.buttons + [self.select_button]:
+            button.reset_hover()
+        self._clear_feedback()
+        self._set_focus(self._focused_index)
+
     def _build_buttons(self) -> list[Button]:
         """Configura botões da cena."""
         actions = [
@@ -235,10 +244,11 @@ class AddMusicScene(BaseScene):
 
         self.draw_background(surface, COLOR_BACKGROUND)
 
-        title = self.title_font.render("Adicionar Música", True, COLOR_PRIMARY)
+        title = render_text(self.title_font, "Adicionar Música", True, COLOR_PRIMARY)
         surface.blit(title, title.get_rect(center=self._title_pos))
 
-        subtitle = self.subtitle_font.render(
+        subtitle = render_text(
+            self.subtitle_font,
             "Informe um nome e selecione o arquivo ZIP da música.",
             True,
             COLOR_TEXT_MUTED,
@@ -254,7 +264,7 @@ class AddMusicScene(BaseScene):
 
         if self.feedback_message:
             color = COLOR_ERROR if self.feedback_is_error else COLOR_PRIMARY
-            feedback_surface = self.feedback_font.render(self.feedback_message, True, color)
+            feedback_surface = render_text(self.feedback_font, self.feedback_message, True, color)
             feedback_rect = feedback_surface.get_rect()
             feedback_rect.center = (width // 2, self._feedback_y)
             surface.blit(feedback_surface, feedback_rect)
@@ -385,4 +395,4 @@ class AddMusicScene(BaseScene):
         """Retorna para o menu principal."""
         from .menu import MenuScene
 
-        self.app.change_scene(MenuScene(self.app))
+        self.app.show_scene(MenuScene)
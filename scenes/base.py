@@ -2,46 +2,55 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Union
+from typing import ContextManager, Optional, Union
 
 import pygame
 
+from utils.asset_loader import AssetHandle, shared_asset_loader
+from utils.frame_profiler import NULL_SPAN
 
 _IMAGES_DIR = Path(__file__).resolve().parents[1] / "assets" / "images"
 _DEFAULT_BACKGROUND_NAME = "default_background.png"
 
 
 class BaseScene(ABC):
-    """Classe base simples para cenas do jogo."""
+    """Classe base simples para cenas do jogo.
+
+    Cenas com ``CACHEABLE`` ficam suspensas no cache do ``GameApp`` ao sair e são
+    reaproveitadas por ``app.show_scene``; ``on_enter``/``on_exit`` marcam cada
+    entrada e saída, e ``on_enter`` atualiza apenas o que pode ter mudado.
+    """
+
+    # Cenas presas a uma partida (gameplay, carregamento) desligam o reaproveitamento
+    CACHEABLE = True
 
     def __init__(self, *, background_name: Union[str, Path, None] = None) -> None:
         self._background_source: Optional[pygame.Surface] = None
         self._background_surface: Optional[pygame.Surface] = None
         self._background_size: Optional[tuple[int, int]] = None
         self._background_path: Optional[Path] = None
+        self._background_handle: Optional[AssetHandle] = None
         self.set_background(background_name)
 
     def set_background(self, image: Union[str, Path, None]) -> None:
         """Define o arquivo de fundo, usando o padrão quando não fornecido."""
         path = self._resolve_background_path(image)
         self._background_path = path
-
-        if path is None:
-            self._background_source = None
-            self._background_surface = None
-            self._background_size = None
-            return
-
-        try:
-            self._background_source = pygame.image.load(str(path)).convert()
-        except pygame.error:
-            self._background_source = None
+        self._background_source = None
         self._background_surface = None
         self._background_size = None
 
+        # A imagem é decodificada em segundo plano; até ficar pronta, usa a cor sólida
+        self._background_handle = shared_asset_loader().image(path) if path is not None else None
+
     def draw_background(self, surface: pygame.Surface, fallback_color: tuple[int, int, int]) -> None:
         """Desenha o fundo configurado, caindo para uma cor sólida se necessário."""
         width, height = surface.get_size()
+        handle = self._background_handle
+        if handle is not None and handle.poll():
+            self._background_source = handle.value
+            self._background_handle = None
+
         if self._background_source is None:
             surface.fill(fallback_color)
             return
@@ -76,6 +85,27 @@ class BaseScene(ABC):
 
         return None
 
+    def on_enter(self) -> None:
+        """Chamado sempre que a cena se torna ativa, inclusive ao sair do cache."""
+
+    def on_exit(self) -> None:
+        """Chamado quando outra cena assume; a instância pode voltar depois."""
+
+    def get_dirty_rects(self) -> Optional[list[pygame.Rect]]:
+        """Regiões alteradas pelo último ``render``; ``None`` pede o envio da tela inteira."""
+        return None
+
+    def invalidate(self) -> None:
+        """Avisa que o próximo ``render`` deve redesenhar a tela inteira."""
+
+    def interpolate(self, alpha: float) -> None:
+        """Recebe a fração (0–1) do próximo tick já decorrida, antes do ``render``."""
+
+    def span(self, name: str) -> ContextManager[None]:
+        """Mede um trecho da cena no ``FrameProfiler`` do app (sem efeito se não houver)."""
+        profiler = getattr(getattr(self, "app", None), "profiler", None)
+        return profiler.span(name) if profiler is not None else NULL_SPAN
+
     @abstractmethod
     def handle_event(self, event: pygame.event.Event) -> None:
         """Processa eventos provenientes do pygame."""
@@ -1,13 +1,25 @@
 import pygame
-import csv
+import os
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional, Sequence
 
-from entities.Notes.Note import Note
 from entities.Notes.agudo.Agudo import Agudo
 from entities.Notes.grave.Grave import Grave
 from entities.Notes.flam.Flam import Flam
 from entities.Notes.mao.Mao import Mao
+from engine.beatmap import load_beatmap
+from engine.judge import HitJudge
+from engine.note_arrays import create_note_lane
+from engine.note_pool import NotePool
+from engine.note_scheduler import NoteScheduler
+from engine.replay import REPLAYS_DIR, ReplayRecorder, replay_path
+from engine.sound_bank import shared_note_sound_bank
+from engine.timeline import SongTimeline
+from utils.asset_loader import AssetHandle, AssetLoader, shared_asset_loader
+from utils.fonts import get_font
+from utils.log import shared_log
 from .base import BaseScene
 from utils.constants import (
     COLOR_BACKGROUND,
@@ -18,27 +30,98 @@ from utils.constants import (
     COLOR_YELLOW_NOTE,
     COLOR_PERFECT_HIT,
     COLOR_GOOD_HIT,
+    COLOR_BAD_HIT,
     COLOR_MISS,
     COLOR_PRIMARY,
     COLOR_TEXT,
     COLOR_TEXT_MUTED,
 )
+from utils.note_sprites import NoteSpriteAtlas
+from utils.static_layer import StaticLayer
+from utils.text_cache import render_text
 from .music_select import MusicSelectScene
 
+NOTE_COLORS = {
+    "g": COLOR_PINK_NOTE,
+    "a": COLOR_BLUE_NOTE,
+    "m": COLOR_YELLOW_NOTE,
+    "f": COLOR_GREEN_NOTE,
+}
+
+# "objects" (padrão) ou "arrays" para o armazenamento vetorizado com NumPy
+NOTE_STORE_BACKEND = os.environ.get("ENGRENADA_NOTE_STORE", "objects")
+
+# Acertos e erros vão para a categoria "judge" em DEBUG (ENGRENADA_LOG="judge=debug")
+log = shared_log()
+
+NOTE_CLASSES = {note_cls.NOTE_TYPE: note_cls for note_cls in (Grave, Agudo, Mao, Flam)}
+NOTE_SOUNDS = {note_type: note_cls.SOUND_PATH for note_type, note_cls in NOTE_CLASSES.items()}
+
+IMAGES_DIR = Path(__file__).resolve().parents[1] / "assets" / "images"
+LANE_HEIGHT = 200
+# Diferença simulação x timeline (s) abaixo da qual não há correção: só ruído de ponto flutuante
+SIM_SYNC_DEADBAND = 1e-6
+REPIQUE_HEIGHT = LANE_HEIGHT + 10
+REPIQUE_SPRITES = {
+    "neutro": "repique_neutro.png",
+    "perfeito": "repique_perfeito.png",
+    "bom": "repique_bom.png",
+    "erro": "repique_erro.png",
+}
+FONT_SIZES = {
+    "stats": 36,
+    "results_title": 72,
+    "results": 40,
+    "results_hint": 32,
+    "legend": 30,
+}
+
 class GameplayScene(BaseScene):
     """Cena onde ocorre toda a jogabilidade"""
-    def __init__(self, app, song_data: dict):
+
+    # Presa à música escolhida: cada partida é uma instância nova
+    CACHEABLE = False
+
+    def __init__(
+        self,
+        app,
+        song_data: dict,
+        note_store: str = NOTE_STORE_BACKEND,
+        assets: Optional[dict[str, AssetHandle]] = None,
+        *,
+        clock: Optional[Callable[[], float]] = None,
+        audio_position: Optional[Callable[[], int]] = None,
+    ):
         self.key_cooldown = 10  # ms entre hits da mesma tecla
-        self.last_key_hit_time = {}  # key -> ticks
+        self.last_key_hit_time = {}  # key -> tempo da música (s) do último hit
+        # Estado do teclado consultado nas combinações; o simulador headless o substitui
+        self.key_state: Callable[[], Sequence[bool]] = pygame.key.get_pressed
         self.app = app
         self.song_data = song_data
         self.note_radius = 160 // 3
         self.note_speed = 450
         self.hit_area_x = 300
         self.hit_tolerance = 80  # Raio da hit area
-        self.notes = []  # Notas ativas na tela
-        self.note_queue = []  # Notas aguardando spawn (do CSV)
-        self.start_time = None  # Timestamp do início da música
+        # Janelas de acerto com a mesma sensação da versão em pixels: perfeito dentro do raio
+        # da nota, bom até 2x o raio da hit area e erro quando a nota passa da borda dela
+        self.judge = HitJudge.from_pixels(
+            self.note_speed,
+            perfect_px=self.note_radius,
+            good_px=self.hit_tolerance * 2,
+            late_px=self.hit_tolerance,
+        )
+        self.note_sprites = NoteSpriteAtlas(NOTE_COLORS, fallback_type="f")
+        self.note_pool = NotePool(NOTE_CLASSES)  # Instâncias reaproveitadas entre spawns
+        self.live_notes = create_note_lane(note_store, release=self.note_pool.release)  # Notas vivas na tela
+        self.scheduler = NoteScheduler([], [])  # Cursor sobre o chart compacto
+        self.chart_id: Optional[bytes] = None  # SHA-1 do CSV, identifica o chart nos replays
+        self.replay_dir: Optional[Path] = REPLAYS_DIR  # None desliga a gravação em disco
+        self.music_loaded = False
+
+        # Assets pedidos pela LoadingScene; sem ela, são carregados aqui mesmo
+        if assets is None:
+            assets = self.request_assets(shared_asset_loader(), song_data)
+        self.assets = {name: handle.wait() for name, handle in assets.items()}
         
         # Estatísticas
         self.hits = 0
@@ -48,27 +131,31 @@ class GameplayScene(BaseScene):
         self.score = 0
         
         # Fontes para UI
-        self.stats_font = pygame.font.Font(None, 36)
-        self.results_title_font = pygame.font.Font(None, 72)
-        self.results_font = pygame.font.Font(None, 40)
-        self.results_hint_font = pygame.font.Font(None, 32)
-        self.legend_font = pygame.font.Font(None, 30)
-
-        # Inicializa posições da lane
-        height = self.app.screen.get_height()
-        self.lane_bottom = height // 2
-        self.lane_top = self.lane_bottom - 200
-        self.lane_rect = pygame.Rect(0, self.lane_top, self.app.screen.get_width(), 200)
-
-        # Calcula tempo para a nota chegar à hit_area
-        width = self.app.screen.get_width()
-        spawn_x = width + self.note_radius
-        distance = spawn_x - self.hit_area_x
-        self.anticipation_time = distance / self.note_speed  # Em segundos
+        self.stats_font = self._asset_font("stats")
+        self.results_title_font = self._asset_font("results_title")
+        self.results_font = self._asset_font("results")
+        self.results_hint_font = self._asset_font("results_hint")
+        self.legend_font = self._asset_font("legend")
+
+        # Inicializa posições da lane e o tempo para a nota chegar à hit_area
+        self._apply_layout(self.app.screen.get_size())
+
+        # Tempo da música ancorado no mixer (negativo durante a antecipação)
+        # ``clock``/``audio_position`` permitem um relógio virtual (ver benchmarks.headless)
+        timeline_options = {}
+        if clock is not None:
+            timeline_options["clock"] = clock
+        if audio_position is not None:
+            timeline_options["audio_position"] = audio_position
+        self.timeline = SongTimeline(self.anticipation_time, **timeline_options)
+        # Relógio da simulação: avança exatamente ``dt`` por tick e segue a timeline
+        self.sim_song_time = -self.anticipation_time
+        self.tick_dt = 0.0
+        self.render_alpha = 1.0
 
         # Feedback visual
         self.flash_duration_ms = 180
-        self.hit_flash_timer_ms = 0
+        self.hit_flash_timer_ms = 0.0
         self.hit_flash_color = None
 
         # Estados de término
@@ -85,134 +172,197 @@ class GameplayScene(BaseScene):
         self.results_message = ""
 
         # Repique visual (feedback do último hit)
-        self.repique_target_height = (self.lane_bottom - self.lane_top) + 10
+        self.repique_target_height = REPIQUE_HEIGHT
         self.repique_images: dict[str, pygame.Surface] = {}
         self.repique_state = "neutro"
         self.repique_timer = 0.0
         self.repique_anchor_top = 0
         self.repique_anchor_right = 0
         self._load_repique_sprites()
+
+        # Modo dirty-rect (GameApp --dirty-rects): regiões redesenhadas no último frame
+        self._full_redraw = True
+        self._dirty_rects: Optional[list[pygame.Rect]] = None
+        self._last_strip_rect: Optional[pygame.Rect] = None
+        self._last_hud_rect: Optional[pygame.Rect] = None
+        self._last_hud_values: Optional[tuple[int, int, int]] = None
+        self._last_surface_size: Optional[tuple[int, int]] = None
+
+        # Fundo, lane, brilho da hit area e legenda compostos uma vez por resolução
+        self.static_layer = StaticLayer(self._build_static_layer)
         
+        # Sons das notas decodificados uma única vez e compartilhados entre partidas
+        self.sound_bank = shared_note_sound_bank(NOTE_SOUNDS)
+        self.sound_bank.preload({
+            note_type: self.assets.get(f"sound:{note_type}") for note_type in NOTE_SOUNDS
+        })
+
         self._load_beatmap()
+        # Teclas da partida, gravadas para reprodução (ver engine.replay)
+        self.replay_recorder: Optional[ReplayRecorder] = ReplayRecorder(self.chart_id)
         self._start_music()
 
+    @classmethod
+    def request_assets(cls, loader: AssetLoader, song_data) -> dict[str, AssetHandle]:
+        """Dispara em threads auxiliares o carregamento de tudo que a partida usa"""
+        handles = {
+            "beatmap": loader.call("beatmap", load_beatmap, song_data.csv_path),
+            "music": loader.music(song_data.mp3_path),
+        }
+        for state, filename in REPIQUE_SPRITES.items():
+            handles[f"repique:{state}"] = loader.image(IMAGES_DIR / filename, alpha=True, height=REPIQUE_HEIGHT)
+        for name, size in FONT_SIZES.items():
+            handles[f"font:{name}"] = loader.font(None, size)
+        if not shared_note_sound_bank(NOTE_SOUNDS).loaded:
+            for note_type, path in NOTE_SOUNDS.items():
+                handles[f"sound:{note_type}"] = loader.sound(path)
+        return handles
+
+    def _asset_font(self, name: str) -> pygame.font.Font:
+        return self.assets.get(f"font:{name}") or get_font(FONT_SIZES[name])
+
     def _load_beatmap(self) -> None:
-        """Carrega timestamps das notas do arquivo CSV"""
+        """Usa o beatmap compilado carregado em segundo plano (regenerado a partir do CSV quando desatualizado)"""
         try:
-            with open(self.song_data.csv_path, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    hit_time = float(row.get('time', 0))  # Tempo quando nota deve estar na hit_area
-                    note_type = row.get('note', 'g').lower()
-                    
-                    if note_type not in ['g', 'a', 'm', 'f']:
-                        print(f"Tipo de nota inválido '{note_type}', usando 'g'")
-                        note_type = 'g'
-                        
-                    spawn_time = hit_time
-                    
-                    if note_type == 'a': self.note_queue.append(Agudo(spawn_time, hit_time))
-                    if note_type == 'g': self.note_queue.append(Grave(spawn_time, hit_time))
-                    if note_type == 'f': self.note_queue.append(Flam(spawn_time, hit_time))
-                    if note_type == 'm': self.note_queue.append(Mao(spawn_time, hit_time))
-            
-            self.note_queue.sort(key=lambda n: n.spawn_time)
-            print(f"Carregadas {len(self.note_queue)} notas do beatmap")
-            print(f"Tempo de antecipação: {self.anticipation_time:.2f}s")
-            
+            beatmap = self.assets.get("beatmap")
+            if beatmap is None:
+                raise RuntimeError("beatmap indisponível")
+            note_types = beatmap.note_types
+            self.scheduler = NoteScheduler(beatmap.hit_times, note_types, lead_time=self.anticipation_time)
+            self.chart_id = beatmap.digest
+            log.info(
+                "gameplay", "beatmap_loaded",
+                notes=len(self.scheduler), source=beatmap.source, anticipation=round(self.anticipation_time, 2),
+            )
+
             # Debug: mostra as 5 primeiras notas
-            for i, note in enumerate(self.note_queue[:5]):
-                print(f"Nota {i+1}: spawn={note.spawn_time:.2f}s, tipo={note.note_type}")
-        
+            for i in range(min(5, len(self.scheduler))):
+                log.debug("gameplay", "note", index=i + 1, spawn=round(self.scheduler.spawn_time(i), 2), type=note_types[i])
+
         except Exception as e:
-            print(f"Erro ao carregar beatmap: {e}")
-            self.note_queue = []
+            log.error("gameplay", "beatmap_failed", error=e)
+            self.scheduler = NoteScheduler([], [], lead_time=self.anticipation_time)
 
     def _start_music(self) -> None:
-        """Inicia a reprodução da música após o tempo de antecipação"""
+        """Carrega a música e inicia a contagem da antecipação na timeline"""
         try:
-            pygame.mixer.music.load(self.song_data.mp3_path)
+            music = self.assets.get("music")
+            if music is not None:
+                # Buffer lido pelo loader; a extensão orienta o decodificador do SDL_mixer
+                pygame.mixer.music.load(music, Path(self.song_data.mp3_path).suffix.lstrip("."))
+            else:
+                pygame.mixer.music.load(self.song_data.mp3_path)
             pygame.mixer.music.set_volume(0.4)
-            
-            # Marca o tempo inicial ANTES de tocar
-            self.start_time = pygame.time.get_ticks()
-            
-            # Agenda a música para tocar após o tempo de antecipação
-            delay_ms = int(self.anticipation_time * 1000)  # Converte para milissegundos
-            pygame.time.set_timer(pygame.USEREVENT + 1, delay_ms, 1)  # Timer único
-            
-            print(f"Música iniciará em {self.anticipation_time:.2f}s")
+            self.music_loaded = True
+            log.info("gameplay", "music_loaded", starts_in=round(self.anticipation_time, 2))
         except pygame.error as e:
-            print(f"Erro ao carregar música: {e}")
+            log.error("gameplay", "music_failed", error=e)
+
+        # A timeline dispara o áudio ao fim da antecipação (ver _sync_timeline)
+        self.timeline.start()
+
+    def _sync_timeline(self) -> None:
+        """Dispara o áudio no fim da antecipação e corrige o drift da timeline."""
+        if self.timeline.should_start_audio():
+            # Depois de um seek o áudio começa do meio da faixa
+            start = self.timeline.now()
+            start = start if start > 0.05 else 0.0
+            if self.music_loaded:
+                pygame.mixer.music.play(start=start)
+                log.info("gameplay", "music_started", start=round(start, 3))
+            self.timeline.mark_audio_started(start)
+        self.timeline.update()
+
+    def _apply_layout(self, size: tuple[int, int]) -> None:
+        """Calcula a geometria da lane e a antecipação para a resolução informada.
+
+        Como as posições das notas saem do ``hit_time``, trocar de resolução no
+        meio da música não exige reposicionar as notas já na tela.
+        """
+        width, height = size
+        self.lane_bottom = height // 2
+        self.lane_top = self.lane_bottom - LANE_HEIGHT
+        self.lane_rect = pygame.Rect(0, self.lane_top, width, LANE_HEIGHT)
 
-    def spawn_note(self, note: Note) -> None:
-        width = self.app.screen.get_width()
-        note.x = width + self.note_radius
-        note.y = self.lane_bottom - 100
-        note.spawned = True
-        note.active = (len([n for n in self.notes if getattr(n, "state", None) is None]) == 0)
-        note.state = None        # None | 'fading' | 'falling'
-        note.result = None       # 'perfect' | 'good' | 'miss'
-        note.fade_elapsed = 0.0
-        note.fade_total = 0.4    # segundos
-        note.alpha = 255
-        self.notes.append(note)
-
-    def _activate_next_note(self) -> None:
-        candidates = [n for n in self.notes if n.state is None]
-        for n in self.notes:
-            if n.state is None:
-                n.active = False
-        if not candidates:
+        spawn_x = width + self.note_radius
+        distance = spawn_x - self.hit_area_x
+        self.anticipation_time = distance / self.note_speed  # Em segundos
+        self.scheduler.lead_time = self.anticipation_time
+        self._layout_size = size
+
+    def seek(self, song_time: float) -> None:
+        """Reposiciona a partida em ``song_time`` (ex.: modo prática).
+
+        As notas vivas são descartadas e o cursor volta para a primeira nota
+        ainda julgável; o próximo ``update`` as recoloca nas posições corretas e
+        ``_sync_timeline`` retoma o áudio a partir do novo instante.
+        """
+        self.live_notes.clear()
+        self.last_key_hit_time.clear()
+        # Um replay só é reproduzível a partir do início da música
+        self.replay_recorder = None
+        self.scheduler.seek(self.judge.miss_deadline(song_time))
+        if self.music_loaded:
+            pygame.mixer.music.stop()
+        self.timeline.seek(song_time)
+        self.sim_song_time = song_time
+
+    def _advance_song_time(self, dt: float) -> float:
+        """Avança o relógio da simulação exatamente um tick."""
+        self.tick_dt = dt
+        self.sim_song_time += dt
+        return self.sim_song_time
+
+    def interpolate(self, alpha: float) -> None:
+        """Guarda o fator de interpolação e ressincroniza a simulação com a timeline.
+
+        Depois dos ticks do frame, a simulação deve estar ``alpha`` tick atrás da
+        timeline. Diferenças pequenas (drift do mixer corrigido pela timeline) são
+        puxadas a cada frame na taxa ``correction_rate`` da timeline, limitadas a
+        meio tick para a rolagem não dar saltos. Abaixo de ``SIM_SYNC_DEADBAND`` é
+        só arredondamento de ponto flutuante, e corrigi-lo tornaria a simulação
+        dependente da cadência de frames. Uma diferença maior que
+        ``snap_threshold`` (travada maior que o teto do acumulador, início do
+        áudio) é corrigida de uma vez.
+        """
+        self.render_alpha = alpha
+        if self.state != "playing" or not self.timeline.started:
             return
-        nxt = min(candidates, key=lambda n: n.hit_time)
-        nxt.active = True
+        error = self.timeline.now() - alpha * self.tick_dt - self.sim_song_time
+        if abs(error) > self.timeline.snap_threshold:
+            self.sim_song_time += error
+        elif abs(error) > SIM_SYNC_DEADBAND:
+            limit = self.tick_dt * 0.5
+            self.sim_song_time += max(-limit, min(limit, error * self.timeline.correction_rate))
+
+    def spawn_note(self, index: int) -> None:
+        """Instancia (via pool) a nota ``index`` do chart na borda direita da lane."""
+        hit_time = self.scheduler.hit_times[index]
+        note = self.note_pool.acquire(
+            self.scheduler.note_types[index],
+            self.scheduler.spawn_time(index),
+            hit_time,
+        )
+        note.spawned = True
+        self.live_notes.push(note)
 
     def _trigger_flash(self, color: tuple[int,int,int]) -> None:
         self.hit_flash_color = color
         self.hit_flash_timer_ms = self.flash_duration_ms
 
-    def _start_fade_animation(self, note: Note) -> None:
-        note.state = 'fading'
-        note.fade_elapsed = 0.0
-
-    def _start_miss_animation(self, note: Note) -> None:
-        note.state = 'falling'
-        note.fade_elapsed = 0.0
-        note.vy = 420   # velocidade queda px/s
-
     def _load_repique_sprites(self) -> None:
-        """Carrega e redimensiona as imagens do repique utilizado como feedback."""
-        base_path = Path(__file__).resolve().parents[1] / "assets" / "images"
+        """Usa as imagens do repique já decodificadas e redimensionadas pelo loader."""
         lane_height = self.lane_bottom - self.lane_top
         target_height = max(1, self.repique_target_height)
 
-        sprite_map = {
-            "neutro": "repique_neutro.png",
-            "perfeito": "repique_perfeito.png",
-            "bom": "repique_bom.png",
-            "erro": "repique_erro.png",
-        }
-
-        for state, filename in sprite_map.items():
-            path = base_path / filename
-            try:
-                image = pygame.image.load(str(path)).convert_alpha()
-            except pygame.error as exc:  # noqa: BLE001
-                print(f"Erro ao carregar sprite '{filename}': {exc}")
+        for state in REPIQUE_SPRITES:
+            image = self.assets.get(f"repique:{state}")
+            if image is None:
                 placeholder = pygame.Surface((target_height, target_height), pygame.SRCALPHA)
                 placeholder.fill((0, 0, 0, 0))
                 self.repique_images[state] = placeholder
                 continue
-
-            if image.get_height() <= 0:
-                self.repique_images[state] = image
-                continue
-
-            scale_ratio = target_height / image.get_height()
-            target_width = max(1, int(image.get_width() * scale_ratio))
-            scaled = pygame.transform.smoothscale(image, (target_width, target_height))
-            self.repique_images[state] = scaled
+            self.repique_images[state] = image
 
         if "neutro" not in self.repique_images:
             placeholder = pygame.Surface((target_height, target_height), pygame.SRCALPHA)
@@ -243,30 +393,77 @@ class GameplayScene(BaseScene):
         self.repique_state = new_state
         self.repique_timer = 0.0 if new_state == "neutro" else 0.5
 
-    def _update_note_animations(self, dt: float) -> None:
-        to_remove = []
-        for note in self.notes:
-            if note.state in ('fading', 'falling'):
-                note.fade_elapsed += dt
-                progress = note.fade_elapsed / note.fade_total
-                note.alpha = 255 * (1 - progress)
-                if note.state == 'falling':
-                    note.y += getattr(note, 'vy', 400) * dt
-                if progress >= 1.0 or note.alpha <= 0:
-                    to_remove.append(note)
-        for n in to_remove:
-            if n in self.notes:
-                self.notes.remove(n)
+    def invalidate(self) -> None:
+        self._full_redraw = True
+
+    def get_dirty_rects(self) -> Optional[list[pygame.Rect]]:
+        return self._dirty_rects
 
     def render(self, surface: pygame.Surface) -> None:
-        """Renderiza layout da cena"""
-        surface.fill(COLOR_YELLOW_BACKGROUND)
-        self.render_lane(surface)
-        self.render_hit_area(surface)
-        self.render_notes(surface)
-        self._render_repique(surface)
-        self.render_stats(surface)
-        self._render_legend(surface)
+        """Renderiza layout da cena (apenas as regiões dinâmicas no modo dirty-rect)"""
+        if surface.get_size() != self._layout_size:
+            self._apply_layout(surface.get_size())
+        strip_rect = self._lane_strip_rect(surface)
+        hud_values = (self.hits, self.goods, self.misses)
+        hud_rect = self._hud_rect()
+
+        partial = (
+            getattr(self.app, "dirty_rects", False)
+            and not self._full_redraw
+            and self.state == "playing"
+            and surface.get_size() == self._last_surface_size
+        )
+        if partial:
+            # Lane, notas (inclusive as que caem) e repique; a região anterior apaga o rastro
+            dirty = [strip_rect.union(self._last_strip_rect)]
+            if hud_values != self._last_hud_values:
+                dirty.append(hud_rect.union(self._last_hud_rect))
+            for rect in dirty:
+                surface.set_clip(rect)
+                self._render_frame(surface)
+            surface.set_clip(None)
+            self._dirty_rects = dirty
+        else:
+            self._render_frame(surface)
+            self._dirty_rects = None
+
+        self._full_redraw = False
+        self._last_strip_rect = strip_rect
+        self._last_hud_rect = hud_rect
+        self._last_hud_values = hud_values
+        self._last_surface_size = surface.get_size()
+
+    def _lane_strip_rect(self, surface: pygame.Surface) -> pygame.Rect:
+        """Faixa da tela que muda a cada frame: lane, repique e notas em queda."""
+        top = min(self.lane_top, self.repique_anchor_top) - 2
+        bottom = max(self.lane_bottom, self.repique_anchor_top + self.repique_target_height) + 2
+        for _, _, y, _ in self._note_draw_items():
+            bottom = max(bottom, int(y) + self.note_radius + 2)
+        bottom = min(bottom, surface.get_height())
+        return pygame.Rect(0, top, surface.get_width(), bottom - top)
+
+    def _hud_lines(self) -> list[tuple[str, tuple[int, int, int], tuple[int, int]]]:
+        return [
+            (f"Perfeitas: {self.hits}", (0, 255, 0), (20, 20)),
+            (f"Boas: {self.goods}", (0, 0, 255), (20, 60)),
+            (f"Erros: {self.misses}", (255, 0, 0), (20, 100)),
+        ]
+
+    def _hud_rect(self) -> pygame.Rect:
+        rects = [pygame.Rect(pos, self.stats_font.size(text)) for text, _, pos in self._hud_lines()]
+        return rects[0].unionall(rects[1:])
+
+    def _render_frame(self, surface: pygame.Surface) -> None:
+        # Fundo, lane, brilho da hit area e legenda vêm prontos da camada estática
+        with self.span("render_static"):
+            self.static_layer.blit(surface, self._static_layer_key())
+        self.render_hit_flash(surface)
+        with self.span("render_notes"):
+            self.render_notes(surface)
+        with self.span("render_repique"):
+            self._render_repique(surface)
+        with self.span("render_stats"):
+            self.render_stats(surface)
 
         overlay_alpha = 0
         if self.state == "ending_fade":
@@ -287,10 +484,20 @@ class GameplayScene(BaseScene):
         if self.results_visible:
             self._render_results(surface)
 
+    def _static_layer_key(self) -> tuple[int, int, int, int]:
+        return (self.lane_top, self.lane_bottom, self.hit_area_x, self.hit_tolerance)
+
+    def _build_static_layer(self, surface: pygame.Surface) -> None:
+        """Compõe as partes da cena que não mudam durante a partida"""
+        surface.fill(COLOR_YELLOW_BACKGROUND)
+        self.render_lane(surface)
+        self.render_hit_area(surface)
+        self._render_legend(surface)
+
     def render_lane(self, surface: pygame.Surface) -> None:
         """Desenha a lane em que percorrem as notas"""
         width = surface.get_width()
-        self.lane_rect = pygame.Rect(0, self.lane_top, width, 200)
+        self.lane_rect = pygame.Rect(0, self.lane_top, width, LANE_HEIGHT)
 
         pygame.draw.rect(surface, COLOR_BACKGROUND, self.lane_rect)
         border_thickness = 2
@@ -298,7 +505,7 @@ class GameplayScene(BaseScene):
         pygame.draw.line(surface, (255, 255, 255), (0, self.lane_bottom - 1), (width - 1, self.lane_bottom - 1), border_thickness)
 
     def render_hit_area(self, surface: pygame.Surface) -> None:
-        """Desenha a área de acerto das notas"""
+        """Desenha o brilho fixo da área de acerto das notas"""
         hit_center_y = self.lane_bottom - 100
         base = pygame.Surface((self.hit_tolerance * 2, self.hit_tolerance * 2), pygame.SRCALPHA)
         # brilho base
@@ -306,41 +513,45 @@ class GameplayScene(BaseScene):
         pygame.draw.circle(base, (255, 255, 255, 160), (self.hit_tolerance, self.hit_tolerance), 2 * self.hit_tolerance // 3)
         surface.blit(base, (self.hit_area_x - self.hit_tolerance, hit_center_y - self.hit_tolerance))
 
-        # flash temporário
+    def render_hit_flash(self, surface: pygame.Surface) -> None:
+        """Desenha o flash temporário do último acerto sobre a área de acerto"""
+        hit_center_y = self.lane_bottom - 100
         if self.hit_flash_timer_ms > 0 and self.hit_flash_color:
             alpha = int(180 * (self.hit_flash_timer_ms / self.flash_duration_ms))
             flash = pygame.Surface((self.hit_tolerance * 2, self.hit_tolerance * 2), pygame.SRCALPHA)
             pygame.draw.circle(flash, (*self.hit_flash_color, alpha), (self.hit_tolerance, self.hit_tolerance), self.hit_tolerance)
             surface.blit(flash, (self.hit_area_x - self.hit_tolerance, hit_center_y - self.hit_tolerance))
     
-    def render_note(self, surface: pygame.Surface, note_center_x: int, note_center_y: int, note: Note) -> None:
-        if note.note_type == "g": note_color = COLOR_PINK_NOTE
-        elif note.note_type == "a": note_color = COLOR_BLUE_NOTE
-        elif note.note_type == "m": note_color = COLOR_YELLOW_NOTE
-        else: note_color = COLOR_GREEN_NOTE
-
+    def render_note(self, surface: pygame.Surface, note_center_x: int, note_center_y: int, note_type: str, alpha: float) -> None:
         radius = self.note_radius
-        note_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        alpha = max(0, min(255, int(note.alpha)))
-        pygame.draw.circle(note_surf, (*note_color, alpha), (radius, radius), radius)
-        outline_width = max(1, radius // 8)
-        pygame.draw.circle(note_surf, (0, 0, 0, alpha), (radius, radius), radius, outline_width)
-        surface.blit(note_surf, (note_center_x - radius, note_center_y - radius))
+        sprite = self.note_sprites.sprite(note_type, alpha)
+        surface.blit(sprite, (note_center_x - radius, note_center_y - radius))
 
     def render_notes(self, surface: pygame.Surface) -> None:
         """Renderiza todas as notas ativas"""
-        for note in self.notes:
-            self.render_note(surface, int(note.x), note.y, note)
+        self.note_sprites.ensure(self.note_radius, surface.get_size())
+        for note_type, x, y, alpha in self._note_draw_items():
+            self.render_note(surface, int(x), int(y), note_type, alpha)
+
+    def _note_draw_items(self):
+        """Itens de desenho das notas no instante exibido.
+
+        As posições são calculadas a partir do ``hit_time`` em um instante entre o
+        tick anterior e o atual, conforme a fração já decorrida do próximo tick.
+        """
+        rewind = (1.0 - self.render_alpha) * self.tick_dt if self.state == "playing" else 0.0
+        return self.live_notes.draw_items(
+            self.sim_song_time - rewind,
+            note_speed=self.note_speed,
+            hit_x=self.hit_area_x,
+            lane_y=self.lane_bottom - 100,
+            rewind=rewind,
+        )
 
     def render_stats(self, surface: pygame.Surface) -> None:
         """Renderiza contador de acertos e erros"""
-        hits_text = self.stats_font.render(f"Perfeitas: {self.hits}", True, (0, 255, 0))
-        goods_text = self.stats_font.render(f"Boas: {self.goods}", True, (0, 0, 255))
-        misses_text = self.stats_font.render(f"Erros: {self.misses}", True, (255, 0, 0))
-        
-        surface.blit(hits_text, (20, 20))
-        surface.blit(goods_text, (20, 60))
-        surface.blit(misses_text, (20, 100))
+        for text, color, position in self._hud_lines():
+            surface.blit(render_text(self.stats_font, text, True, color), position)
 
     def _render_legend(self, surface: pygame.Surface) -> None:
         entries = [
@@ -357,7 +568,7 @@ class GameplayScene(BaseScene):
         y = min(surface.get_height() - self.legend_font.get_height() - 20, y)
 
         for key_label, name, color in entries:
-            text_surface = self.legend_font.render(f"{key_label} - {name}", True, COLOR_TEXT)
+            text_surface = render_text(self.legend_font, f"{key_label} - {name}", True, COLOR_TEXT)
             entry_height = max(icon_radius * 2, text_surface.get_height())
             entry_surface = pygame.Surface((icon_radius * 2 + 10 + text_surface.get_width(), entry_height), pygame.SRCALPHA)
 
@@ -394,6 +605,7 @@ class GameplayScene(BaseScene):
         _blit_line(self.results_font, f"Pontuação: {self.score}", COLOR_TEXT)
         _blit_line(self.results_font, f"Perfeitas: {self.hits}", COLOR_TEXT)
         _blit_line(self.results_font, f"Boas: {self.goods}", COLOR_TEXT)
+        _blit_line(self.results_font, f"Ruins: {self.bad_hits}", COLOR_TEXT)
         _blit_line(self.results_font, f"Erros: {self.misses}", COLOR_TEXT)
 
         if self.results_message:
@@ -402,77 +614,97 @@ class GameplayScene(BaseScene):
         hint_text = "Pressione Enter para voltar"
         _blit_line(self.results_hint_font, hint_text, COLOR_TEXT_MUTED, gap=0)
 
-    def check_hit(self, note_type: str) -> bool:
-        """Verifica acerto apenas na nota marcada como active."""
+    def check_hit(self, note_type: str, input_time: float | None = None) -> bool:
+        """Julga a entrada contra a nota ativa comparando tempos em ms.
+
+        ``input_time`` é o instante da tecla no relógio da música; quando omitido,
+        usa o tempo atual da timeline.
+        """
+        if input_time is None:
+            input_time = self.timeline.now()
+
+        # Notas vencidas até o instante da tecla saem antes do julgamento, de modo
+        # que o resultado não depende de quantos ticks rodaram antes do evento
+        self._expire_missed(input_time)
+
         # Busca a nota ativa
-        active_note = next((n for n in self.notes if n.active and n.state is None), None)
+        active_note = self.live_notes.active()
         
         if active_note is None:
             self.misses += 1
             self._trigger_flash(COLOR_MISS)
             self._set_repique_state("erro")
-            print(f"MISS! Nenhuma nota ativa para {note_type}")
+            log.debug("judge", "miss", reason="no_active_note", key=note_type, t=input_time)
             return False
 
-        distance = abs(active_note.x - self.hit_area_x)
+        active_type, active_hit_time = active_note
+        judgement = self.judge.judge(input_time, active_hit_time)
 
         # Verifica se está dentro da janela de acerto
-        if distance > self.hit_tolerance * 2:
+        if judgement is None:
             self._trigger_flash(COLOR_MISS)
             self.misses += 1
             self._set_repique_state("erro")
-            print(f"MISS! Nota ativa fora da hit_area")
+            log.debug("judge", "miss", reason="outside_window", key=note_type, t=input_time, note_t=active_hit_time)
             return False
 
         # Verifica o tipo da nota
-        if active_note.note_type == note_type:
-            perfect_tolerance = 160 // 3
-
+        if active_type == note_type:
             # Verifica qualidade do acerto
-            if distance > perfect_tolerance:
+            if judgement == 'perfect':
+                self.hits += 1
+                self.score += 100
+                self._trigger_flash(COLOR_PERFECT_HIT)
+                self._set_repique_state("perfeito")
+                log.debug("judge", "perfect", key=note_type, t=input_time, note_t=active_hit_time)
+            elif judgement == 'good':
                 self.goods += 1
                 self.score += 50
-                active_note.result = 'good'
                 self._trigger_flash(COLOR_GOOD_HIT)
                 self._set_repique_state("bom")
-                self._start_fade_animation(active_note)
-                print(f"GOOD! Tipo: {note_type}")
+                log.debug("judge", "good", key=note_type, t=input_time, note_t=active_hit_time)
             else:
-                self.hits += 1
-                self.score += 100
-                active_note.result = 'perfect'
-                self._trigger_flash(COLOR_PERFECT_HIT)
-                self._set_repique_state("perfeito")
-                self._start_fade_animation(active_note)
-                print(f"HIT! Tipo: {note_type}")
-
-            # Remove nota atual e ativa a próxima
-            self.notes.remove(active_note)
-            self._activate_next_note()
+                self.bad_hits += 1
+                self._trigger_flash(COLOR_BAD_HIT)
+                self._set_repique_state("neutro")
+                log.debug("judge", "bad", key=note_type, t=input_time, note_t=active_hit_time)
+            # Remove nota atual, ativa a próxima e anima a saída
+            self.live_notes.resolve_active(judgement)
             return True
         else:
-            active_note.key_mistaken = True # Registra que a nota já teve sua tecla confundida
+            self.live_notes.mistake_active() # Registra que a nota já teve sua tecla confundida
             self.misses += 1
             self._trigger_flash(COLOR_MISS)
             self._set_repique_state("erro")
-            print(f"MISS! Esperava {active_note.note_type}, recebeu {note_type}")
+            log.debug("judge", "miss", reason="wrong_key", key=note_type, expected=active_type, t=input_time)
             return False
+
+    def _event_song_time(self, event: pygame.event.Event) -> float:
+        """Converte o timestamp SDL do evento (ms) para o relógio da música.
+
+        O pygame 2.6 não expõe o timestamp nativo do SDL; nesse caso o evento é
+        datado no instante do despacho, ainda independente do frame renderizado.
+        Eventos de replay já trazem o instante gravado em ``song_time``.
+        """
+        recorded = getattr(event, "song_time", None)
+        if recorded is not None:
+            return recorded  # Evento reproduzido de um replay
+        song_time = self.timeline.now()
+        timestamp = getattr(event, "timestamp", None)
+        if timestamp is None:
+            return song_time
+        lag_ms = max(0, pygame.time.get_ticks() - int(timestamp))
+        return song_time - lag_ms / 1000.0
     
-    def _can_trigger(self, key: int) -> bool:
-        now = pygame.time.get_ticks()
-        last = self.last_key_hit_time.get(key, -10**9)
-        if now - last >= self.key_cooldown:
-            self.last_key_hit_time[key] = now
+    def _can_trigger(self, key: int, input_time: float) -> bool:
+        """Aplica o cooldown por tecla no relógio da música (independe do tempo real)."""
+        last = self.last_key_hit_time.get(key, float("-inf"))
+        if (input_time - last) * 1000 >= self.key_cooldown:
+            self.last_key_hit_time[key] = input_time
             return True
         return False
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        # Timer para iniciar a música
-        if event.type == pygame.USEREVENT + 1 and self.state == "playing":
-            pygame.mixer.music.play()
-            print("Música iniciada!")
-            return
-
         if self.state == "show_results":
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
                 self._start_exit_fade()
@@ -481,31 +713,40 @@ class GameplayScene(BaseScene):
         if self.state == "leaving" or self.state == "ending_fade":
             return
 
+        if event.type == pygame.KEYUP:
+            if self.replay_recorder is not None:
+                self.replay_recorder.record(event.key, False, self.key_state(), self._event_song_time(event))
+            return
+
         if event.type == pygame.KEYDOWN:
+            received_at = time.perf_counter()
+            input_time = self._event_song_time(event)
+            keys = self.key_state()
+            if self.replay_recorder is not None:
+                # O julgamento usa o instante quantizado, idêntico ao da reprodução
+                input_time = self.replay_recorder.record(event.key, True, keys, input_time)
+
             if event.key == pygame.K_ESCAPE:
                 pygame.mixer.music.stop()
-                pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Cancela timer
-                self.app.change_scene(MusicSelectScene(self.app))
-
-            keys = pygame.key.get_pressed()
+                self.app.show_scene(MusicSelectScene)
 
             # Reconhece combinação de teclas
             if keys[pygame.K_a] and keys[pygame.K_SPACE]:
-                if self._can_trigger(pygame.K_a) and self._can_trigger(pygame.K_SPACE):
-                    Flam.note_sound(self)
-                    self.check_hit("f")
+                if self._can_trigger(pygame.K_a, input_time) and self._can_trigger(pygame.K_SPACE, input_time):
+                    Flam.note_sound(self, received_at)
+                    self.check_hit("f", input_time)
                 return
 
             # Teclas individuais
-            if event.key == pygame.K_z and self._can_trigger(pygame.K_z):
-                Grave.note_sound(self)
-                self.check_hit("g")
-            elif event.key == pygame.K_a and self._can_trigger(pygame.K_a):
-                Agudo.note_sound(self)
-                self.check_hit("a")
-            elif event.key == pygame.K_SPACE and self._can_trigger(pygame.K_SPACE):
-                Mao.note_sound(self)
-                self.check_hit("m")
+            if event.key == pygame.K_z and self._can_trigger(pygame.K_z, input_time):
+                Grave.note_sound(self, received_at)
+                self.check_hit("g", input_time)
+            elif event.key == pygame.K_a and self._can_trigger(pygame.K_a, input_time):
+                Agudo.note_sound(self, received_at)
+                self.check_hit("a", input_time)
+            elif event.key == pygame.K_SPACE and self._can_trigger(pygame.K_SPACE, input_time):
+                Mao.note_sound(self, received_at)
+                self.check_hit("m", input_time)
 
     def update(self, dt: float) -> None:
         """Atualiza posição das notas e gerencia fases da partida."""
@@ -517,44 +758,25 @@ class GameplayScene(BaseScene):
                     self.repique_state = "neutro"
 
         if self.state == "playing":
-            if self.start_time is None:
+            if not self.timeline.started:
                 return
 
             if self.hit_flash_timer_ms > 0:
-                self.hit_flash_timer_ms -= int(dt * 1000)
+                self.hit_flash_timer_ms -= dt * 1000.0
                 if self.hit_flash_timer_ms <= 0:
-                    self.hit_flash_timer_ms = 0
+                    self.hit_flash_timer_ms = 0.0
                     self.hit_flash_color = None
 
-            current_time = pygame.time.get_ticks()
-            music_time = (current_time - self.start_time) / 1000.0
-
-            for note_data in self.note_queue:
-                if not note_data.spawned and music_time >= note_data.spawn_time:
-                    self.spawn_note(note_data)
-                    note_data.spawned = True
-
-            for note in self.notes:
-                note.x -= self.note_speed * dt
+            self._sync_timeline()
+            song_time = self._advance_song_time(dt)
 
-            notes_to_remove = []
-            for note in [n for n in self.notes if n.state is None]:
-                if note.x < (self.hit_area_x - self.hit_tolerance):
-                    notes_to_remove.append(note)
-                    if not note.key_mistaken:
-                        self.misses += 1
-                        note.result = 'miss'
-                        self._trigger_flash(COLOR_MISS)
-                        self._set_repique_state("erro")
-                        self._start_miss_animation(note)
-                        print(f"MISS! Nota passou: {note.note_type}")
+            with self.span("update_spawn"):
+                for index in self.scheduler.pop_due(song_time):
+                    self.spawn_note(index)
 
-            self._update_note_animations(dt)
-
-            for note in notes_to_remove:
-                self.notes.remove(note)
-                if any(n.active for n in self.notes if n.state is None) is False:
-                    self._activate_next_note()
+            with self.span("update_notes"):
+                self._expire_missed(song_time)
+                self.live_notes.advance(dt)
 
             if self._has_finished_song():
                 self._begin_end_sequence()
@@ -566,12 +788,19 @@ class GameplayScene(BaseScene):
         elif self.state == "leaving":
             self._update_exit_fade(dt)
                 
+    def _expire_missed(self, song_time: float) -> None:
+        """Contabiliza as notas cuja janela de acerto fechou até ``song_time``."""
+        # Notas vencidas estão sempre na frente da fila de pendentes
+        for missed_type in self.live_notes.pop_missed(self.judge.miss_deadline(song_time)):
+            self.misses += 1
+            self._trigger_flash(COLOR_MISS)
+            self._set_repique_state("erro")
+            log.debug("judge", "miss", reason="passed", expected=missed_type, t=song_time)
+
     def _has_finished_song(self) -> bool:
-        if self.notes:
+        if self.live_notes:
             return False
-        if not self.note_queue:
-            return True
-        return all(getattr(note, "spawned", False) for note in self.note_queue)
+        return self.scheduler.exhausted
 
     def _begin_end_sequence(self) -> None:
         if self.state != "playing":
@@ -580,7 +809,7 @@ class GameplayScene(BaseScene):
         self.end_fade_elapsed = 0.0
         self.end_overlay_alpha = 0
         pygame.mixer.music.fadeout(int(self.end_fade_duration * 1000))
-        pygame.time.set_timer(pygame.USEREVENT + 1, 0)
+        log.info("timeline", "drift_report", **self.timeline.drift_report())
 
     def _update_end_fade(self, dt: float) -> None:
         self.end_fade_elapsed += dt
@@ -603,26 +832,32 @@ class GameplayScene(BaseScene):
 
     def _record_play(self) -> None:
         self.score = self.hits * 100 + self.goods * 50
+        played_at = datetime.utcnow()
+        play_id = self._store_play(played_at)
+        self._save_replay(played_at, play_id)
+
+    def _store_play(self, played_at: datetime) -> int:
+        """Persiste a partida e devolve o id criado (0 quando não foi salva)."""
         player = getattr(self.app, "active_player", None)
         if player is None:
             self.results_message = "Nenhum jogador ativo – resultado não salvo."
-            return
+            return 0
 
         try:
             player_id = int(player["id"])
         except (KeyError, TypeError, ValueError):
             self.results_message = "Jogador inválido – resultado não salvo."
-            return
+            return 0
 
         try:
             play_model = self.app.models.play
         except Exception as exc:  # noqa: BLE001
-            print(f"Erro ao acessar modelo Play: {exc}")
+            log.error("db", "play_model_unavailable", error=exc)
             self.results_message = "Modelo de partidas indisponível."
-            return
+            return 0
 
         payload = {
-            "played_at": datetime.utcnow(),
+            "played_at": played_at,
             "music_name": getattr(self.song_data, "title", "Desconhecida"),
             "score": self.score,
             "player_id": player_id,
@@ -633,12 +868,27 @@ class GameplayScene(BaseScene):
         }
 
         try:
-            play_model.create(payload)
+            play_id = play_model.create(payload)
         except Exception as exc:  # noqa: BLE001
-            print(f"Erro ao salvar partida: {exc}")
+            log.error("db", "play_save_failed", error=exc)
             self.results_message = "Erro ao salvar partida."
-        else:
-            self.results_message = "Partida registrada com sucesso!"
+            return 0
+        self.results_message = "Partida registrada com sucesso!"
+        return int(play_id or 0)
+
+    def _save_replay(self, played_at: datetime, play_id: int) -> None:
+        """Grava o replay da partida com o placar final (e o id em ``plays``)."""
+        if self.replay_recorder is None or self.replay_dir is None:
+            return
+        replay = self.replay_recorder.replay
+        replay.play_id = play_id
+        replay.score = {"perfect": self.hits, "good": self.goods, "bad": self.bad_hits, "miss": self.misses}
+        try:
+            path = replay.save(replay_path(replay, played_at, self.replay_dir))
+        except OSError as exc:
+            log.error("replay", "save_failed", error=exc)
+            return
+        log.info("replay", "saved", path=path, bytes=path.stat().st_size)
 
     def _start_exit_fade(self) -> None:
         if self.state != "show_results":
@@ -654,4 +904,4 @@ class GameplayScene(BaseScene):
         self.exit_overlay_alpha = int(255 * progress)
         self.results_text_alpha = int(255 * (1 - progress))
         if progress >= 1.0:
-            self.app.change_scene(MusicSelectScene(self.app))
+            self.app.show_scene(MusicSelectScene)
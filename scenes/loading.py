@@ -0,0 +1,76 @@
+"""Cena de carregamento exibida enquanto os assets são lidos em segundo plano."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pygame
+
+from .base import BaseScene
+from utils.asset_loader import AssetHandle, AssetLoader
+from utils.constants import COLOR_BACKGROUND, COLOR_PRIMARY, COLOR_TEXT, COLOR_TEXT_MUTED
+from utils.fonts import get_font
+from utils.text_cache import render_text
+
+
+class LoadingScene(BaseScene):
+    """Mostra o progresso dos handles e troca para a próxima cena quando todos ficam prontos.
+
+    ``build_scene`` recebe o mesmo dicionário de handles (já finalizados) e
+    devolve a cena seguinte; ele só é chamado quando todos os assets estão
+    residentes, então a construção da cena não faz I/O.
+    """
+
+    CACHEABLE = False
+
+    def __init__(
+        self,
+        app,
+        handles: dict[str, AssetHandle],
+        build_scene: Callable[[dict[str, AssetHandle]], BaseScene],
+        *,
+        title: str = "Carregando",
+        back_scene: Callable[[], BaseScene] | None = None,
+    ) -> None:
+        super().__init__()
+        self.app = app
+        self.handles = handles
+        self.build_scene = build_scene
+        self.title = title
+        self.back_scene = back_scene
+        self.progress = 0.0
+        self.display_progress = 0.0
+        self.title_font = get_font(56)
+        self.hint_font = get_font(28)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and self.back_scene is not None:
+            self.app.change_scene(self.back_scene())
+
+    def update(self, dt: float) -> None:
+        self.progress = AssetLoader.progress(self.handles.values())
+        # Suaviza a barra para não saltar entre os poucos handles
+        self.display_progress += (self.progress - self.display_progress) * min(1.0, dt * 12)
+
+        if self.progress >= 1.0:
+            self.app.change_scene(self.build_scene(self.handles))
+
+    def render(self, surface: pygame.Surface) -> None:
+        self.draw_background(surface, COLOR_BACKGROUND)
+        width, height = surface.get_size()
+
+        title_surface = render_text(self.title_font, self.title, True, COLOR_PRIMARY)
+        surface.blit(title_surface, title_surface.get_rect(center=(width // 2, height // 2 - 50)))
+
+        bar_rect = pygame.Rect(0, 0, min(480, width - 80), 18)
+        bar_rect.center = (width // 2, height // 2 + 10)
+        pygame.draw.rect(surface, COLOR_TEXT_MUTED, bar_rect, width=2, border_radius=9)
+        fill_rect = bar_rect.inflate(-6, -6)
+        fill_rect.width = int(fill_rect.width * max(0.0, min(1.0, self.display_progress)))
+        if fill_rect.width > 0:
+            pygame.draw.rect(surface, COLOR_PRIMARY, fill_rect, border_radius=6)
+
+        finished = sum(1 for handle in self.handles.values() if handle.done)
+        hint = f"{finished}/{len(self.handles)} arquivos"
+        hint_surface = render_text(self.hint_font, hint, True, COLOR_TEXT)
+        surface.blit(hint_surface, hint_surface.get_rect(center=(width // 2, bar_rect.bottom + 30)))
@@ -17,7 +17,9 @@ from utils.constants import (
     SCREEN_HEIGHT,
 )
 from utils.buttons import Button, ButtonTheme
+from utils.fonts import get_font
 from utils.input_field import InputField
+from utils.text_cache import render_text
 
 
 SUBTITLE_TEXT = "Pressione um botão para começar"
@@ -30,15 +32,15 @@ class MenuScene(BaseScene):
         """Configura fontes, tema e layout inicial do menu."""
         super().__init__(background_name="menu_background.png")
         self.app = app
-        self.title_font = pygame.font.Font(None, 82)
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.button_font = pygame.font.Font(None, 42)
+        self.title_font = get_font(82)
+        self.subtitle_font = get_font(36)
+        self.button_font = get_font(42)
         self.theme = ButtonTheme()
         self.buttons = self._build_buttons()
-        self.player_input_font = pygame.font.Font(None, 30)
-        self.player_label_font = pygame.font.Font(None, 24)
-        self.player_button_font = pygame.font.Font(None, 28)
-        self.player_feedback_font = pygame.font.Font(None, 22)
+        self.player_input_font = get_font(30)
+        self.player_label_font = get_font(24)
+        self.player_button_font = get_font(28)
+        self.player_feedback_font = get_font(22)
         self.player_field = InputField(
             label="Jogador",
             placeholder="Digite seu nome",
@@ -82,10 +84,18 @@ class MenuScene(BaseScene):
         self._show_player_input = True
         self._update_player_mode()
         self._title_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)
+        self._title_shadow: pygame.Surface | None = None
         self._subtitle_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 + 60)
         self._layout_size = (0, 0)
         self._apply_layout(SCREEN_WIDTH, SCREEN_HEIGHT)
 
+    def on_enter(self) -> None:
+        """Ao voltar do cache, descarta hover e mensagens antigas."""
+        for button in self.buttons + [self.player_confirm_button, self.player_exit_button, self.player_logout_button]:
+            button.reset_hover()
+        self._clear_player_feedback()
+        self._update_player_mode()
+
     def _build_buttons(self) -> list[Button]:
         """Cria os botões com seus respectivos callbacks."""
         labels_callbacks = [
@@ -212,17 +222,20 @@ class MenuScene(BaseScene):
 
         self.draw_background(surface, COLOR_BACKGROUND)
 
-        title = self.title_font.render("Engrenada Hero", True, COLOR_PRIMARY)
+        title = render_text(self.title_font, "Engrenada Hero", True, COLOR_PRIMARY)
         title_rect = title.get_rect(center=self._title_pos)
 
-        title_shadow = self.title_font.render("Engrenada Hero", True, (0, 0, 0))
-        title_shadow = title_shadow.convert_alpha()
-        title_shadow.set_alpha(190)
+        title_shadow = self._title_shadow
+        if title_shadow is None:
+            # Cópia própria: a superfície do cache de texto não pode receber set_alpha
+            title_shadow = self.title_font.render("Engrenada Hero", True, (0, 0, 0)).convert_alpha()
+            title_shadow.set_alpha(190)
+            self._title_shadow = title_shadow
         shadow_rect = title_rect.move(4, 4)
         surface.blit(title_shadow, shadow_rect)
         surface.blit(title, title_rect)
 
-        subtitle = self.subtitle_font.render(SUBTITLE_TEXT, True, COLOR_TEXT_MUTED)
+        subtitle = render_text(self.subtitle_font, SUBTITLE_TEXT, True, COLOR_TEXT_MUTED)
         surface.blit(subtitle, subtitle.get_rect(center=self._subtitle_pos))
 
         for button in self.buttons:
@@ -232,7 +245,7 @@ class MenuScene(BaseScene):
             self.player_field.draw(surface)
         else:
             rect = self._player_display_rect
-            label_surface = self.player_label_font.render("Jogador", True, COLOR_TEXT)
+            label_surface = render_text(self.player_label_font, "Jogador", True, COLOR_TEXT)
             label_rect = label_surface.get_rect()
             label_rect.left = rect.left
             label_rect.bottom = rect.top - 8
@@ -252,7 +265,7 @@ class MenuScene(BaseScene):
                 text_color = COLOR_TEXT
             else:
                 text_color = COLOR_TEXT_MUTED
-            text_surface = self.player_input_font.render(display_text, True, text_color)
+            text_surface = render_text(self.player_input_font, display_text, True, text_color)
             text_rect = text_surface.get_rect()
             text_rect.left = rect.left + 12
             text_rect.centery = rect.centery
@@ -264,7 +277,8 @@ class MenuScene(BaseScene):
         self.player_exit_button.draw(surface)
 
         if self.player_feedback_text:
-            feedback_surface = self.player_feedback_font.render(
+            feedback_surface = render_text(
+                self.player_feedback_font,
                 self.player_feedback_text,
                 True,
                 self.player_feedback_color,
@@ -375,11 +389,11 @@ class MenuScene(BaseScene):
 
     def _on_play_selected(self) -> None:
         """Alterna para a cena de seleção de músicas"""
-        self.app.change_scene(MusicSelectScene(self.app))
+        self.app.show_scene(MusicSelectScene)
 
     def _on_add_music_selected(self) -> None:
         """Alterna para a cena de adição de músicas."""
-        self.app.change_scene(AddMusicScene(self.app))
+        self.app.show_scene(AddMusicScene)
 
     def _on_toggle_fullscreen(self) -> None:
         """Solicita ao controlador a alternância de modo de tela."""
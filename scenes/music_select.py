@@ -1,12 +1,30 @@
 """Cena de seleção de músicas do jogo."""
 
-import pygame
+import math
 import pathlib
 
+import pygame
+
 from .base import BaseScene
 from entities.Music import Music
+from models.MusicLibrary import MusicFolderWatcher
+from utils.asset_loader import shared_asset_loader
 from utils.buttons import Button, ButtonTheme
 from utils.constants import COLOR_BACKGROUND, COLOR_PRIMARY, COLOR_TEXT, COLOR_TEXT_MUTED, SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.fonts import get_font
+from utils.log import shared_log
+from utils.text_cache import render_text
+
+
+SONGS_DIR = pathlib.Path("musics")
+
+# Altura de cada linha da lista de músicas, em pixels
+LIST_ROW_HEIGHT = 50
+# Velocidade da rolagem suave (1/s): a distância até o alvo decai com exp(-taxa * dt)
+LIST_SCROLL_RATE = 14.0
+
+log = shared_log()
+
 
 class MusicSelectScene(BaseScene):
     """Cena com lista das músicas disponíveis e pré-visualização da música selecionada"""
@@ -14,17 +32,17 @@ class MusicSelectScene(BaseScene):
         """Configura fontes, tema e layout inicial do menu."""
         super().__init__()
         self.app = app
-        self.title_font = pygame.font.Font(None, 82)
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.button_font = pygame.font.Font(None, 42)
+        self.title_font = get_font(82)
+        self.subtitle_font = get_font(36)
+        self.button_font = get_font(42)
         self.theme = ButtonTheme(
             background=(42, 52, 71),
             background_hover=(70, 92, 141),
             border=(20, 28, 43),
             text=COLOR_TEXT,
         )
-        self.leaderboard_font = pygame.font.Font(None, 34)
-        self.leaderboard_small_font = pygame.font.Font(None, 26)
+        self.leaderboard_font = get_font(34)
+        self.leaderboard_small_font = get_font(26)
         self._song_panel_margin = 28
         self.leaderboard_entries: list = []
         self.player_best_entry = None
@@ -36,8 +54,54 @@ class MusicSelectScene(BaseScene):
 
         # Músicas válidas
         self.songs = self._load_songs()
+        self._songs_mtime = self._songs_dir_mtime()
         self.selected_index = 0
         self._refresh_song_stats()
+        self._stats_stale = False
+        # Lista virtualizada: só as linhas visíveis são desenhadas, cada uma em cache
+        self._list_scroll = 0.0
+        self._list_view_height = 0
+        self._row_cache: dict[int, tuple[tuple, pygame.Surface]] = {}
+        # Observador da pasta (--watch-musics); só roda enquanto a cena está ativa
+        self._watcher = MusicFolderWatcher(SONGS_DIR) if getattr(app, "watch_musics", False) else None
+
+    def on_enter(self) -> None:
+        """Ao voltar do cache, relê a pasta só se ela mudou e atualiza o placar."""
+        for button in self.buttons:
+            button.reset_hover()
+
+        if self._songs_dir_mtime() != self._songs_mtime:
+            self._reload_songs()
+
+        if self._stats_stale:
+            self._refresh_song_stats()
+            self._stats_stale = False
+
+        if self._watcher is not None:
+            self._watcher.start()
+
+    def on_exit(self) -> None:
+        # Uma partida (ou troca de jogador) pode mudar o leaderboard enquanto a cena está suspensa
+        self._stats_stale = True
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def _songs_dir_mtime(self) -> int:
+        """mtime da pasta ``musics``: muda quando uma música é adicionada ou removida."""
+        try:
+            return SONGS_DIR.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _reload_songs(self) -> None:
+        """Reindexa a biblioteca mantendo a música selecionada, se ela continuar lá."""
+        selected = self.songs[self.selected_index].title if self.songs else None
+        self._songs_mtime = self._songs_dir_mtime()
+        self.songs = self._load_songs()
+        titles = [song.title for song in self.songs]
+        self.selected_index = titles.index(selected) if selected in titles else 0
+        self._row_cache.clear()
+        self._stats_stale = True
 
     def _build_buttons(self) -> list[Button]:
         """Cria os botões com seus respectivos callbacks."""
@@ -67,31 +131,21 @@ class MusicSelectScene(BaseScene):
         
         self._layout_size = (width, height)
     
-    def _load_songs(self) -> list[dict]:
-        """Escaneia a pasta 'musics' por músicas válidas."""
-        print("Carregando músicas...")
-        songs_dir = pathlib.Path("musics")
-        song_list = []
-
-        # Itera pelas pastas em 'musics'
-        for song_folder in songs_dir.iterdir():
-            # Valida existência dos arquivos necessários
-            if song_folder.is_dir():
-                csv_file = list(song_folder.glob("*.csv"))
-                mp3_file = list(song_folder.glob("*.mp3"))
-
-                # Se ambos existirem e só um de cada, a música é válida
-                if len(csv_file) == 1 and len(mp3_file) == 1:
-                    song_data = Music(song_folder.name, csv_file[0], mp3_file[0])
-                    song_list.append(song_data) # Adiciona à lista de músicas válidas
-                    print(f"Música encontrada: {song_data.title}")
-                else:
-                    print(f"Pasta '{song_folder.name}' ignorada: requer 1 CSV e 1 MP3")
+    def _load_songs(self) -> list[Music]:
+        """Lista as músicas válidas de 'musics' pelo índice persistente.
+
+        Só as pastas novas ou alteradas desde a última visita são validadas de
+        novo (ver ``MusicLibrary.rescan``).
+        """
+        try:
+            song_list = self.app.models.music_library.rescan(SONGS_DIR)
+        except Exception as exc:  # noqa: BLE001
+            log.error("library", "rescan_failed", error=exc)
+            return []
 
         if len(song_list) == 0:
-            print("Nenhuma música válida encontrada!")
+            log.warning("library", "empty", root=SONGS_DIR)
 
-        # Retorna músicas válidas
         return song_list
 
     def _refresh_song_stats(self) -> None:
@@ -114,7 +168,7 @@ class MusicSelectScene(BaseScene):
             entries = play_model.leaderboard_for_music(music_name, limit=10)
             self.leaderboard_entries = [dict(row) for row in entries] if entries else []
         except Exception as exc:  # noqa: BLE001
-            print(f"Erro ao carregar leaderboard para '{music_name}': {exc}")
+            log.error("db", "leaderboard_failed", music=music_name, error=exc)
             self.leaderboard_entries = []
 
         player = getattr(self.app, "active_player", None)
@@ -124,13 +178,13 @@ class MusicSelectScene(BaseScene):
         try:
             player_id = int(player["id"])
         except (KeyError, TypeError, ValueError):
-            print("Jogador ativo inválido; não foi possível obter melhor partida.")
+            log.warning("db", "invalid_active_player", player=player)
             return
 
         try:
             best = play_model.best_for_player_and_music(player_id, music_name)
         except Exception as exc:  # noqa: BLE001
-            print(f"Erro ao carregar melhor partida do jogador: {exc}")
+            log.error("db", "best_play_failed", music=music_name, error=exc)
             best = None
 
         self.player_best_entry = dict(best) if best else None
@@ -147,22 +201,43 @@ class MusicSelectScene(BaseScene):
             pygame.mixer.music.play(loops = 0, start = 30.0, fade_ms = 500)
         
         except pygame.error as e:
-            print(f"Erro ao carregar o preview: {e}")
+            log.warning("music_select", "preview_failed", song=song.title, error=e)
+
+    def _select(self, index: int) -> None:
+        """Seleciona a música ``index`` (limitada à lista), tocando a prévia."""
+        if not self.songs:
+            return
+        index = min(max(index, 0), len(self.songs) - 1)
+        if index == self.selected_index:
+            return
+        self.selected_index = index
+        self._play_preview()
+        self._refresh_song_stats()
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        """Lida com a seleção (teclas cima/baixo) e confirmação (Enter)."""
+        """Lida com a seleção (setas, PgUp/PgDn, Home/End, roda do mouse) e confirmação (Enter)."""
         if event.type == pygame.KEYDOWN:
+            count = len(self.songs)
+            page = max(1, self._list_view_height // LIST_ROW_HEIGHT - 1)
             if event.key == pygame.K_DOWN:
-                if self.songs:
-                    self.selected_index = (self.selected_index + 1) % len(self.songs)
-                    self._play_preview()
-                    self._refresh_song_stats()
+                if count:
+                    self._select((self.selected_index + 1) % count)
             
             elif event.key == pygame.K_UP:
-                if self.songs:
-                    self.selected_index = (self.selected_index - 1) % len(self.songs)
-                    self._play_preview()
-                    self._refresh_song_stats()
+                if count:
+                    self._select((self.selected_index - 1) % count)
+
+            elif event.key == pygame.K_PAGEDOWN:
+                self._select(self.selected_index + page)
+
+            elif event.key == pygame.K_PAGEUP:
+                self._select(self.selected_index - page)
+
+            elif event.key == pygame.K_HOME:
+                self._select(0)
+
+            elif event.key == pygame.K_END:
+                self._select(count - 1)
             
             elif event.key == pygame.K_RETURN: # Tecla Enter
                 self._on_song_selected()
@@ -170,9 +245,24 @@ class MusicSelectScene(BaseScene):
             elif event.key == pygame.K_ESCAPE: # Voltar para o menu
                 self._on_home_selected()
 
+        elif event.type == pygame.MOUSEWHEEL:
+            self._select(self.selected_index - event.y)
+
 
     def update(self, dt: float) -> None:
-        pass
+        if self._watcher is not None and self._watcher.poll_changed():
+            self._reload_songs()
+            self._refresh_song_stats()
+            self._stats_stale = False
+
+        # Rolagem suave em direção à música selecionada
+        if self._list_view_height:
+            target = self._list_scroll_target()
+            gap = target - self._list_scroll
+            if abs(gap) < 0.5:
+                self._list_scroll = target
+            else:
+                self._list_scroll += gap * (1.0 - math.exp(-LIST_SCROLL_RATE * dt))
 
     def render(self, surface: pygame.Surface) -> None:
         """Renderiza layout da cena"""
@@ -228,8 +318,8 @@ class MusicSelectScene(BaseScene):
         max_width = width - margin * 2
 
         if not self.songs:
-            no_song_font = pygame.font.Font(None, int(self.title_font.get_height() * 0.75))
-            txt = no_song_font.render("Nenhuma música", True, COLOR_TEXT_MUTED)
+            no_song_font = get_font(int(self.title_font.get_height() * 0.75))
+            txt = render_text(no_song_font, "Nenhuma música", True, COLOR_TEXT_MUTED)
             surface.blit(txt, txt.get_rect(center=surface.get_rect().center))
             return
 
@@ -238,12 +328,12 @@ class MusicSelectScene(BaseScene):
         title_lines = self._wrap_text(song.title, self.title_font, max_width)
         y = margin
         for line in title_lines:
-            title_surface = self.title_font.render(line, True, COLOR_PRIMARY)
+            title_surface = render_text(self.title_font, line, True, COLOR_PRIMARY)
             surface.blit(title_surface, (margin, y))
             y += title_surface.get_height() + 6
         y += 10
 
-        header_surface = self.subtitle_font.render("Top 10 partidas", True, COLOR_TEXT)
+        header_surface = render_text(self.subtitle_font, "Top 10 partidas", True, COLOR_TEXT)
         surface.blit(header_surface, (margin, y))
         y += header_surface.get_height() + 12
 
@@ -274,7 +364,7 @@ class MusicSelectScene(BaseScene):
 
         if not self.leaderboard_entries:
             empty_message = self._truncate_text("Nenhuma partida registrada.", self.leaderboard_small_font, max_width)
-            empty_surface = self.leaderboard_small_font.render(empty_message, True, COLOR_TEXT_MUTED)
+            empty_surface = render_text(self.leaderboard_small_font, empty_message, True, COLOR_TEXT_MUTED)
             empty_y = min(best_area_top - empty_surface.get_height(), y)
             surface.blit(empty_surface, (margin, max(margin, empty_y)))
         else:
@@ -284,7 +374,7 @@ class MusicSelectScene(BaseScene):
                 line = f"{rank:>2}. {player_name} - {score} pts"
                 display_line = self._truncate_text(line, self.leaderboard_font, max_width)
                 color = COLOR_PRIMARY if rank == 1 else COLOR_TEXT
-                entry_surface = self.leaderboard_font.render(display_line, True, color)
+                entry_surface = render_text(self.leaderboard_font, display_line, True, color)
                 entry_height = entry_surface.get_height()
                 if y + entry_height > best_area_top - 10:
                     break
@@ -294,36 +384,77 @@ class MusicSelectScene(BaseScene):
         bottom_y = height - margin
         for text, color in reversed(best_lines):
             display_text = self._truncate_text(text, self.leaderboard_small_font, max_width)
-            text_surface = self.leaderboard_small_font.render(display_text, True, color)
+            text_surface = render_text(self.leaderboard_small_font, display_text, True, color)
             bottom_y -= text_surface.get_height()
             surface.blit(text_surface, (margin, bottom_y))
             bottom_y -= 6
 
+    def _list_scroll_target(self) -> float:
+        """Deslocamento que centraliza a música selecionada, preso às bordas da lista.
+
+        Listas que cabem no painel ficam centralizadas verticalmente (deslocamento negativo).
+        """
+        view_height = self._list_view_height
+        total_height = len(self.songs) * LIST_ROW_HEIGHT
+        if total_height <= view_height:
+            return (total_height - view_height) / 2
+        target = (self.selected_index + 0.5) * LIST_ROW_HEIGHT - view_height / 2
+        return min(max(target, 0.0), float(total_height - view_height))
+
+    def _row_surface(self, index: int, max_width: float) -> pygame.Surface:
+        """Texto da linha ``index``, refeito só quando título, seleção ou largura mudam."""
+        song = self.songs[index]
+        is_selected = (index == self.selected_index)
+        key = (song.title, is_selected, max_width)
+        cached = self._row_cache.get(index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        color = COLOR_PRIMARY if is_selected else COLOR_TEXT
+        prefix = "> " if is_selected else "  "
+
+        # Quebra o texto se necessário
+        full_text = prefix + song.title
+        lines = self._wrap_text(full_text, self.button_font, max_width)
+
+        # Renderiza apenas a primeira linha
+        text = lines[0] if lines else full_text
+        if len(lines) > 1:
+            text += "..."  # Indica que há mais texto
+
+        row = self.button_font.render(text, True, color)
+        self._row_cache[index] = (key, row)
+        return row
+
     def render_music_list(self, surface: pygame.Surface) -> None:
-        """Renderiza painel de seleção das músicas"""
-        line_height = 50
-        total_height = len(self.songs) * line_height
-        start_y = (surface.get_height() - total_height) // 2
-        max_width = surface.get_width() * 0.85  # 85% da largura
-
-        for index, song in enumerate(self.songs):
-            is_selected = (index == self.selected_index)
-            color = COLOR_PRIMARY if is_selected else COLOR_TEXT
-            prefix = "> " if is_selected else "  "
-            
-            # Quebra o texto se necessário
-            full_text = prefix + song.title
-            lines = self._wrap_text(full_text, self.button_font, max_width)
-            
-            # Renderiza apenas a primeira linha
-            text = lines[0] if lines else full_text
-            if len(lines) > 1:
-                text += "..."  # Indica que há mais texto
-            
-            txt_render = self.button_font.render(text, True, color)
-            pos_x = surface.get_width() * 0.1
-            pos_y = start_y + index * line_height
-            surface.blit(txt_render, (pos_x, pos_y))
+        """Renderiza painel de seleção das músicas.
+
+        Só as linhas dentro do painel são desenhadas, então o custo por frame
+        não depende do tamanho da biblioteca.
+        """
+        width, height = surface.get_size()
+        if height != self._list_view_height:
+            # Primeiro desenho ou janela redimensionada: posiciona sem animar
+            self._list_view_height = height
+            self._list_scroll = self._list_scroll_target()
+        if not self.songs:
+            return
+
+        scroll = self._list_scroll
+        first = max(0, int(scroll // LIST_ROW_HEIGHT))
+        last = min(len(self.songs), int((scroll + height) // LIST_ROW_HEIGHT) + 1)
+        max_width = width * 0.85  # 85% da largura
+        pos_x = width * 0.1
+
+        for index in range(first, last):
+            pos_y = round(index * LIST_ROW_HEIGHT - scroll)
+            surface.blit(self._row_surface(index, max_width), (pos_x, pos_y))
+
+        # Descarta as linhas que saíram da janela visível
+        if len(self._row_cache) > 2 * (last - first) + 8:
+            self._row_cache = {
+                index: entry for index, entry in self._row_cache.items() if first <= index < last
+            }
 
     def _truncate_text(self, text: str, font: pygame.font.Font, max_width: int) -> str:
         if font.size(text)[0] <= max_width:
@@ -349,13 +480,25 @@ class MusicSelectScene(BaseScene):
         song = self.songs[self.selected_index]
         
         from .gameplay import GameplayScene # importação tardia evitando importação circular
-        self.app.change_scene(GameplayScene(self.app, song))  # Passa dados da música
+        from .loading import LoadingScene
+
+        # Assets da partida carregam em segundo plano; a gameplay só entra com tudo residente
+        handles = GameplayScene.request_assets(shared_asset_loader(), song)
+        self.app.change_scene(
+            LoadingScene(
+                self.app,
+                handles,
+                lambda assets: GameplayScene(self.app, song, assets=assets),  # Passa dados da música
+                title=song.title,
+                back_scene=lambda: self,  # Retoma esta instância (suspensa no cache)
+            )
+        )
 
     def _on_home_selected(self) -> None:
         """Volta para o menu principal"""
         pygame.mixer.music.stop()
         from .menu import MenuScene
-        self.app.change_scene(MenuScene(self.app))
+        self.app.show_scene(MenuScene)
 
     def _on_add_music_selected(self) -> None:
         """Direciona para a tela de adição de músicas"""
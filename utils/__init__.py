@@ -1,6 +1,34 @@
 """Facilita acesso aos utilitários compartilhados."""
 
+from .asset_loader import AssetHandle, AssetLoader, shared_asset_loader
 from .buttons import Button, ButtonTheme
+from .fonts import FontRegistry, get_font, shared_fonts
+from .frame_profiler import NULL_SPAN, FrameProfiler
 from .input_field import InputField
+from .log import RingLog, shared_log
+from .note_sprites import NoteSpriteAtlas
+from .profile_capture import ProfileCapture
+from .static_layer import StaticLayer
+from .text_cache import TextCache, render_text, shared_text_cache
 
-__all__ = ["Button", "ButtonTheme", "InputField"]
+__all__ = [
+    "AssetHandle",
+    "AssetLoader",
+    "Button",
+    "ButtonTheme",
+    "FontRegistry",
+    "FrameProfiler",
+    "InputField",
+    "NULL_SPAN",
+    "NoteSpriteAtlas",
+    "ProfileCapture",
+    "RingLog",
+    "StaticLayer",
+    "TextCache",
+    "get_font",
+    "render_text",
+    "shared_asset_loader",
+    "shared_fonts",
+    "shared_log",
+    "shared_text_cache",
+]
@@ -0,0 +1,201 @@
+"""Carregamento de assets em threads de trabalho.
+
+Leitura de arquivo e decodificação (PNG, WAV, MP3, beatmap) rodam em um
+``ThreadPoolExecutor``; a conversão para o formato do display (``convert`` /
+``convert_alpha``), que exige a thread principal, acontece quando a cena consulta
+o handle com ``poll()``.
+"""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import pygame
+
+from .fonts import shared_fonts
+from .log import shared_log
+
+
+PathLike = Union[str, Path]
+
+
+class AssetHandle:
+    """Referência a um asset em carregamento.
+
+    ``poll()`` deve ser chamado pela thread principal: quando o trabalho da
+    thread auxiliar termina, aplica a finalização (``finalize``) uma única vez e
+    passa a devolver ``True``. Falhas ficam em ``error`` e ``value`` recebe o
+    ``fallback`` informado na criação.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        future: Future,
+        *,
+        finalize: Optional[Callable[[Any], Any]] = None,
+        fallback: Any = None,
+    ) -> None:
+        self.name = name
+        self._future = future
+        self._finalize = finalize
+        self._fallback = fallback
+        self._done = False
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def poll(self) -> bool:
+        """Finaliza o asset se a thread auxiliar já terminou; não bloqueia."""
+        if self._done:
+            return True
+        if not self._future.done():
+            return False
+        self._complete()
+        return True
+
+    def wait(self) -> Any:
+        """Bloqueia até o asset ficar pronto e devolve ``value``."""
+        if not self._done:
+            wait((self._future,))
+            self._complete()
+        return self.value
+
+    def _complete(self) -> None:
+        try:
+            value = self._future.result()
+            if self._finalize is not None:
+                value = self._finalize(value)
+            self.value = value
+        except Exception as exc:  # noqa: BLE001 - o erro é exposto em ``error``
+            shared_log().warning("assets", "load_failed", name=self.name, error=exc)
+            self.error = exc
+            self.value = self._fallback
+        self._done = True
+
+
+class AssetLoader:
+    """Despacha carregamentos para threads e mantém cache dos assets prontos.
+
+    Imagens são decodificadas (e redimensionadas, se pedido) na thread auxiliar;
+    sons são decodificados em ``pygame.mixer.Sound``; músicas são lidas para um
+    buffer em memória, de modo que ``pygame.mixer.music.load`` não toca o disco.
+    Pedidos repetidos do mesmo asset devolvem o mesmo handle.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assets")
+        self._handles: dict[tuple, AssetHandle] = {}
+
+    def image(
+        self,
+        path: PathLike,
+        *,
+        alpha: bool = False,
+        height: Optional[int] = None,
+        cache: bool = True,
+    ) -> AssetHandle:
+        """Carrega uma imagem; ``height`` redimensiona mantendo a proporção."""
+        path = Path(path)
+        key = ("image", str(path), alpha, height)
+
+        def finalize(surface: pygame.Surface) -> pygame.Surface:
+            return surface.convert_alpha() if alpha else surface.convert()
+
+        return self._submit(key, path.name, _decode_image, (path, height), finalize=finalize, cache=cache)
+
+    def sound(self, path: PathLike, *, cache: bool = True) -> AssetHandle:
+        """Decodifica um efeito sonoro inteiro para a memória."""
+        path = Path(path)
+        return self._submit(("sound", str(path)), path.name, _decode_sound, (path,), cache=cache)
+
+    def music(self, path: PathLike) -> AssetHandle:
+        """Lê o arquivo de música para um ``BytesIO`` aceito por ``mixer.music.load``."""
+        path = Path(path)
+        return self._submit(("music", str(path)), path.name, _read_bytes, (path,), cache=False)
+
+    def font(self, name: Optional[PathLike], size: int) -> AssetHandle:
+        """Abre uma fonte TTF (``None`` usa a fonte padrão do pygame)."""
+        key = ("font", None if name is None else str(name), size)
+        return self._submit(key, f"{name or 'default'}@{size}", _open_font, (name, size), cache=True)
+
+    def call(self, name: str, function: Callable[..., Any], *args: Any, fallback: Any = None) -> AssetHandle:
+        """Executa ``function(*args)`` em uma thread auxiliar (sem cache)."""
+        return self._submit(None, name, function, args, fallback=fallback, cache=False)
+
+    @staticmethod
+    def progress(handles: Iterable[AssetHandle]) -> float:
+        """Fração dos handles já finalizados (chama ``poll`` em cada um)."""
+        handles = list(handles)
+        if not handles:
+            return 1.0
+        finished = sum(1 for handle in handles if handle.poll())
+        return finished / len(handles)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(
+        self,
+        key: Optional[tuple],
+        name: str,
+        function: Callable[..., Any],
+        args: tuple,
+        *,
+        finalize: Optional[Callable[[Any], Any]] = None,
+        fallback: Any = None,
+        cache: bool,
+    ) -> AssetHandle:
+        if cache and key is not None:
+            cached = self._handles.get(key)
+            if cached is not None and not (cached.done and cached.error is not None):
+                return cached
+
+        handle = AssetHandle(name, self._executor.submit(function, *args), finalize=finalize, fallback=fallback)
+        if cache and key is not None:
+            self._handles[key] = handle
+        return handle
+
+
+def _decode_image(path: Path, height: Optional[int]) -> pygame.Surface:
+    image = pygame.image.load(str(path))
+    if height is None or image.get_height() <= 0:
+        return image
+    if image.get_bitsize() < 24:
+        # smoothscale só aceita 24/32 bits; a cópia não depende do display
+        expanded = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        expanded.blit(image, (0, 0))
+        image = expanded
+    width = max(1, int(image.get_width() * height / image.get_height()))
+    return pygame.transform.smoothscale(image, (width, max(1, height)))
+
+
+def _decode_sound(path: Path) -> pygame.mixer.Sound:
+    if not pygame.mixer.get_init():
+        raise pygame.error("mixer não inicializado")
+    return pygame.mixer.Sound(str(path))
+
+
+def _open_font(name: Optional[PathLike], size: int) -> pygame.font.Font:
+    return shared_fonts().get(name, size)
+
+
+def _read_bytes(path: Path) -> io.BytesIO:
+    return io.BytesIO(path.read_bytes())
+
+
+_shared_loader: Optional[AssetLoader] = None
+
+
+def shared_asset_loader() -> AssetLoader:
+    """Loader do processo, compartilhado entre as cenas."""
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = AssetLoader()
+    return _shared_loader
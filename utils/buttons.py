@@ -11,6 +11,7 @@ from .constants import (
     COLOR_BUTTON_BORDER,
     COLOR_TEXT,
 )
+from .text_cache import render_text
 
 
 _CLICK_SOUND: pygame.mixer.Sound | None = None
@@ -93,6 +94,10 @@ class Button:
         self.theme = theme
         self._is_hovered = False
 
+    def reset_hover(self) -> None:
+        """Esquece o hover (ex.: cena retomada do cache); o próximo movimento o recalcula."""
+        self._is_hovered = False
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """Processa eventos de mouse para interação com o botão."""
         if event.type == pygame.MOUSEMOTION:
@@ -111,6 +116,6 @@ class Button:
         pygame.draw.rect(surface, background, self.rect, border_radius=8)
         pygame.draw.rect(surface, self.theme.border, self.rect, width=2, border_radius=8)
 
-        text_surface = self.font.render(self.label, True, self.theme.text)
+        text_surface = render_text(self.font, self.label, True, self.theme.text)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
@@ -16,6 +16,7 @@ COLOR_GREEN_NOTE = (77, 228, 127)
 COLOR_YELLOW_NOTE = (224, 208, 77)
 COLOR_GOOD_HIT = (173, 252, 255)
 COLOR_PERFECT_HIT = (255, 250, 148)
+COLOR_BAD_HIT = (255, 205, 148)
 COLOR_MISS = (255, 148, 148)
 
 SCREEN_WIDTH = 800
@@ -0,0 +1,79 @@
+"""Registro de fontes compartilhado pelo processo."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Optional, Union
+
+import pygame
+
+
+PathLike = Union[str, os.PathLike]
+
+
+class FontRegistry:
+    """Abre cada fonte uma única vez por ``(face, tamanho)`` e a entrega às cenas.
+
+    ``face=None`` é a fonte padrão do pygame. Um ``Font`` não guarda estado de
+    desenho, então a mesma instância serve a todas as cenas. A abertura fica sob
+    um lock porque o ``AssetLoader`` também pede fontes de threads auxiliares.
+
+    As fontes deixam de valer com ``pygame.quit()``; quem encerra o pygame chama
+    ``clear`` antes.
+    """
+
+    def __init__(self) -> None:
+        self._fonts: dict[tuple[Optional[str], int], pygame.font.Font] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.opened = 0
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    @property
+    def resident(self) -> int:
+        """Quantidade de fontes abertas no momento."""
+        return len(self._fonts)
+
+    def get(self, face: Optional[PathLike], size: int) -> pygame.font.Font:
+        key = (None if face is None else str(face), int(size))
+        self.requests += 1
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()
+                font = self._fonts[key] = pygame.font.Font(key[0], key[1])
+                self.opened += 1
+        return font
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fonts.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"resident": len(self._fonts), "requests": self.requests, "opened": self.opened}
+
+    def report(self) -> str:
+        return f"Fontes: {len(self._fonts)} residentes, {self.opened} aberturas para {self.requests} pedidos"
+
+
+_shared_fonts: Optional[FontRegistry] = None
+
+
+def shared_fonts() -> FontRegistry:
+    """Registro do processo, compartilhado entre as cenas e o ``AssetLoader``."""
+    global _shared_fonts
+    if _shared_fonts is None:
+        _shared_fonts = FontRegistry()
+    return _shared_fonts
+
+
+def get_font(size: int, face: Optional[PathLike] = None) -> pygame.font.Font:
+    """Atalho para ``shared_fonts().get(face, size)``."""
+    return shared_fonts().get(face, size)
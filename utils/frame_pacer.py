@@ -0,0 +1,129 @@
+"""Cadência de frames com alvo selecionável e medição de jitter."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+
+# Alvos oferecidos ao jogador; 0 = sem limite (ou limitado pelo VSync)
+FRAME_RATE_TARGETS = (60, 120, 144, 240, 0)
+# Abaixo desta folga o ``sleep`` do sistema não é confiável: o resto é espera ativa
+SPIN_THRESHOLD = 0.002
+
+
+def target_label(target: int) -> str:
+    return f"{target} FPS" if target else "sem limite"
+
+
+class FramePacer:
+    """Mantém os frames espaçados em ``1 / target`` segundos com precisão sub-ms.
+
+    ``Clock.tick`` dorme com ``SDL_Delay`` e costuma passar alguns milissegundos
+    do ponto no Linux. Aqui cada frame tem um prazo absoluto no
+    ``perf_counter``: ``tick`` dorme até ``spin_threshold`` antes dele e cobre o
+    resto em espera ativa, como ``tick_busy_loop``, mas sem arredondar para ms.
+    Prazos são encadeados (sem deriva acumulada); depois de uma travada maior que
+    um frame o prazo é reancorado, em vez de emendar frames para recuperar.
+
+    Os intervalos reais entre ``tick`` ficam nas últimas ``window`` amostras,
+    de onde saem FPS médio, percentis e jitter (desvio padrão do intervalo).
+    """
+
+    def __init__(
+        self,
+        target: int = 60,
+        *,
+        spin_threshold: float = SPIN_THRESHOLD,
+        window: int = 600,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.spin_threshold = spin_threshold
+        self._clock = clock
+        self._sleep = sleep
+        self.intervals: deque = deque(maxlen=window)
+        self._last: Optional[float] = None
+        self._deadline = 0.0
+        self.late_frames = 0
+        self.target = target
+
+    @property
+    def target(self) -> int:
+        return self._target
+
+    @target.setter
+    def target(self, value: int) -> None:
+        self._target = max(0, int(value))
+        self.period = 1.0 / self._target if self._target else 0.0
+        self.intervals.clear()
+        self.late_frames = 0
+        self._deadline = self._clock() + self.period
+
+    def cycle_target(self, targets: Iterable[int] = FRAME_RATE_TARGETS) -> int:
+        """Passa para o próximo alvo da lista (voltando ao primeiro no fim)."""
+        targets = tuple(targets)
+        try:
+            index = targets.index(self._target) + 1
+        except ValueError:
+            index = 0
+        self.target = targets[index % len(targets)]
+        return self.target
+
+    def tick(self) -> float:
+        """Espera o prazo do frame e devolve o intervalo real desde o último ``tick``."""
+        clock = self._clock
+        if self.period:
+            deadline = self._deadline
+            remaining = deadline - clock()
+            if remaining > self.spin_threshold:
+                self._sleep(remaining - self.spin_threshold)
+            while clock() < deadline:
+                pass
+            now = clock()
+            if now - deadline > self.period:
+                # Frame atrasado em mais de um período: reancora no instante atual
+                if self._last is not None:
+                    self.late_frames += 1
+                self._deadline = now + self.period
+            else:
+                self._deadline = deadline + self.period
+        else:
+            now = clock()
+
+        last = self._last
+        self._last = now
+        if last is None:
+            return self.period
+        interval = now - last
+        self.intervals.append(interval)
+        return interval
+
+    def stats(self) -> dict[str, float]:
+        """FPS médio, p50/p99/máximo do intervalo e jitter (ms)."""
+        samples = self.intervals
+        if not samples:
+            return {}
+        count = len(samples)
+        mean = sum(samples) / count
+        ordered = sorted(samples)
+        last = count - 1
+        variance = sum((value - mean) ** 2 for value in samples) / count
+        return {
+            "fps": 1.0 / mean if mean else 0.0,
+            "p50_ms": ordered[min(last, int(count * 0.50))] * 1000.0,
+            "p99_ms": ordered[min(last, int(count * 0.99))] * 1000.0,
+            "max_ms": ordered[last] * 1000.0,
+            "jitter_ms": variance ** 0.5 * 1000.0,
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        if not stats:
+            return f"Cadência: alvo {target_label(self._target)}, sem amostras"
+        return (
+            f"Cadência: alvo {target_label(self._target)}, {stats['fps']:.1f} FPS médios, "
+            f"intervalo p50 {stats['p50_ms']:.2f} ms / p99 {stats['p99_ms']:.2f} ms / máx {stats['max_ms']:.2f} ms, "
+            f"jitter {stats['jitter_ms']:.3f} ms, {self.late_frames} frames atrasados"
+        )
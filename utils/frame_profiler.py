@@ -0,0 +1,170 @@
+"""Medição do tempo de cada fase do frame, com overlay opcional na tela."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Iterable, Optional
+
+import pygame
+
+from .fonts import get_font
+
+
+# Devolvido por ``span`` quando a medição está desligada: custo de um ``with`` vazio
+NULL_SPAN: ContextManager[None] = nullcontext()
+
+_COLUMNS = ("p50", "p95", "p99", "max")
+
+
+class _Span:
+    """Trecho medido; uma instância por nome, reaproveitada a cada frame."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = self._profiler._clock()
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.add(self._name, self._profiler._clock() - self._start)
+
+
+class FrameProfiler:
+    """Histogramas móveis do tempo gasto por frame em cada trecho nomeado.
+
+    ``span(name)`` mede um trecho; chamadas repetidas no mesmo frame (vários
+    ticks de ``update``, redesenhos por região) são somadas. ``end_frame`` fecha o
+    frame e guarda o total de cada trecho nas últimas ``window`` amostras, das
+    quais saem p50/p95/p99/máximo. Desligado, ``span`` devolve ``NULL_SPAN``.
+
+    ``phases`` são os trechos de primeiro nível, que não se sobrepõem (eventos,
+    update, render...): aparecem primeiro, nessa ordem, e sua soma vira a linha
+    ``frame``. Os demais trechos (subtrechos das cenas) vêm depois.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        phases: Iterable[str] = (),
+        window: int = 600,
+        refresh_interval: float = 0.5,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.enabled = enabled
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._spans: dict[str, _Span] = {}
+        self._samples: dict[str, deque] = {}
+        self._current: dict[str, float] = {}
+        self.phases = tuple(phases)
+        if self.phases:
+            self._samples["frame"] = deque(maxlen=window)
+        for name in self.phases:
+            self._spans[name] = _Span(self, name)
+            self._samples[name] = deque(maxlen=window)
+        self.frames = 0
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_built_at = float("-inf")
+        self._font: Optional[pygame.font.Font] = None
+
+    def span(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+            self._samples[name] = deque(maxlen=self.window)
+        return span
+
+    def add(self, name: str, seconds: float) -> None:
+        """Soma ``seconds`` ao trecho ``name`` no frame atual."""
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def end_frame(self) -> None:
+        """Registra o frame; trechos que não rodaram contam como zero."""
+        if not self.enabled:
+            return
+        current = self._current
+        if self.phases:
+            current["frame"] = sum(current.get(name, 0.0) for name in self.phases)
+        for name, samples in self._samples.items():
+            samples.append(current.get(name, 0.0))
+        current.clear()
+        self.frames += 1
+
+    def reset(self) -> None:
+        for samples in self._samples.values():
+            samples.clear()
+        self._current.clear()
+        self.frames = 0
+        self._overlay = None
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """p50/p95/p99/máximo (ms) de cada trecho, na ordem em que apareceram."""
+        result = {}
+        for name, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            result[name] = {
+                "p50": ordered[min(last, int(len(ordered) * 0.50))] * 1000.0,
+                "p95": ordered[min(last, int(len(ordered) * 0.95))] * 1000.0,
+                "p99": ordered[min(last, int(len(ordered) * 0.99))] * 1000.0,
+                "max": ordered[last] * 1000.0,
+            }
+        return result
+
+    def report(self) -> str:
+        """Tabela em texto com as estatísticas atuais."""
+        lines = [f"Frame stats ({self.frames} frames, janela de {self.window}) — ms"]
+        lines.append(f"{'trecho':<18}" + "".join(f"{column:>9}" for column in _COLUMNS))
+        for name, values in self.stats().items():
+            lines.append(f"{name:<18}" + "".join(f"{values[column]:>9.3f}" for column in _COLUMNS))
+        return "\n".join(lines)
+
+    def overlay(self) -> pygame.Surface:
+        """Superfície opaca com a tabela; refeita no máximo a cada ``refresh_interval``.
+
+        Ser opaca permite redesenhá-la sobre o frame anterior no modo dirty-rect.
+        """
+        now = self._clock()
+        if self._overlay is not None and now - self._overlay_built_at < self.refresh_interval:
+            return self._overlay
+        if self._font is None:
+            self._font = get_font(20)
+        font = self._font
+
+        stats = self.stats()
+        line_height = font.get_linesize()
+        name_width = max([font.size(name)[0] for name in stats] + [font.size("trecho (ms)")[0]]) + 12
+        column_width = 58
+        width = name_width + column_width * len(_COLUMNS) + 12
+        height = line_height * (len(stats) + 1) + 10
+
+        surface = pygame.Surface((width, height))
+        surface.fill((12, 12, 16))
+        pygame.draw.rect(surface, (70, 70, 80), surface.get_rect(), width=1)
+
+        def draw_row(y: int, label: str, values: list[str], color: tuple[int, int, int]) -> None:
+            surface.blit(font.render(label, True, color), (6, y))
+            for index, value in enumerate(values):
+                text = font.render(value, True, color)
+                right = name_width + column_width * (index + 1)
+                surface.blit(text, (right - text.get_width(), y))
+
+        draw_row(5, "trecho (ms)", list(_COLUMNS), (160, 160, 168))
+        for row, (name, values) in enumerate(stats.items(), start=1):
+            draw_row(5 + row * line_height, name, [f"{values[column]:.2f}" for column in _COLUMNS], (240, 240, 245))
+
+        self._overlay = surface
+        self._overlay_built_at = now
+        return surface
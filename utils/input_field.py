@@ -11,6 +11,7 @@ from .constants import (
     COLOR_TEXT,
     COLOR_TEXT_MUTED,
 )
+from .text_cache import render_text
 
 
 class InputField:
@@ -137,7 +138,7 @@ class InputField:
 
     def draw(self, surface: pygame.Surface) -> None:
         """Renderiza o campo, incluindo rótulo e texto."""
-        label_surface = self.label_font.render(self.label, True, COLOR_TEXT)
+        label_surface = render_text(self.label_font, self.label, True, COLOR_TEXT)
         label_rect = label_surface.get_rect()
         label_rect.left = self.rect.left
         label_rect.bottom = self.rect.top - 8
@@ -160,7 +161,7 @@ class InputField:
             display_text = self.placeholder
             text_color = COLOR_TEXT_MUTED
 
-        text_surface = self.font.render(display_text, True, text_color)
+        text_surface = render_text(self.font, display_text, True, text_color)
         text_rect = text_surface.get_rect()
         text_rect.left = self.rect.left + 12
         text_rect.centery = self.rect.centery
@@ -0,0 +1,185 @@
+"""Log estruturado e não bloqueante para o loop do jogo.
+
+Quem registra só empilha uma tupla ``(instante, categoria, nível, evento,
+campos)`` em um buffer circular (``deque`` com ``maxlen``; ``append`` e
+``popleft`` são atômicos no CPython, então o produtor não usa lock). A
+formatação e a escrita no terminal acontecem em uma thread auxiliar, de modo
+que um stdout lento nunca trava um frame. Registros abaixo do nível da
+categoria são descartados antes de qualquer alocação além dos argumentos.
+
+Níveis por categoria vêm de ``ENGRENADA_LOG``, por exemplo
+``ENGRENADA_LOG="judge=debug,timeline=off"`` ou ``ENGRENADA_LOG=debug``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional, TextIO
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100  # Acima de todos os níveis: silencia a categoria
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+_LEVELS_BY_NAME = {name.lower(): level for level, name in LEVEL_NAMES.items()}
+_LEVELS_BY_NAME["off"] = OFF
+
+LOG_ENV = "ENGRENADA_LOG"
+
+
+class RingLog:
+    """Buffer circular de registros esvaziado por uma thread auxiliar.
+
+    Com o buffer cheio (terminal muito lento ou rajada de eventos), os
+    registros mais antigos são sobrescritos e contados em ``dropped``.
+    ``stream=None`` escreve no ``sys.stdout`` vigente no momento da escrita.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 8192,
+        *,
+        level: int = INFO,
+        levels: Optional[dict[str, int]] = None,
+        stream: Optional[TextIO] = None,
+        flush_interval: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.capacity = capacity
+        self.level = level
+        self._levels: dict[str, int] = dict(levels or {})
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._records: deque = deque(maxlen=capacity)
+        self.dropped = 0
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Níveis
+    # ------------------------------------------------------------------
+    def set_level(self, level: int, category: Optional[str] = None) -> None:
+        """Define o nível padrão ou, com ``category``, o de uma categoria."""
+        if category is None:
+            self.level = level
+        else:
+            self._levels[category] = level
+
+    def configure(self, spec: str) -> None:
+        """Aplica uma especificação como ``"info"`` ou ``"judge=debug,timeline=warning"``."""
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            category, _, name = item.rpartition("=")
+            level = _LEVELS_BY_NAME.get(name.strip().lower())
+            if level is None:
+                continue
+            self.set_level(level, category.strip() or None)
+
+    def enabled_for(self, category: str, level: int) -> bool:
+        return level >= self._levels.get(category, self.level)
+
+    # ------------------------------------------------------------------
+    # Registro (thread do jogo)
+    # ------------------------------------------------------------------
+    def log(self, category: str, level: int, event: str, **fields: Any) -> None:
+        if level < self._levels.get(category, self.level):
+            return
+        records = self._records
+        if len(records) == self.capacity:
+            self.dropped += 1
+        records.append((self._clock(), category, level, event, fields))
+        if self._thread is None:
+            self._start()
+
+    def debug(self, category: str, event: str, **fields: Any) -> None:
+        self.log(category, DEBUG, event, **fields)
+
+    def info(self, category: str, event: str, **fields: Any) -> None:
+        self.log(category, INFO, event, **fields)
+
+    def warning(self, category: str, event: str, **fields: Any) -> None:
+        self.log(category, WARNING, event, **fields)
+
+    def error(self, category: str, event: str, **fields: Any) -> None:
+        self.log(category, ERROR, event, **fields)
+
+    # ------------------------------------------------------------------
+    # Escrita (thread auxiliar)
+    # ------------------------------------------------------------------
+    def flush(self) -> int:
+        """Formata e escreve os registros pendentes; devolve quantos saíram."""
+        with self._flush_lock:
+            records = self._records
+            lines = []
+            while True:
+                try:
+                    record = records.popleft()
+                except IndexError:
+                    break
+                lines.append(format_record(record))
+            if not lines:
+                return 0
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except (OSError, ValueError):
+                pass  # Terminal fechado: os registros são descartados
+            return len(lines)
+
+    def close(self) -> None:
+        """Para a thread auxiliar e escreve o que restou."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self.flush()
+
+    def _start(self) -> None:
+        # Threads do AssetLoader também registram: só a primeira cria a thread de escrita
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(target=self._run, name="log-flush", daemon=True)
+            thread.start()
+            self._thread = thread
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+def format_record(record: tuple) -> str:
+    """``HH:MM:SS.mmm NÍVEL [categoria] evento campo=valor ...``"""
+    created, category, level, event, fields = record
+    stamp = time.strftime("%H:%M:%S", time.localtime(created)) + f".{int(created * 1000) % 1000:03d}"
+    parts = [stamp, f"{LEVEL_NAMES.get(level, level):<7}", f"[{category}]", event]
+    parts.extend(
+        f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}" for key, value in fields.items()
+    )
+    return " ".join(parts)
+
+
+_shared_log: Optional[RingLog] = None
+
+
+def shared_log() -> RingLog:
+    """Log do processo, configurado por ``ENGRENADA_LOG`` e esvaziado na saída."""
+    global _shared_log
+    if _shared_log is None:
+        _shared_log = RingLog()
+        _shared_log.configure(os.environ.get(LOG_ENV, ""))
+        atexit.register(_shared_log.close)
+    return _shared_log
@@ -0,0 +1,53 @@
+"""Atlas de sprites pré-renderizados para as notas da gameplay."""
+
+from __future__ import annotations
+
+import pygame
+
+
+class NoteSpriteAtlas:
+    """Guarda uma superfície por tipo de nota, reconstruída só quando necessário.
+
+    Cada sprite é desenhado uma vez (círculo preenchido + contorno) e o fade é
+    aplicado com ``set_alpha`` na superfície em cache, de modo que desenhar uma
+    nota custa apenas um ``blit``.
+    """
+
+    def __init__(self, colors: dict[str, tuple[int, int, int]], fallback_type: str) -> None:
+        self._colors = dict(colors)
+        self._fallback_type = fallback_type
+        self._sprites: dict[str, pygame.Surface] = {}
+        self._radius: int | None = None
+        self._resolution: tuple[int, int] | None = None
+        self.rebuilds = 0
+
+    @property
+    def radius(self) -> int | None:
+        return self._radius
+
+    def ensure(self, radius: int, resolution: tuple[int, int]) -> None:
+        """Reconstrói o atlas se o raio ou a resolução mudaram."""
+        if radius == self._radius and resolution == self._resolution and self._sprites:
+            return
+        self._radius = radius
+        self._resolution = resolution
+        self._sprites = {
+            note_type: self._build_sprite(color, radius)
+            for note_type, color in self._colors.items()
+        }
+        self.rebuilds += 1
+
+    def sprite(self, note_type: str, alpha: float = 255) -> pygame.Surface:
+        """Retorna o sprite do tipo informado já com a opacidade aplicada."""
+        sprite = self._sprites.get(note_type) or self._sprites[self._fallback_type]
+        sprite.set_alpha(max(0, min(255, int(alpha))))
+        return sprite
+
+    def _build_sprite(self, color: tuple[int, int, int], radius: int) -> pygame.Surface:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, 255), (radius, radius), radius)
+        outline_width = max(1, radius // 8)
+        pygame.draw.circle(surface, (0, 0, 0, 255), (radius, radius), radius, outline_width)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
@@ -0,0 +1,113 @@
+"""Captura sob demanda de um trecho da execução com ``cProfile``."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from .log import shared_log
+
+
+PROFILES_DIR = Path(__file__).resolve().parents[1] / "profiles"
+# "1" arma a captura; um número maior também define quantos frames cada captura cobre
+PROFILE_ENV = "ENGRENADA_PROFILE"
+
+
+class ProfileCapture:
+    """Liga o ``cProfile`` apenas durante uma janela de frames.
+
+    ``start``/``stop`` (ou ``toggle``, ligado a uma tecla) delimitam a captura;
+    com ``frames``, ``end_frame`` a encerra sozinha depois desse número de
+    frames. Cada captura gera ``<pasta>/<data>-<rótulo>.prof`` (abra com
+    ``pstats`` ou ``snakeviz``) e um ``.txt`` com as funções de maior tempo
+    acumulado.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = PROFILES_DIR,
+        *,
+        frames: Optional[int] = None,
+        top: int = 40,
+    ) -> None:
+        self.directory = Path(directory)
+        self.frames = frames
+        self.top = top
+        self._profile: Optional[cProfile.Profile] = None
+        self._label = ""
+        self._captured_frames = 0
+        self.last_path: Optional[Path] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["ProfileCapture"]:
+        """Instância configurada por ``ENGRENADA_PROFILE`` (``None`` se ausente ou ``0``)."""
+        value = os.environ.get(PROFILE_ENV, "").strip()
+        if not value or value == "0":
+            return None
+        try:
+            frames = int(value)
+        except ValueError:
+            frames = None
+        return cls(frames=frames if frames and frames > 1 else None)
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def start(self, label: str = "capture") -> None:
+        if self._profile is not None:
+            return
+        self._label = label
+        self._captured_frames = 0
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        shared_log().info("profile", "capture_started", label=label, frames=self.frames or "manual")
+
+    def stop(self) -> Optional[Path]:
+        """Encerra a captura e grava os arquivos; devolve o caminho do ``.prof``."""
+        profile = self._profile
+        if profile is None:
+            return None
+        profile.disable()
+        self._profile = None
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.directory / f"{stamp}-{self._label}.prof"
+        suffix = 1
+        while path.exists():  # Duas capturas no mesmo segundo
+            suffix += 1
+            path = self.directory / f"{stamp}-{self._label}-{suffix}.prof"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(path))
+            summary = io.StringIO()
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            path.with_suffix(".txt").write_text(
+                f"{self._captured_frames} frames capturados\n{summary.getvalue()}", encoding="utf-8"
+            )
+        except OSError as exc:
+            shared_log().error("profile", "capture_write_failed", error=exc)
+            return None
+        self.last_path = path
+        shared_log().info("profile", "capture_saved", frames=self._captured_frames, path=path)
+        return path
+
+    def toggle(self, label: str = "capture") -> None:
+        if self.active:
+            self.stop()
+        else:
+            self.start(label)
+
+    def end_frame(self) -> None:
+        """Conta um frame capturado; encerra a captura ao completar ``frames``."""
+        if self._profile is None:
+            return
+        self._captured_frames += 1
+        if self.frames is not None and self._captured_frames >= self.frames:
+            self.stop()
@@ -0,0 +1,43 @@
+"""Camada estática pré-composta, reconstruída apenas quando a geometria muda."""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable, Optional
+
+import pygame
+
+
+class StaticLayer:
+    """Guarda em uma superfície opaca tudo que não muda entre frames.
+
+    ``build(surface)`` desenha a camada completa; ela só é chamada quando o
+    tamanho da tela ou ``key`` (qualquer valor comparável que descreva a
+    geometria, como posição da lane) mudam. Cada frame custa um único ``blit``.
+    """
+
+    def __init__(self, build: Callable[[pygame.Surface], None]) -> None:
+        self._build = build
+        self._surface: Optional[pygame.Surface] = None
+        self._signature: Optional[tuple] = None
+        self.rebuilds = 0
+
+    def surface(self, size: tuple[int, int], key: Hashable = ()) -> pygame.Surface:
+        """Devolve a camada para ``size``, reconstruindo-a se necessário."""
+        signature = (size, key)
+        if self._surface is None or signature != self._signature:
+            layer = pygame.Surface(size)
+            self._build(layer)
+            # Mesmo formato do display: o blit por frame vira uma cópia direta
+            self._surface = layer.convert() if pygame.display.get_surface() is not None else layer
+            self._signature = signature
+            self.rebuilds += 1
+        return self._surface
+
+    def blit(self, target: pygame.Surface, key: Hashable = ()) -> None:
+        """Copia a camada para ``target`` (respeita o clip atual de ``target``)."""
+        target.blit(self.surface(target.get_size(), key), (0, 0))
+
+    def invalidate(self) -> None:
+        """Descarta a camada; a próxima chamada a ``surface`` a reconstrói."""
+        self._surface = None
+        self._signature = None
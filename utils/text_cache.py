@@ -0,0 +1,112 @@
+"""Cache LRU de textos já rasterizados, limitado por memória."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+import pygame
+
+
+# Orçamento padrão: ~8 MiB de superfícies de texto residentes
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class TextCache:
+    """Guarda o resultado de ``font.render`` por ``(fonte, texto, cor, antialias)``.
+
+    As mesmas strings são desenhadas a cada frame (rótulos de botões, títulos,
+    contadores que mudam poucas vezes por segundo); com o cache, só a primeira
+    ocorrência paga a rasterização. O limite é em bytes das superfícies, não em
+    número de entradas, pois um título grande ocupa o mesmo que dezenas de
+    rótulos. Ao passar de ``max_bytes``, saem as entradas usadas há mais tempo.
+
+    A superfície devolvida é compartilhada: não altere (``set_alpha``, ``fill``)
+    o resultado; para isso use ``font.render`` diretamente ou uma cópia.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color: Sequence[int],
+    ) -> pygame.Surface:
+        """Mesmos argumentos de ``font.render`` (sem fundo), com a fonte na frente."""
+        if type(color) is not tuple:
+            color = tuple(color)  # pygame.Color não serve de chave
+        key = (font, text, color, antialias)
+        entries = self._entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.max_bytes:
+            return surface
+        entries[key] = surface
+        self._sizes[key] = size
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            old_key, _ = entries.popitem(last=False)
+            self.bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def report(self) -> str:
+        return (
+            f"Textos: {len(self._entries)} em cache ({self.bytes / 1024:.0f} KiB de {self.max_bytes / 1024:.0f} KiB), "
+            f"{self.hit_rate:.1%} de acertos em {self.hits + self.misses} pedidos, {self.evictions} descartes"
+        )
+
+
+_shared_text_cache: Optional[TextCache] = None
+
+
+def shared_text_cache() -> TextCache:
+    """Cache do processo, usado pelos widgets e pelas cenas."""
+    global _shared_text_cache
+    if _shared_text_cache is None:
+        _shared_text_cache = TextCache()
+    return _shared_text_cache
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color: Sequence[int]) -> pygame.Surface:
+    """Atalho para ``shared_text_cache().render(...)``; não altere o resultado."""
+    return shared_text_cache().render(font, text, antialias, color)